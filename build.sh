@@ -18,8 +18,8 @@ ARGS=$*
 # script, and that this script resides in the repo dir!
 REPODIR=$(cd $(dirname $0); pwd)
 
-VALIDARGS="clean libcuspatial cuspatial -v -g -n -h --show_depr_warn"
-HELP="$0 [clean] [libcuspatial] [cuspatial] [-v] [-g] [-n] [-h] [--show_depr_warn]
+VALIDARGS="clean libcuspatial cuspatial -v -g -n -h --show_depr_warn --no_gdal"
+HELP="$0 [clean] [libcuspatial] [cuspatial] [-v] [-g] [-n] [-h] [--show_depr_warn] [--no_gdal]
    clean            - remove all existing build artifacts and configuration (start
                       over)
    libcuspatial     - build the libcuspatial C++ code only
@@ -29,6 +29,8 @@ HELP="$0 [clean] [libcuspatial] [cuspatial] [-v] [-g] [-n] [-h] [--show_depr_war
    -n               - no install step
    -h               - print this text
    --show_depr_warn - show cmake deprecation warnings
+   --no_gdal        - build libcuspatial without the GDAL based shapefile
+                      reader, so it does not link GDAL
    default action (no args) is to build and install 'libcuspatial' then
    'cuspatial' targets
 "
@@ -41,6 +43,7 @@ VERBOSE=""
 BUILD_TYPE=Release
 INSTALL_TARGET=install
 BUILD_DISABLE_DEPRECATION_WARNING=ON
+BUILD_SHAPEFILE_READER=ON
 
 # Set defaults for vars that may not have been defined externally
 #  FIXME: if INSTALL_PREFIX is not set, check PREFIX, then check
@@ -80,6 +83,9 @@ fi
 if hasArg --show-_depr_warn; then
     BUILD_DISABLE_DEPRECATION_WARNING=OFF
 fi
+if hasArg --no_gdal; then
+    BUILD_SHAPEFILE_READER=OFF
+fi
 
 # If clean given, run it prior to any other steps
 if hasArg clean; then
@@ -104,6 +110,7 @@ if (( ${NUMARGS} == 0 )) || hasArg libcuspatial; then
     cmake -DCMAKE_INSTALL_PREFIX=${INSTALL_PREFIX} \
           -DCMAKE_CXX11_ABI=ON \
           -DDISABLE_DEPRECATION_WARN=${BUILD_DISABLE_DEPRECATION_WARNING} \
+          -DBUILD_SHAPEFILE_READER=${BUILD_SHAPEFILE_READER} \
           -DCMAKE_BUILD_TYPE=${BUILD_TYPE} ..
     make -j ${PARALLEL_LEVEL} install VERBOSE=${VERBOSE}
 fi
@@ -0,0 +1,113 @@
+/*
+ * Copyright (c) 2020, NVIDIA CORPORATION.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include <algorithm>
+#include <vector>
+
+#include <benchmark/benchmark.h>
+#include <thrust/iterator/counting_iterator.h>
+#include <thrust/random.h>
+#include <thrust/sequence.h>
+#include <thrust/transform.h>
+#include <rmm/thrust_rmm_allocator.h>
+
+#include <cudf/column/column_view.hpp>
+#include <cudf/table/table_view.hpp>
+#include <cudf/utilities/type_dispatcher.hpp>
+#include <cuspatial/cubic_spline.hpp>
+
+// Knots of all splines together are capped at this count so that the longest
+// splines still fit in device memory; shorter splines use up to kMaxSplines.
+constexpr int64_t kMaxKnots{1 << 26};
+constexpr int32_t kMaxSplines{1 << 20};
+constexpr int32_t kNumQueries{1 << 22};
+
+template <typename T>
+cudf::column_view make_view(rmm::device_vector<T> const& v) {
+  return cudf::column_view(cudf::data_type{cudf::experimental::type_to_id<T>()},
+                           v.size(), v.data().get());
+}
+
+// Resamples many splines of state.range(0) knots at random query points.
+// The number of queries is fixed, so the time per query follows the cost of
+// locating each query's segment within its spline.
+static void BM_cubicspline_interpolate(benchmark::State& state) {
+  int32_t length = state.range(0);
+  int32_t num_splines =
+    static_cast<int32_t>(std::min<int64_t>(kMaxSplines, kMaxKnots / length));
+  int64_t num_knots = static_cast<int64_t>(num_splines) * length;
+
+  // knots of every spline are 0, 1, ..., length-1
+  rmm::device_vector<float> t(num_knots);
+  thrust::transform(thrust::make_counting_iterator<int64_t>(0),
+                    thrust::make_counting_iterator<int64_t>(num_knots),
+                    t.begin(),
+                    [length] __device__ (int64_t i) {
+                      return static_cast<float>(i % length);
+                    });
+  rmm::device_vector<int32_t> prefixes(num_splines + 1);
+  thrust::sequence(prefixes.begin(), prefixes.end(), 0, length);
+
+  // the coefficient values do not change the cost of evaluation
+  std::vector<rmm::device_vector<float>> coefficients(
+    4, rmm::device_vector<float>(num_knots - num_splines, 1.0f));
+
+  rmm::device_vector<int32_t> query_ids(kNumQueries);
+  rmm::device_vector<float> query_points(kNumQueries);
+  thrust::transform(thrust::make_counting_iterator<int32_t>(0),
+                    thrust::make_counting_iterator<int32_t>(kNumQueries),
+                    query_ids.begin(),
+                    [num_splines] __device__ (int32_t i) {
+                      thrust::default_random_engine rng(i);
+                      thrust::uniform_int_distribution<int32_t> dist(0, num_splines - 1);
+                      return dist(rng);
+                    });
+  thrust::transform(thrust::make_counting_iterator<int32_t>(0),
+                    thrust::make_counting_iterator<int32_t>(kNumQueries),
+                    query_points.begin(),
+                    [length] __device__ (int32_t i) {
+                      thrust::default_random_engine rng(i);
+                      rng.discard(1);
+                      thrust::uniform_real_distribution<float> dist(0, length - 1);
+                      return dist(rng);
+                    });
+
+  std::vector<cudf::column_view> coefficient_views;
+  for (auto const& c : coefficients) {
+    coefficient_views.push_back(make_view(c));
+  }
+  cudf::table_view coefficient_table(coefficient_views);
+  auto t_view = make_view(t);
+  auto prefixes_view = make_view(prefixes);
+  auto query_ids_view = make_view(query_ids);
+  auto query_points_view = make_view(query_points);
+
+  for (auto _ : state) {
+    auto result = cuspatial::cubicspline_interpolate(
+      query_points_view, query_ids_view, prefixes_view, t_view,
+      coefficient_table);
+    cudaDeviceSynchronize();
+    benchmark::DoNotOptimize(result);
+  }
+  state.SetItemsProcessed(state.iterations() * kNumQueries);
+  state.counters["splines"] = num_splines;
+}
+
+BENCHMARK(BM_cubicspline_interpolate)
+  ->RangeMultiplier(10)
+  ->Range(100, 10000)
+  ->UseRealTime()
+  ->Unit(benchmark::kMillisecond);
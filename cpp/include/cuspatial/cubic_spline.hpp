@@ -31,9 +31,9 @@ namespace cuspatial {
  * The input data arrays `t` and `y` contain the vertices of many concatenated
  * splines.
  *
- * Currently, all input splines must be the same length. The minimum supported
- * length is 5.
- * 
+ * Splines may have different lengths, as given by `offsets`, and each must
+ * have at least two vertices.
+ *
  * @note Ids should be prefixed with a 0, even when only a single spline
  * is fit, ids will be {0, 0}
  *
@@ -42,7 +42,8 @@ namespace cuspatial {
  * @param[in] ids of incoming coordinate sets
  * @param[in] offsets the exclusive scan of the spline sizes, prefixed by
  * 0. For example, for 3 splines of 5 vertices each, the offsets input array
- * is {0, 5, 10, 15}.
+ * is {0, 5, 10, 15}, and for splines of 5, 3 and 4 vertices it is
+ * {0, 5, 8, 12}.
  *
  * @return cudf::table_view of coefficients for spline interpolation. The size
  * of the table is ((M-n), 4) where M is `t.size()` and and n is 
@@ -78,4 +79,53 @@ std::unique_ptr<cudf::experimental::table> cubicspline_coefficients(
                                          cudf::column_view const& y,
                                          cudf::column_view const& ids,
                                          cudf::column_view const& offsets);
+
+/**
+ * @brief Create cubic spline coefficients for several dependent variables
+ * that share the same independent coordinates.
+ *
+ * Equivalent to calling cubicspline_coefficients once for each column of `y`,
+ * but all columns are fit in a single batched tridiagonal solve.
+ *
+ * @param[in] t column_view of independent coordinates for fitting splines
+ * @param[in] y table_view of dependent variables, one column per variable,
+ * each to be fit along t axis
+ * @param[in] ids of incoming coordinate sets
+ * @param[in] offsets the exclusive scan of the spline sizes, prefixed by 0.
+ *
+ * @return table of coefficients with four columns, d3, d2, d1 and d0, for
+ * each column of `y` in order.
+**/
+std::unique_ptr<cudf::experimental::table> cubicspline_coefficients_columns(
+                                         cudf::column_view const& t,
+                                         cudf::table_view const& y,
+                                         cudf::column_view const& ids,
+                                         cudf::column_view const& offsets);
+
+/**
+ * @brief Compute cubic interpolations of several dependent variables along
+ * the same query points.
+ *
+ * Equivalent to calling cubicspline_interpolate once for each variable, but
+ * each query point is located in its spline once and all variables are
+ * evaluated in one pass.
+ *
+ * @param[in] query_points column of coordinate values to be interpolated.
+ * @param[in] spline_ids ids that identify the spline to interpolate each
+ * coordinate into.
+ * @param[in] offsets int32 column of offset of the source_points.
+ * @param[in] source_points column of the original `t` values used
+ * to compute the coefficients.
+ * @param[in] coefficients table of spline coefficients produced by
+ * cubicspline_coefficients_columns.
+ *
+ * @return table with one interpolated column for each group of four
+ * coefficient columns.
+**/
+std::unique_ptr<cudf::experimental::table> cubicspline_interpolate_columns(
+                                         cudf::column_view const& query_points,
+                                         cudf::column_view const& spline_ids,
+                                         cudf::column_view const& offsets,
+                                         cudf::column_view const& source_points,
+                                         cudf::table_view const& coefficients);
 }// namespace cuspatial
@@ -40,4 +40,64 @@ namespace cuspatial {
 gdf_column directed_hausdorff_distance(const gdf_column& x, const gdf_column& y,
                                        const gdf_column& vertex_counts);
 
+/**
+ * @brief compute the directed Hausdorff distances among all pairs of a set of
+ * trajectories that are no greater than a threshold
+ *
+ * Uses the early-break algorithm of Taha and Hanbury (2015): a point stops
+ * scanning the other trajectory once it cannot raise the running maximum, and
+ * a pair is abandoned once the running maximum exceeds @p max_distance.
+ *
+ * @param[in] x: x coordinates of the input trajectories
+ * @param[in] y: y coordinates of the input trajectories
+ * @param[in] vertex_counts: numbers of vertices in each trajectory
+ * @param[in] max_distance: largest distance to report
+ *
+ * @returns Flattened (1D) column of all-pairs directed Hausdorff distances
+ *          among trajectories (i,j), holding infinity for the pairs farther
+ *          apart than @p max_distance
+ */
+gdf_column directed_hausdorff_distance_within(const gdf_column& x, const gdf_column& y,
+                                              const gdf_column& vertex_counts,
+                                              double max_distance);
+
+/**
+ * @brief compute the Hausdorff distances of given pairs of a set of
+ * trajectories
+ *
+ * Uses the early-break algorithm of directed_hausdorff_distance_within.
+ *
+ * @param[in] x: x coordinates of the input trajectories
+ * @param[in] y: y coordinates of the input trajectories
+ * @param[in] vertex_counts: numbers of vertices in each trajectory
+ * @param[in] source: int32 indices of the trajectories the distances are from
+ * @param[in] target: int32 indices of the trajectories the distances are to
+ * @param[in] symmetric: take the larger of both directed distances of each pair
+ * @param[in] max_distance: largest distance to report
+ *
+ * @returns column of the Hausdorff distances of the pairs (source[k],target[k]),
+ *          holding infinity for the pairs farther apart than @p max_distance
+ *
+ * @note the indices are not checked against the number of trajectories
+ */
+gdf_column directed_hausdorff_distance_pairs(const gdf_column& x, const gdf_column& y,
+                                             const gdf_column& vertex_counts,
+                                             const gdf_column& source,
+                                             const gdf_column& target,
+                                             bool symmetric, double max_distance);
+
+/**
+ * @brief compute the symmetric Hausdorff distances among all pairs of a set of
+ * trajectories
+ *
+ * @param[in] x: x coordinates of the input trajectories
+ * @param[in] y: y coordinates of the input trajectories
+ * @param[in] vertex_counts: numbers of vertices in each trajectory
+ *
+ * @returns column of the distances of the pairs (i,j), i<j, in the condensed
+ *          layout of scipy.spatial.distance.pdist
+ */
+gdf_column symmetric_hausdorff_distance_condensed(const gdf_column& x, const gdf_column& y,
+                                                  const gdf_column& vertex_counts);
+
 }  // namespace cuspatial
@@ -24,7 +24,8 @@ namespace cuspatial {
  * @brief derive trajectories from points, timestamps and object ids
  *
  * Points are x/y coordinates relative to an origin. First sorts by object id
- * and timestamp and then groups by id.
+ * and timestamp and then groups by id. The inputs are reordered in place;
+ * see derive_trajectories_order() for a variant that leaves them untouched.
  *
  * @param[in/out] x: x coordinates relative to a camera origin
  *                  (before/after sorting)
@@ -46,6 +47,37 @@ gdf_size_type derive_trajectories(const gdf_column& x, const gdf_column& y,
                                   gdf_column& trajectory_id,
                                   gdf_column& length, gdf_column& offset);
 
+/**
+ * @brief derive trajectories from timestamps and object ids without
+ * modifying them
+ *
+ * Unlike derive_trajectories(), the inputs are left untouched; the points
+ * are ordered by a single stable sort on the (object id, timestamp) pair and
+ * the resulting permutation is returned so that callers can gather x, y or
+ * any other point attribute into trajectory order.
+ *
+ * @param[in] object_id: object (e.g., vehicle) id column
+ * @param[in] timestamp: timestamp column
+ * @param[out] trajectory_id: trajectory id column (unique object ids)
+ * @param[out] length: #of points in the derived trajectories
+ * @param[out] offset: position offsets of trajectories used to index points
+ *                  in sorted order
+ * @param[out] order: INT32 permutation; the i-th point in sorted order is
+ *                  input point order[i]. Empty if assume_sorted is true
+ * @param[in] assume_sorted: the points are already grouped by object id and
+ *                  ordered by timestamp within each group, so the sort is
+ *                  skipped
+ *
+ * @return number of derived trajectories
+ */
+gdf_size_type derive_trajectories_order(const gdf_column& object_id,
+                                        const gdf_column& timestamp,
+                                        gdf_column& trajectory_id,
+                                        gdf_column& length,
+                                        gdf_column& offset,
+                                        gdf_column& order,
+                                        bool assume_sorted = false);
+
 
 /**
  * @brief Compute the distance and speed of trajectories
@@ -74,6 +106,40 @@ trajectory_distance_and_speed(const gdf_column& x, const gdf_column& y,
                               const gdf_column& length,
                               const gdf_column& offset);
 
+/**
+ * @brief Compute the distance, duration, speed and bearing of every segment
+ * (pair of consecutive points) of trajectories in one pass
+ *
+ * Outputs have one element per point, aligned with x/y/timestamp so that
+ * `offset` indexes them as well: element i describes the segment from point
+ * i-1 to point i. The first point of each trajectory has a distance and
+ * duration of 0 and a NaN speed and bearing.
+ *
+ * @param[in] x: x coordinates (km) relative to a camera origin and ordered by
+ *            (id,timestamp)
+ * @param[in] y: y coordinates (km) relative to a camera origin and ordered by
+ *            (id,timestamp)
+ * @param[in] timestamp: timestamp (ms) column ordered by (id,timestamp)
+ * @param[in] length: number of points column ordered by (id,timestamp)
+ * @param[in] offset: offsets of trajectories used to index x/y/oid/ts
+ *            ordered by (id,timestamp)
+ * @param[out] distance: segment lengths in meters (m)
+ * @param[out] duration: segment durations in seconds (s)
+ * @param[out] speed: segment speeds in meters per second (m/s); NaN for
+ *             segments of zero duration
+ * @param[out] bearing: direction of travel in degrees counterclockwise from
+ *             the +x axis, in (-180, 180]; NaN for segments of zero length
+ */
+void trajectory_segment_distance_and_speed(const gdf_column& x,
+                                           const gdf_column& y,
+                                           const gdf_column& timestamp,
+                                           const gdf_column& length,
+                                           const gdf_column& offset,
+                                           gdf_column& distance,
+                                           gdf_column& duration,
+                                           gdf_column& speed,
+                                           gdf_column& bearing);
+
 
 /**
  * @brief compute spatial bounding boxes of trajectories
@@ -19,50 +19,54 @@
 #include <cudf/column/column_device_view.cuh>
 #include <cudf/filling.hpp>
 #include <cudf/scalar/scalar.hpp>
+#include <cudf/copying.hpp>
 #include "cusparse.h"
 #include <cuspatial/utility.hpp>
 
+#include <thrust/binary_search.h>
+#include <thrust/execution_policy.h>
+#include <thrust/host_vector.h>
+
 namespace { // anonymous
 
-// This functor performs one linear search for each input point in query_coords
+// This functor finds, for each input point in query_points, the row of the
+// coefficients table of the spline segment that contains it. Each query
+// performs one binary search over the knots of its own spline, so the cost
+// grows with the log of the spline length.
 struct parallel_search {
   template <typename T>
   std::enable_if_t<std::is_floating_point<T>::value, std::unique_ptr<cudf::column>>
-  operator()(cudf::column_view const& t,
+  operator()(cudf::column_view const& query_points,
              cudf::column_view const& curve_ids,
              cudf::column_view const& prefixes,
-             cudf::column_view const& query_coords,
+             cudf::column_view const& source_points,
              rmm::mr::device_memory_resource *mr,
              cudaStream_t stream) {
-      const T* p_t = t.data<T>();
+      const T* p_query_points = query_points.data<T>();
       const int32_t* p_curve_ids = curve_ids.data<int32_t>();
       const int32_t* p_prefixes = prefixes.data<int32_t>();
-      const T* p_query_coords = query_coords.data<T>();
-      auto result = cudf::make_numeric_column(curve_ids.type(), t.size(),
+      const T* p_source_points = source_points.data<T>();
+      auto result = cudf::make_numeric_column(curve_ids.type(), query_points.size(),
               cudf::mask_state::UNALLOCATED, stream, mr);
       int32_t* p_result = result->mutable_view().data<int32_t>();
       thrust::for_each(rmm::exec_policy(stream)->on(stream),
         thrust::make_counting_iterator<int>(0),
-        thrust::make_counting_iterator<int>(query_coords.size()),
-        [p_t, p_curve_ids, p_prefixes, p_query_coords, p_result] __device__
+        thrust::make_counting_iterator<int>(query_points.size()),
+        [p_query_points, p_curve_ids, p_prefixes, p_source_points, p_result] __device__
         (int index) {
           int curve = p_curve_ids[index];
           int len = p_prefixes[curve+1] - p_prefixes[curve];
           int h = p_prefixes[curve];
+          // a spline of len knots has len-1 rows of coefficients
           int dh = p_prefixes[curve] - (curve);
-          // O(n) search, can do log(n) easily
-          for(int32_t i = 0 ; i < len ; ++i) {
-            if((p_t[h+i]+0.0001 - p_query_coords[index]) > 0.00001) {
-              p_result[index] = dh+i-1;
-              if(i == 0) p_result[index] = index-curve;
-              return;
-            }
-          }
-          // TODO: Important failure case:
-          // This will use the final set of coefficients
-          // for t_ values that are outside of the original
-          // interpolation range.
-          p_result[index] = h+len - 2;
+          // Search the inner knots t[1]..t[len-2] only: queries before t[1],
+          // including those before t[0], use the first segment, and queries
+          // at or past t[len-2] use the last one.
+          const T* first = p_source_points + h + 1;
+          const T* last = p_source_points + h + len - 1;
+          int segment = thrust::upper_bound(thrust::seq, first, last,
+                                            p_query_points[index]) - first;
+          p_result[index] = dh + segment;
       });
       return result;
   };
@@ -73,35 +77,77 @@ struct parallel_search {
   }
 };
 
-// This functor simply computes the interpolation of each coordinate `t[i]`
-// using the coefficients from row `coef_indices[i]`.
+// This functor computes the interpolation of each coordinate `t[i]` using
+// the coefficients from row `coef_indices[i]`. `coefficients` holds four
+// columns per interpolated column, and all of them are evaluated in the same
+// pass over `t`.
 struct interpolate {
   template <typename T>
-  std::enable_if_t<std::is_floating_point<T>::value, std::unique_ptr<cudf::column>>
+  std::enable_if_t<std::is_floating_point<T>::value, std::vector<std::unique_ptr<cudf::column>>>
   operator()(cudf::column_view const& t,
              cudf::column_view const& ids,
              cudf::column_view const& coef_indices,
              cudf::table_view const& coefficients,
              rmm::mr::device_memory_resource *mr,
              cudaStream_t stream) {
+      int num_columns = coefficients.num_columns() / 4;
+      thrust::host_vector<const T*> h_coefficients(coefficients.num_columns());
+      for(int j = 0 ; j < coefficients.num_columns() ; ++j) {
+        h_coefficients[j] = coefficients.column(j).data<T>();
+      }
+      std::vector<std::unique_ptr<cudf::column>> results;
+      thrust::host_vector<T*> h_results(num_columns);
+      for(int c = 0 ; c < num_columns ; ++c) {
+        results.push_back(cudf::make_numeric_column(t.type(), t.size(),
+                cudf::mask_state::UNALLOCATED, stream, mr));
+        h_results[c] = results.back()->mutable_view().data<T>();
+      }
+      rmm::device_vector<const T*> d_coefficients(h_coefficients);
+      rmm::device_vector<T*> d_results(h_results);
+
       const T* p_t = t.data<T>();
-      const int32_t* p_ids = ids.data<int32_t>();
       const int32_t* p_coef_indices = coef_indices.data<int32_t>();
-      const T* p_d3 = coefficients.column(3).data<T>();
-      const T* p_d2 = coefficients.column(2).data<T>();
-      const T* p_d1 = coefficients.column(1).data<T>();
-      const T* p_d0 = coefficients.column(0).data<T>();
-      auto result = cudf::make_numeric_column(t.type(), t.size(),
-              cudf::mask_state::UNALLOCATED, stream, mr);
-      T* p_result = result->mutable_view().data<T>();
+      const T* const* p_coefficients = d_coefficients.data().get();
+      T* const* p_results = d_results.data().get();
       thrust::for_each(rmm::exec_policy(stream)->on(stream),
         thrust::make_counting_iterator<int>(0),
         thrust::make_counting_iterator<int>(t.size()),
-        [p_t, p_ids, p_coef_indices, p_d3, p_d2, p_d1, p_d0, p_result] __device__
+        [p_t, p_coef_indices, p_coefficients, p_results, num_columns] __device__
         (int index) {
           int h = p_coef_indices[index];
-          p_result[index] = p_d3[h] + p_t[index] * (p_d2[h] + p_t[index] * (p_d1[h] + (p_t[index] * p_d0[h])));
+          T x = p_t[index];
+          for(int c = 0 ; c < num_columns ; ++c) {
+            const T* const* d = p_coefficients + 4 * c;
+            p_results[c][index] = d[3][h] + x * (d[2][h] + x * (d[1][h] + (x * d[0][h])));
+          }
       });
+      return results;
+  };
+  template <typename T, typename... Args>
+  std::enable_if_t<not std::is_floating_point<T>::value, std::vector<std::unique_ptr<cudf::column>>>
+  operator()(Args&&... args) {
+      CUDF_FAIL("Non-floating point operation is not supported.");
+  }
+};
+
+// This functor concatenates `columns` into a single column.
+struct stack_columns {
+  template <typename T>
+  std::enable_if_t<std::is_floating_point<T>::value, std::unique_ptr<cudf::column>>
+  operator()(std::vector<cudf::column_view> const& columns,
+             rmm::mr::device_memory_resource *mr,
+             cudaStream_t stream) {
+      cudf::size_type size = 0;
+      for(auto const& column : columns) {
+        size += column.size();
+      }
+      auto result = cudf::make_numeric_column(columns.front().type(), size,
+              cudf::mask_state::UNALLOCATED, stream, mr);
+      T* p_result = result->mutable_view().data<T>();
+      for(auto const& column : columns) {
+        p_result = thrust::copy(rmm::exec_policy(stream)->on(stream),
+            column.data<T>(), column.data<T>() + column.size(), p_result);
+      }
       return result;
   };
   template <typename T, typename... Args>
@@ -151,7 +197,7 @@ struct coefficients_compute {
             T a = p_y[h+ci];
             T b = p_i[h+ci] - p_h[h+ci] * (p_z[h+ci+1] + 2 * p_z[h+ci]) / 6;
             T c = p_z[h+ci] / 2.0;
-            T d = (p_z[h+ci+1] - p_z[h+ci]) / 6 * p_h[h+ci];
+            T d = (p_z[h+ci+1] - p_z[h+ci]) / (6 * p_h[h+ci]);
             T t = p_t[h+ci];
             p_d3[dh+ci] = d;
             p_d2[dh+ci] = c - 3 * d * t;
@@ -178,8 +224,12 @@ struct coefficients_compute {
   }
 };
 
-// Computes the diagonal `D` of a large sparse matrix, and also the upper and
-// lower diagonals `Dlu`, which in this case are equal.
+// Computes the diagonal `D`, the lower and upper diagonals `Dl` and `Du`
+// and the right hand side `u` of the tridiagonal system for the second
+// derivatives of natural cubic splines. Splines may have any length: the
+// first and last row of each spline have D = 1 and zero off-diagonals, so
+// the systems of all splines together form one block diagonal system.
+// Every row of the system is written, so the buffers need no initialization.
 struct compute_spline_tridiagonals {
   template<typename T>
   std::enable_if_t<std::is_floating_point<T>::value, void>
@@ -187,7 +237,8 @@ struct compute_spline_tridiagonals {
                   cudf::column_view const& y,
                   cudf::column_view const& prefixes,
                   cudf::mutable_column_view const& D,
-                  cudf::mutable_column_view const& Dlu,
+                  cudf::mutable_column_view const& Dl,
+                  cudf::mutable_column_view const& Du,
                   cudf::mutable_column_view const& u,
                   cudf::mutable_column_view const& h,
                   cudf::mutable_column_view const& i,
@@ -197,14 +248,15 @@ struct compute_spline_tridiagonals {
       const T* p_y = y.data<T>();
       const int32_t* p_prefixes = prefixes.data<int32_t>();
       T* p_d = D.data<T>();
-      T* p_dlu = Dlu.data<T>();
+      T* p_dl = Dl.data<T>();
+      T* p_du = Du.data<T>();
       T* p_u = u.data<T>();
       T* p_h = h.data<T>();
       T* p_i = i.data<T>();
       thrust::for_each(rmm::exec_policy(stream)->on(stream),
         thrust::make_counting_iterator<int>(1),
         thrust::make_counting_iterator<int>(prefixes.size()),
-        [p_t, p_y, p_prefixes, p_d, p_dlu, p_u, p_h, p_i] __device__
+        [p_t, p_y, p_prefixes, p_d, p_dl, p_du, p_u, p_h, p_i] __device__
         (int index) {
           int n = p_prefixes[index] - p_prefixes[index-1];
           int h = p_prefixes[index-1];
@@ -213,12 +265,19 @@ struct compute_spline_tridiagonals {
             p_h[h + ci] = p_t[h+ci+1] - p_t[h+ci];
             p_i[h + ci] = (p_y[h+ci+1] - p_y[h+ci]) / p_h[h + ci];
           }
-          for(ci = 0 ; ci < n-2 ; ++ci) {
-            p_d[h+ci+1] = (p_h[h+ci+1]+p_h[h+(n-2)-ci]) * 2;
-            p_u[h+ci+1] = (p_i[h+ci+1] - p_i[h+(n-2)-ci]) * 6;
+          // the first and last rows fix the second derivative to zero
+          int ends[2] = {h, h+n-1};
+          for(ci = 0 ; ci < 2 ; ++ci) {
+            p_d[ends[ci]] = 1;
+            p_dl[ends[ci]] = 0;
+            p_du[ends[ci]] = 0;
+            p_u[ends[ci]] = 0;
           }
-          for(ci = 0 ; ci < n-3 ; ++ci) {
-            p_dlu[h+ci+1] = p_i[h+ci+1];
+          for(ci = 1 ; ci < n-1 ; ++ci) {
+            p_d[h+ci] = (p_h[h+ci-1] + p_h[h+ci]) * 2;
+            p_dl[h+ci] = p_h[h+ci-1];
+            p_du[h+ci] = p_h[h+ci];
+            p_u[h+ci] = (p_i[h+ci] - p_i[h+ci-1]) * 6;
           }
       });
   }
@@ -228,7 +287,8 @@ struct compute_spline_tridiagonals {
                   cudf::column_view const& y,
                   cudf::column_view const& prefixes,
                   cudf::mutable_column_view const& D,
-                  cudf::mutable_column_view const& Dlu,
+                  cudf::mutable_column_view const& Dl,
+                  cudf::mutable_column_view const& Du,
                   cudf::mutable_column_view const& u,
                   cudf::mutable_column_view const& h,
                   cudf::mutable_column_view const& i,
@@ -238,6 +298,67 @@ struct compute_spline_tridiagonals {
   }
 };
 
+// Overloads selecting the cusparse tridiagonal solver for the element type.
+cusparseStatus_t gtsv2_buffer_size(cusparseHandle_t handle, int m,
+    const float* dl, const float* d, const float* du, const float* B,
+    size_t* size) {
+  return cusparseSgtsv2_nopivot_bufferSizeExt(handle, m, 1, dl, d, du, B, m, size);
+}
+cusparseStatus_t gtsv2_buffer_size(cusparseHandle_t handle, int m,
+    const double* dl, const double* d, const double* du, const double* B,
+    size_t* size) {
+  return cusparseDgtsv2_nopivot_bufferSizeExt(handle, m, 1, dl, d, du, B, m, size);
+}
+cusparseStatus_t gtsv2(cusparseHandle_t handle, int m,
+    const float* dl, const float* d, const float* du, float* B, void* buffer) {
+  return cusparseSgtsv2_nopivot(handle, m, 1, dl, d, du, B, m, buffer);
+}
+cusparseStatus_t gtsv2(cusparseHandle_t handle, int m,
+    const double* dl, const double* d, const double* du, double* B, void* buffer) {
+  return cusparseDgtsv2_nopivot(handle, m, 1, dl, d, du, B, m, buffer);
+}
+
+// Solves the tridiagonal system with lower, main and upper diagonals `Dl`,
+// `D` and `Du` in place of its right hand side `u`.
+// cusparse solves the block diagonal system of all splines at once, so
+// splines need not share a length. The system is strictly diagonally
+// dominant, so no pivoting is needed.
+struct solve_tridiagonal {
+  template<typename T>
+  std::enable_if_t<std::is_floating_point<T>::value, void>
+  operator()(cudf::mutable_column_view const& Dl,
+             cudf::mutable_column_view const& D,
+             cudf::mutable_column_view const& Du,
+             cudf::mutable_column_view const& u,
+             cudaStream_t stream) {
+      cusparseStatus_t cusparseStatus;
+      cusparseHandle_t handle;
+      cusparseStatus = cusparseCreate(&handle);
+      cuspatial::detail::HANDLE_CUSPARSE_STATUS(cusparseStatus);
+      cusparseStatus = cusparseSetStream(handle, stream);
+      cuspatial::detail::HANDLE_CUSPARSE_STATUS(cusparseStatus);
+      size_t pBufferSize;
+      cusparseStatus = gtsv2_buffer_size(handle, u.size(), Dl.data<T>(),
+          D.data<T>(), Du.data<T>(), u.data<T>(), &pBufferSize);
+      cuspatial::detail::HANDLE_CUSPARSE_STATUS(cusparseStatus);
+      rmm::device_vector<char> pBuffer(pBufferSize);
+      cusparseStatus = gtsv2(handle, u.size(), Dl.data<T>(), D.data<T>(),
+          Du.data<T>(), u.data<T>(), pBuffer.data().get());
+      cuspatial::detail::HANDLE_CUSPARSE_STATUS(cusparseStatus);
+      cusparseStatus = cusparseDestroy(handle);
+      cuspatial::detail::HANDLE_CUSPARSE_STATUS(cusparseStatus);
+  }
+  template<typename T>
+  std::enable_if_t<not std::is_floating_point<T>::value, void>
+  operator()(cudf::mutable_column_view const& Dl,
+             cudf::mutable_column_view const& D,
+             cudf::mutable_column_view const& Du,
+             cudf::mutable_column_view const& u,
+             cudaStream_t stream) {
+      CUDF_FAIL("Non-floating point operation is not supported.");
+  }
+};
+
 } // anonymous namespace
 
 namespace cuspatial
@@ -289,7 +410,33 @@ std::unique_ptr<cudf::column> cubicspline_interpolate(
     //TPRINT(prefixes, "prefixes_");
     //cudf::column_view result_view = result->view();
     ////TPRINT(result_view, "interpolate_");
-    return result;
+    return std::move(result.front());
+}
+
+/**
+ * @brief Compute cubic interpolations of several columns that share their
+ * `t` values and splines, locating each query point only once.
+ *
+ * @param[in] coefficients table of four spline coefficient columns for each
+ * interpolated column, as produced by cubicspline_coefficients_columns.
+ *
+ * @return table of one interpolated column per group of four coefficients.
+**/
+std::unique_ptr<cudf::experimental::table> cubicspline_interpolate_columns(
+    cudf::column_view const& query_points,
+    cudf::column_view const& curve_ids,
+    cudf::column_view const& prefixes,
+    cudf::column_view const& source_points,
+    cudf::table_view const& coefficients,
+    rmm::mr::device_memory_resource *mr,
+    cudaStream_t stream
+)
+{
+    CUDF_EXPECTS(coefficients.num_columns() > 0 && coefficients.num_columns() % 4 == 0,
+        "Coefficients must have four columns per interpolated column");
+    auto coefficient_indices = cudf::experimental::type_dispatcher(query_points.type(), parallel_search{}, query_points, curve_ids, prefixes, source_points, mr, stream);
+    auto result = cudf::experimental::type_dispatcher(query_points.type(), interpolate{}, query_points, curve_ids, coefficient_indices->view(), coefficients, mr, stream);
+    return std::make_unique<cudf::experimental::table>(std::move(result));
 }
 
 /**
@@ -301,9 +448,9 @@ std::unique_ptr<cudf::column> cubicspline_interpolate(
  * The input data arrays `t` and `y` contain the vertices of many concatenated
  * splines.
  *
- * Currently, all input splines must be the same length. The minimum supported
- * length is 5.
- * 
+ * Splines may have different lengths, as given by `offsets`, and each must
+ * have at least two vertices.
+ *
  * @note Ids should be prefixed with a 0, even when only a single spline
  * is fit, ids will be {0, 0}
  *
@@ -342,85 +489,24 @@ std::unique_ptr<cudf::experimental::table> cubicspline_coefficients(
     //TPRINT(ids, "ids");
     //TPRINT(prefixes, "prefixes");
 
+    CUDF_EXPECTS(t.type() == y.type(), "t and y type mismatch");
     int64_t n = y.size();
     auto h_col = make_numeric_column(y.type(), n, cudf::mask_state::UNALLOCATED, stream, mr);
     auto i_col = make_numeric_column(y.type(), n, cudf::mask_state::UNALLOCATED, stream, mr);
     auto D_col = make_numeric_column(y.type(), n, cudf::mask_state::UNALLOCATED, stream, mr);
-    auto Dlu_col = make_numeric_column(y.type(), n, cudf::mask_state::UNALLOCATED, stream, mr);
-    auto Dll_col = make_numeric_column(y.type(), n, cudf::mask_state::UNALLOCATED, stream, mr);
+    auto Dl_col = make_numeric_column(y.type(), n, cudf::mask_state::UNALLOCATED, stream, mr);
+    auto Du_col = make_numeric_column(y.type(), n, cudf::mask_state::UNALLOCATED, stream, mr);
     auto u_col = make_numeric_column(y.type(), n, cudf::mask_state::UNALLOCATED, stream, mr);
     auto h_buffer = h_col->mutable_view();
     auto i_buffer = i_col->mutable_view();
     auto D_buffer = D_col->mutable_view();
-    auto Dlu_buffer = Dll_col->mutable_view();
-    auto Dll_buffer = Dll_col->mutable_view();
+    auto Dl_buffer = Dl_col->mutable_view();
+    auto Du_buffer = Du_col->mutable_view();
     auto u_buffer = u_col->mutable_view();
 
-    auto zero = cudf::numeric_scalar<float>(0.0);
-    auto one = cudf::numeric_scalar<float>(1.0);
-    cudf::experimental::fill_in_place(h_buffer, 0, h_col->size(), zero);
-    cudf::experimental::fill_in_place(i_buffer, 0, i_col->size(), zero);
-    cudf::experimental::fill_in_place(D_buffer, 0, D_col->size(), one);
-    cudf::experimental::fill_in_place(Dlu_buffer, 0, Dlu_col->size(), zero);
-    cudf::experimental::fill_in_place(u_buffer, 0, u_col->size(), zero);
-    
-    //TPRINT(h_buffer, "h_zero");
-    //TPRINT(D_buffer, "D_one");
-    //TPRINT(Dlu_buffer, "Dlu_zero");
-    cudf::experimental::type_dispatcher(y.type(), compute_spline_tridiagonals{}, t, y, prefixes, D_buffer, Dlu_buffer, u_buffer, h_buffer, i_buffer, mr, stream);
-
-    //TPRINT(h_buffer, "h_i");
-    //TPRINT(i_buffer, "i_i");
-    //TPRINT(D_buffer, "D_i");
-    //TPRINT(Dlu_buffer, "Dlu_i");
-    //TPRINT(u_buffer, "u_i");
-
-    // cusparse solve n length m tridiagonal systems
-    // 4. call cusparse<T>gtsv2() to solve
-    // 4.1 Get cuSparse library context
-    // compute inputs:
-    // handle: the cuSparse library context
-    // m: size
-    // n: number of columns of solution matrix B
-    // dl, d, du: vectors of the diagonal
-    // B: (ldb, n) dimensional dense matrix to be solved for
-    // ldb: leading dimension of B
-    // pBuffer: get size of thisu by gtsv2_bufferSizeExt 
-    cusparseStatus_t cusparseStatus;
-    cusparseHandle_t handle;
-    cudaMalloc(&handle, sizeof(cusparseHandle_t));
-    cusparseStatus = cusparseCreate(&handle);
-    detail::HANDLE_CUSPARSE_STATUS(cusparseStatus);
-    size_t pBufferSize;
-    int32_t batchStride = y.size() / (prefixes.size() - 1);
-    int32_t batchSize = batchStride;
-    cusparseStatus = cusparseSgtsv2StridedBatch_bufferSizeExt(
-        handle,
-        batchSize,
-        Dll_buffer.data<float>(),
-        D_buffer.data<float>(),
-        Dlu_buffer.data<float>(),
-        u_buffer.data<float>(),
-        prefixes.size()-1,
-        batchStride,
-        &pBufferSize
-    );
-    detail::HANDLE_CUSPARSE_STATUS(cusparseStatus);
-    rmm::device_vector<float> pBuffer(pBufferSize);
-    cusparseStatus = cusparseSgtsv2StridedBatch(
-        handle,
-        batchSize,
-        Dll_buffer.data<float>(),
-        D_buffer.data<float>(),
-        Dlu_buffer.data<float>(),
-        u_buffer.data<float>(),
-        prefixes.size()-1,
-        batchStride,
-        pBuffer.data().get()
-    );
-    detail::HANDLE_CUSPARSE_STATUS(cusparseStatus);
-    cusparseStatus = cusparseDestroy(handle);
-    detail::HANDLE_CUSPARSE_STATUS(cusparseStatus);
+    cudf::experimental::type_dispatcher(y.type(), compute_spline_tridiagonals{}, t, y, prefixes, D_buffer, Dl_buffer, Du_buffer, u_buffer, h_buffer, i_buffer, mr, stream);
+
+    cudf::experimental::type_dispatcher(y.type(), solve_tridiagonal{}, Dl_buffer, D_buffer, Du_buffer, u_buffer, stream);
 
     int dn = n - (prefixes.size()-1);
     // Finally, compute coefficients via Horner's scheme
@@ -454,6 +540,72 @@ std::unique_ptr<cudf::experimental::table> cubicspline_coefficients(
     return result;
 }
 
+/**
+ * @brief Create cubic spline coefficients for every column of `y`, fitting
+ * all of them against the shared `t` and `prefixes`.
+ *
+ * The columns of `y` are stacked into one column, and `t` and the prefixes
+ * are repeated once per column, so that all splines of all columns are
+ * solved as one batch of tridiagonal systems.
+ *
+ * @return table of four coefficient columns, d3, d2, d1 and d0, for each
+ * column of `y` in order.
+**/
+std::unique_ptr<cudf::experimental::table> cubicspline_coefficients_columns(
+    cudf::column_view const& t,
+    cudf::table_view const& y,
+    cudf::column_view const& ids,
+    cudf::column_view const& prefixes,
+    rmm::mr::device_memory_resource *mr,
+    cudaStream_t stream
+)
+{
+    CUDF_EXPECTS(y.num_columns() > 0, "Input y table must have at least one column");
+    CUDF_EXPECTS(prefixes.size() > 1, "Prefixes must describe at least one spline");
+    int32_t num_columns = y.num_columns();
+    int32_t num_splines = prefixes.size() - 1;
+    int32_t n = t.size();
+
+    std::vector<cudf::column_view> t_repeated(num_columns, t);
+    std::vector<cudf::column_view> y_columns(y.begin(), y.end());
+    auto t_stacked = cudf::experimental::type_dispatcher(t.type(), stack_columns{}, t_repeated, mr, stream);
+    auto y_stacked = cudf::experimental::type_dispatcher(y.column(0).type(), stack_columns{}, y_columns, mr, stream);
+    auto prefixes_stacked = cudf::make_numeric_column(prefixes.type(), num_columns * num_splines + 1,
+            cudf::mask_state::UNALLOCATED, stream, mr);
+    const int32_t* p_prefixes = prefixes.data<int32_t>();
+    thrust::transform(rmm::exec_policy(stream)->on(stream),
+        thrust::make_counting_iterator<int32_t>(0),
+        thrust::make_counting_iterator<int32_t>(prefixes_stacked->size()),
+        prefixes_stacked->mutable_view().data<int32_t>(),
+        [p_prefixes, num_splines, n] __device__ (int32_t j) {
+          return p_prefixes[j % num_splines] + (j / num_splines) * n;
+        });
+
+    auto stacked = cubicspline_coefficients(t_stacked->view(), y_stacked->view(), ids, prefixes_stacked->view(), mr, stream);
+    if (num_columns == 1) {
+      return stacked;
+    }
+
+    // split the stacked coefficients back into four columns per column of y
+    cudf::size_type rows = stacked->num_rows() / num_columns;
+    std::vector<cudf::size_type> bounds;
+    for(int32_t c = 0 ; c < num_columns ; ++c) {
+      bounds.push_back(c * rows);
+      bounds.push_back((c + 1) * rows);
+    }
+    std::vector<std::vector<cudf::column_view>> pieces;
+    for(auto const& column : stacked->view()) {
+      pieces.push_back(cudf::experimental::slice(column, bounds));
+    }
+    std::vector<std::unique_ptr<cudf::column>> columns;
+    for(int32_t c = 0 ; c < num_columns ; ++c) {
+      for(auto const& piece : pieces) {
+        columns.push_back(std::make_unique<cudf::column>(piece[c], stream, mr));
+      }
+    }
+    return std::make_unique<cudf::experimental::table>(std::move(columns));
+}
+
 } // namespace detail
 
 // Calls the interpolate function using default memory resources.
@@ -479,4 +631,27 @@ std::unique_ptr<cudf::experimental::table> cubicspline_coefficients(
   return cuspatial::detail::cubicspline_coefficients(t, y, ids, prefixes, rmm::mr::get_default_resource(), 0);
 }
 
+// Calls the multi-column coefficients function using default memory resources.
+std::unique_ptr<cudf::experimental::table> cubicspline_coefficients_columns(
+    cudf::column_view const& t,
+    cudf::table_view const& y,
+    cudf::column_view const& ids,
+    cudf::column_view const& prefixes
+)
+{
+  return cuspatial::detail::cubicspline_coefficients_columns(t, y, ids, prefixes, rmm::mr::get_default_resource(), 0);
+}
+
+// Calls the multi-column interpolate function using default memory resources.
+std::unique_ptr<cudf::experimental::table> cubicspline_interpolate_columns(
+    cudf::column_view const& query_points,
+    cudf::column_view const& curve_ids,
+    cudf::column_view const& prefixes,
+    cudf::column_view const& source_points,
+    cudf::table_view const& coefficients
+)
+{
+  return cuspatial::detail::cubicspline_interpolate_columns(query_points, curve_ids, prefixes, source_points, coefficients, rmm::mr::get_default_resource(), 0);
+}
+
 } // namespace cuspatial
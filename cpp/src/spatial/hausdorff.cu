@@ -17,6 +17,8 @@
 #include <cudf/utilities/legacy/type_dispatcher.hpp>
 #include <utilities/legacy/cuda_utils.hpp>
 #include <type_traits>
+#include <algorithm>
+#include <limits>
 #include <thrust/device_vector.h>
 
 #include <rmm/thrust_rmm_allocator.h>
@@ -51,29 +53,26 @@ __global__ void kernel_Hausdorff_Full(
 
         int start_right = seg_id_right == 0 ? 0 : pos[seg_id_right-1];
         int stop_right = pos[seg_id_right];
-        T dist = 1e20;
-        int max_threads = 0;
+        //each thread covers every blockDim.x-th point of the left trajectory,
+        //so trajectories are not limited to NUM_THREADS points
+        T max_dist = -1;
+        for (int p = start_left + threadIdx.x; p < stop_left; p += blockDim.x)
         {
-            max_threads = stop_left-start_left;
-            if (threadIdx.x < max_threads)
+            T my_xx = xx[p];
+            T my_yy = yy[p];
+            T dist = 1e20;
+            for (int i = start_right; i < stop_right; i++)
             {
-                T my_xx = xx[start_left+threadIdx.x];
-                T my_yy = yy[start_left+threadIdx.x];
-                for (int i = start_right; i < stop_right; i++)
-                {
-                    T other_xx = xx[i];
-                    T other_yy = yy[i];
-                    T new_dist = (my_xx-other_xx)*(my_xx-other_xx)
-                        + (my_yy-other_yy)*(my_yy-other_yy);
-                    dist= min(dist, new_dist);//dist < new_dist ? dist : new_dist;
-                }
+                T other_xx = xx[i];
+                T other_yy = yy[i];
+                T new_dist = (my_xx-other_xx)*(my_xx-other_xx)
+                    + (my_yy-other_yy)*(my_yy-other_yy);
+                dist= min(dist, new_dist);//dist < new_dist ? dist : new_dist;
             }
+            if (dist <= 1e10)
+                max_dist = max(max_dist, dist);
         }
-        if (dist > 1e10)
-            dist = -1;
-
-         if(threadIdx.x < max_threads)
-                   sdata[threadIdx.x] = dist;
+        sdata[threadIdx.x] = max_dist;
         __syncthreads();
         //reduction
         for(int offset = blockDim.x / 2;
@@ -95,6 +94,142 @@ __global__ void kernel_Hausdorff_Full(
     }
 }
 
+//atomically raises *address to value; both must be non-negative, which order like
+//their bit patterns read as integers
+__device__ inline void atomic_max_nonnegative(float *address, float value)
+{
+    atomicMax(reinterpret_cast<int*>(address), __float_as_int(value));
+}
+
+__device__ inline void atomic_max_nonnegative(double *address, double value)
+{
+    atomicMax(reinterpret_cast<unsigned long long*>(address),
+              static_cast<unsigned long long>(__double_as_longlong(value)));
+}
+
+/**
+ * @brief squared directed Hausdorff distance from the points [start_left, stop_left)
+ * to the points [start_right, stop_right), computed by the whole block with the
+ * early-break algorithm of Taha and Hanbury (2015), or @p initial if that is larger
+ *
+ * A point stops scanning the right trajectory as soon as it finds a point closer than
+ * the running maximum of the block, since it can no longer raise it, and the block
+ * stops once the running maximum exceeds @p max_sq. The result is then only known to
+ * exceed @p max_sq.
+ */
+template <typename T>
+__device__ T directed_early_break(const T *xx, const T *yy,
+                                  int start_left, int stop_left,
+                                  int start_right, int stop_right,
+                                  T initial, T max_sq, T *s_cmax)
+{
+    volatile T *cmax = s_cmax;
+    if (threadIdx.x == 0)
+        *cmax = initial;
+    __syncthreads();
+    for (int p = start_left + threadIdx.x; p < stop_left; p += blockDim.x)
+    {
+        T current = *cmax;
+        if (current > max_sq)
+            break;
+        T my_xx = xx[p];
+        T my_yy = yy[p];
+        T dist = std::numeric_limits<T>::infinity();
+        for (int i = start_right; i < stop_right && dist >= current; i++)
+        {
+            T dx = my_xx - xx[i];
+            T dy = my_yy - yy[i];
+            dist = min(dist, dx * dx + dy * dy);
+        }
+        if (dist > current)
+            atomic_max_nonnegative(s_cmax, dist);
+    }
+    __syncthreads();
+    T result = *cmax;
+    //every thread has read the result before the next call resets it
+    __syncthreads();
+    return result;
+}
+
+//the pair (i, j), i < j, at index k of the condensed layout of scipy's pdist
+__device__ void condensed_pair(long k, int num_traj, int& i, int& j)
+{
+    double n = num_traj;
+    long row = num_traj - 2 - static_cast<long>(
+        floor(sqrt(-8.0 * k + 4.0 * n * (n - 1) - 7) / 2.0 - 0.5));
+    //correct rounding at the row boundaries
+    auto row_start = [num_traj](long r) { return r * num_traj - r * (r + 1) / 2; };
+    while (row > 0 && row_start(row) > k) row--;
+    while (row < num_traj - 2 && row_start(row + 1) <= k) row++;
+    i = row;
+    j = k - row_start(row) + row + 1;
+}
+
+/**
+ * @brief Hausdorff distances of trajectory pairs, one block per pair
+ *
+ * The pairs are (source[k], target[k]) if @p source is given, else every ordered pair
+ * (k / num_traj, k % num_traj), or with @p symmetric every pair i < j in the condensed
+ * layout of scipy's pdist. With @p symmetric, the distance of (i, j) is the larger of
+ * both directions; the second direction starts from the first, so its points break
+ * early against it. Pairs farther apart than sqrt(@p max_sq) get infinity.
+ */
+template <typename T>
+__global__ void kernel_Hausdorff_Pairs(
+                int num_traj,
+                long num_pairs,
+                const T *xx,
+                const T *yy,
+                const uint32_t *pos,
+                const int32_t *source,
+                const int32_t *target,
+                bool symmetric,
+                T max_sq,
+                T *results
+                )
+{
+    __shared__ T s_cmax;
+    for (long bidx = static_cast<long>(blockIdx.y) * gridDim.x + blockIdx.x;
+         bidx < num_pairs;
+         bidx += static_cast<long>(gridDim.x) * gridDim.y)
+    {
+        int seg_id_left, seg_id_right;
+        if (source != nullptr)
+        {
+            seg_id_left = source[bidx];
+            seg_id_right = target[bidx];
+        }
+        else if (symmetric)
+        {
+            condensed_pair(bidx, num_traj, seg_id_left, seg_id_right);
+        }
+        else
+        {
+            seg_id_left = bidx / num_traj;
+            seg_id_right = bidx % num_traj;
+        }
+        int start_left = seg_id_left == 0 ? 0 : pos[seg_id_left-1];
+        int stop_left = pos[seg_id_left];
+        int start_right = seg_id_right == 0 ? 0 : pos[seg_id_right-1];
+        int stop_right = pos[seg_id_right];
+        T dist = directed_early_break(xx, yy, start_left, stop_left,
+                                      start_right, stop_right, T{0}, max_sq, &s_cmax);
+        if (symmetric && dist <= max_sq)
+            dist = directed_early_break(xx, yy, start_right, stop_right,
+                                        start_left, stop_left, dist, max_sq, &s_cmax);
+        if (threadIdx.x == 0)
+            results[bidx] = dist > max_sq ? std::numeric_limits<T>::infinity() : sqrt(dist);
+    }
+}
+
+//grid covering num_blocks blocks of a kernel that loops over its block indices
+dim3 block_grid(long num_blocks)
+{
+    long block_x = std::min(std::max(num_blocks, 1L), 65535L);
+    long block_y = std::min((num_blocks + block_x - 1) / block_x, 65535L);
+    return dim3(block_x, std::max(block_y, 1L));
+}
+
 struct Hausdorff_functor {
     template <typename T>
     static constexpr bool is_supported()
@@ -152,6 +287,71 @@ struct Hausdorff_functor {
     }
 };
 
+struct Hausdorff_pairs_functor {
+    template <typename T>
+    static constexpr bool is_supported()
+    {
+         return std::is_floating_point<T>::value;
+    }
+
+    template <typename T, std::enable_if_t< is_supported<T>() >* = nullptr>
+    gdf_column operator()(const gdf_column& x, const gdf_column& y,
+                          const gdf_column& vertex_counts, long num_pairs,
+                          const int32_t *source, const int32_t *target,
+                          bool symmetric, double max_distance)
+    {
+        gdf_column d_pairs;
+        memset(&d_pairs,0,sizeof(gdf_column));
+        int num_set=vertex_counts.size;
+
+        cudaStream_t stream{0};
+
+        T *temp_pairs{nullptr};
+        RMM_TRY( RMM_ALLOC(&temp_pairs, std::max(num_pairs, 1L) * sizeof(T), stream) );
+
+        uint32_t *vertex_positions{nullptr};
+        RMM_TRY( RMM_ALLOC((void**)&vertex_positions, sizeof(uint32_t)*num_set, stream) );
+        uint32_t *vertex_counts_ptr=static_cast<uint32_t*>(vertex_counts.data);
+        thrust::inclusive_scan(rmm::exec_policy(stream)->on(stream),vertex_counts_ptr,vertex_counts_ptr+num_set,vertex_positions);
+
+        T max_sq = static_cast<T>(max_distance) * static_cast<T>(max_distance);
+        if (num_pairs > 0)
+        {
+            kernel_Hausdorff_Pairs<T> <<< block_grid(num_pairs), NUM_THREADS, 0, stream >>> (
+                num_set, num_pairs, static_cast<T*>(x.data), static_cast<T*>(y.data),
+                vertex_positions, source, target, symmetric, max_sq, temp_pairs);
+            CUDA_TRY( cudaStreamSynchronize(stream) );
+        }
+        RMM_TRY( RMM_FREE(vertex_positions, stream) );
+
+        gdf_column_view_augmented(&d_pairs, temp_pairs, nullptr, num_pairs,
+                            x.dtype, 0,
+                            gdf_dtype_extra_info{TIME_UNIT_NONE}, "hausdorff_pairs");
+
+        return d_pairs;
+    }
+
+    template <typename T, std::enable_if_t< !is_supported<T>() >* = nullptr>
+    gdf_column operator()(const gdf_column& x, const gdf_column& y,
+                          const gdf_column& vertex_counts, long num_pairs,
+                          const int32_t *source, const int32_t *target,
+                          bool symmetric, double max_distance)
+    {
+        CUDF_FAIL("Non-floating point operation is not supported");
+    }
+};
+
+void check_trajectories(const gdf_column& x, const gdf_column& y,
+                        const gdf_column& vertex_counts)
+{
+    CUDF_EXPECTS(x.data != nullptr && y.data != nullptr && vertex_counts.data != nullptr,
+        "x/y/vertex_counts data can not be null");
+    CUDF_EXPECTS(x.size == y.size, "x/y/must have the same size");
+    CUDF_EXPECTS(x.null_count == 0 && y.null_count == 0 && vertex_counts.null_count == 0,
+        "this version does not support x/y/vertex_counts contains nulls");
+    CUDF_EXPECTS(x.size >= vertex_counts.size, "one trajectory must have at least one point");
+}
+
 } // namespace anonymous
 
 /**
@@ -181,4 +381,64 @@ gdf_column directed_hausdorff_distance(const gdf_column& x,const gdf_column& y,c
 
     }//hausdorff_distance
 
+/**
+* @brief compute the Hausdorff distances no greater than a threshold among all pairs of
+* a set of trajectories
+* see hausdorff.hpp
+*/
+gdf_column directed_hausdorff_distance_within(const gdf_column& x, const gdf_column& y,
+                                              const gdf_column& vertex_counts,
+                                              double max_distance)
+{
+    check_trajectories(x, y, vertex_counts);
+    CUDF_EXPECTS(max_distance >= 0, "max_distance must not be negative");
+
+    long num_set = vertex_counts.size;
+    return cudf::type_dispatcher(x.dtype, Hausdorff_pairs_functor(), x, y, vertex_counts,
+                                 num_set * num_set, nullptr, nullptr, false, max_distance);
+}
+
+/**
+* @brief compute Hausdorff distances of given pairs of a set of trajectories
+* see hausdorff.hpp
+*/
+gdf_column directed_hausdorff_distance_pairs(const gdf_column& x, const gdf_column& y,
+                                             const gdf_column& vertex_counts,
+                                             const gdf_column& source,
+                                             const gdf_column& target,
+                                             bool symmetric, double max_distance)
+{
+    check_trajectories(x, y, vertex_counts);
+    CUDF_EXPECTS(source.size == target.size, "source/target must have the same size");
+    CUDF_EXPECTS(source.dtype == GDF_INT32 && target.dtype == GDF_INT32,
+        "source/target must be int32");
+    CUDF_EXPECTS(source.null_count == 0 && target.null_count == 0,
+        "this version does not support source/target contains nulls");
+    CUDF_EXPECTS(max_distance >= 0, "max_distance must not be negative");
+    CUDF_EXPECTS(source.size == 0 || (source.data != nullptr && target.data != nullptr),
+        "source/target data can not be null");
+
+    return cudf::type_dispatcher(x.dtype, Hausdorff_pairs_functor(), x, y, vertex_counts,
+                                 static_cast<long>(source.size),
+                                 static_cast<const int32_t*>(source.data),
+                                 static_cast<const int32_t*>(target.data),
+                                 symmetric, max_distance);
+}
+
+/**
+* @brief compute the symmetric Hausdorff distances of all pairs i < j of a set of
+* trajectories in the condensed layout of scipy's pdist
+* see hausdorff.hpp
+*/
+gdf_column symmetric_hausdorff_distance_condensed(const gdf_column& x, const gdf_column& y,
+                                                  const gdf_column& vertex_counts)
+{
+    check_trajectories(x, y, vertex_counts);
+
+    long num_set = vertex_counts.size;
+    return cudf::type_dispatcher(x.dtype, Hausdorff_pairs_functor(), x, y, vertex_counts,
+                                 num_set * (num_set - 1) / 2, nullptr, nullptr, true,
+                                 std::numeric_limits<double>::infinity());
+}
+
 }// namespace cuspatial
@@ -19,6 +19,13 @@
 #include <cudf/utilities/legacy/type_dispatcher.hpp>
 #include <utilities/legacy/cuda_utils.hpp>
 #include <rmm/thrust_rmm_allocator.h>
+#include <thrust/extrema.h>
+#include <thrust/gather.h>
+#include <thrust/iterator/counting_iterator.h>
+#include <thrust/iterator/permutation_iterator.h>
+#include <thrust/iterator/zip_iterator.h>
+#include <thrust/sequence.h>
+#include <thrust/transform.h>
 
 #include <utility/utility.hpp>
 #include <utility/trajectory_thrust.cuh>
@@ -28,6 +35,116 @@
 
 namespace {
 
+// number of bits needed to represent v
+int bit_width(uint64_t v)
+{
+    return v == 0 ? 0 : 64 - __builtin_clzll(v);
+}
+
+/*
+ * Compute the permutation that stably sorts points by (object id, timestamp)
+ * with a single sort, without modifying the inputs. When the ranges of ids
+ * and timestamps fit together in 64 bits, each pair is packed into one
+ * unsigned key that thrust sorts with a radix sort; otherwise the pairs are
+ * compared as tuples.
+ */
+void sort_by_id_and_time(const int32_t* id_ptr, const int64_t* time_ptr,
+                         gdf_size_type num_rec, gdf_size_type* order)
+{
+    auto exec = rmm::exec_policy(0)->on(0);
+    thrust::sequence(exec, order, order + num_rec);
+    if (num_rec == 0) return;
+
+    auto id_range = thrust::minmax_element(exec, id_ptr, id_ptr + num_rec);
+    auto time_range = thrust::minmax_element(exec, time_ptr,
+                                             time_ptr + num_rec);
+    int32_t id_min, id_max;
+    int64_t time_min, time_max;
+    CUDA_TRY(cudaMemcpy(&id_min, id_range.first, sizeof(int32_t),
+                        cudaMemcpyDeviceToHost));
+    CUDA_TRY(cudaMemcpy(&id_max, id_range.second, sizeof(int32_t),
+                        cudaMemcpyDeviceToHost));
+    CUDA_TRY(cudaMemcpy(&time_min, time_range.first, sizeof(int64_t),
+                        cudaMemcpyDeviceToHost));
+    CUDA_TRY(cudaMemcpy(&time_max, time_range.second, sizeof(int64_t),
+                        cudaMemcpyDeviceToHost));
+
+    int time_bits = bit_width(static_cast<uint64_t>(time_max) -
+                              static_cast<uint64_t>(time_min));
+    int id_bits = bit_width(static_cast<uint64_t>(
+        static_cast<int64_t>(id_max) - id_min));
+
+    if (id_bits + time_bits < 64) {
+        rmm::device_vector<uint64_t> key(num_rec);
+        thrust::transform(exec, thrust::make_counting_iterator(0),
+            thrust::make_counting_iterator(num_rec), key.begin(),
+            [=] __device__ (gdf_size_type i) {
+                uint64_t id = static_cast<uint64_t>(
+                    static_cast<int64_t>(id_ptr[i]) - id_min);
+                uint64_t time = static_cast<uint64_t>(time_ptr[i]) -
+                                static_cast<uint64_t>(time_min);
+                return (id << time_bits) | time;
+            });
+        thrust::stable_sort_by_key(exec, key.begin(), key.end(), order);
+    }
+    else {
+        rmm::device_vector<int32_t> id(id_ptr, id_ptr + num_rec);
+        rmm::device_vector<int64_t> time(time_ptr, time_ptr + num_rec);
+        auto key = thrust::make_zip_iterator(
+            thrust::make_tuple(id.begin(), time.begin()));
+        thrust::stable_sort_by_key(exec, key, key + num_rec, order);
+    }
+}
+
+/*
+ * Group points sorted by (object id, timestamp) by id into trajectories.
+ */
+template <typename IdIterator>
+gdf_size_type group_by_id(IdIterator sorted_id, gdf_size_type num_rec,
+                          gdf_column& trajectory_id,
+                          gdf_column& length,
+                          gdf_column& offset)
+{
+    //allocate sufficient memory to hold id, cnt and pos before reduce_by_key
+    rmm::device_vector<gdf_size_type> obj_count(num_rec);
+    rmm::device_vector<gdf_size_type> obj_id(num_rec);
+
+    auto end = thrust::reduce_by_key(rmm::exec_policy(0)->on(0), sorted_id,
+                                     sorted_id + num_rec,
+                                     thrust::constant_iterator<int>(1),
+                                     obj_id.begin(),
+                                     obj_count.begin());
+    gdf_size_type num_traj = end.second - obj_count.begin();
+
+    gdf_size_type* traj_id{nullptr};
+    gdf_size_type* traj_count{nullptr};
+    gdf_size_type* traj_pos{nullptr};
+    RMM_TRY( RMM_ALLOC(&traj_id,  num_traj * sizeof(gdf_size_type), 0) );
+    RMM_TRY( RMM_ALLOC(&traj_count, num_traj * sizeof(gdf_size_type), 0) );
+    RMM_TRY( RMM_ALLOC(&traj_pos, num_traj * sizeof(gdf_size_type), 0) );
+
+    thrust::copy_n(rmm::exec_policy(0)->on(0), obj_id.begin(), num_traj, traj_id);
+    thrust::copy_n(rmm::exec_policy(0)->on(0), obj_count.begin(), num_traj, traj_count);
+    thrust::inclusive_scan(rmm::exec_policy(0)->on(0), traj_count, traj_count +num_traj,
+                           traj_pos);
+
+    gdf_column_view(&trajectory_id, traj_id, nullptr, num_traj, GDF_INT32);
+    gdf_column_view(&length, traj_count, nullptr, num_traj, GDF_INT32);
+    gdf_column_view(&offset, traj_pos, nullptr, num_traj, GDF_INT32);
+
+    return num_traj;
+}
+
+// reorder `data` in place so that element i becomes data[order[i]]
+template <typename T>
+void gather_in_place(T* data, const gdf_size_type* order,
+                     gdf_size_type num_rec)
+{
+    rmm::device_vector<T> copy(data, data + num_rec);
+    thrust::gather(rmm::exec_policy(0)->on(0), order, order + num_rec,
+                   copy.begin(), data);
+}
+
 struct derive_trajectories_functor {
     template <typename T>
     static constexpr bool is_supported()
@@ -46,42 +163,18 @@ struct derive_trajectories_functor {
         T* x_ptr = static_cast<T*>(x.data);
         T* y_ptr = static_cast<T*>(y.data);
         int32_t* id_ptr = static_cast<int32_t*>(object_id.data);
-        cudf::timestamp * time_ptr =
-            static_cast<cudf::timestamp*>(timestamp.data);
+        int64_t* time_ptr = static_cast<int64_t*>(timestamp.data);
 
         gdf_size_type num_rec = object_id.size;
-        thrust::stable_sort_by_key(rmm::exec_policy(0)->on(0), time_ptr, time_ptr + num_rec,
-            thrust::make_zip_iterator(thrust::make_tuple(id_ptr, x_ptr, y_ptr)));
-        thrust::stable_sort_by_key(rmm::exec_policy(0)->on(0), id_ptr, id_ptr+num_rec,
-            thrust::make_zip_iterator(thrust::make_tuple(time_ptr, x_ptr, y_ptr)));
-
-        //allocate sufficient memory to hold id, cnt and pos before reduce_by_key
-        rmm::device_vector<gdf_size_type> obj_count(num_rec);
-        rmm::device_vector<gdf_size_type> obj_id(num_rec);
-
-        auto end = thrust::reduce_by_key(rmm::exec_policy(0)->on(0), id_ptr, id_ptr + num_rec,
-                                         thrust::constant_iterator<int>(1),
-                                         obj_id.begin(),
-                                         obj_count.begin());
-        gdf_size_type num_traj = end.second - obj_count.begin();
-
-        gdf_size_type* traj_id{nullptr};
-        gdf_size_type* traj_count{nullptr};
-        gdf_size_type* traj_pos{nullptr};
-        RMM_TRY( RMM_ALLOC(&traj_id,  num_traj * sizeof(gdf_size_type), 0) );
-        RMM_TRY( RMM_ALLOC(&traj_count, num_traj * sizeof(gdf_size_type), 0) );
-        RMM_TRY( RMM_ALLOC(&traj_pos, num_traj * sizeof(gdf_size_type), 0) );
-
-        thrust::copy_n(rmm::exec_policy(0)->on(0), obj_id.begin(), num_traj, traj_id);
-        thrust::copy_n(rmm::exec_policy(0)->on(0), obj_count.begin(), num_traj, traj_count);
-        thrust::inclusive_scan(rmm::exec_policy(0)->on(0), traj_count, traj_count +num_traj,
-                               traj_pos);
-
-        gdf_column_view(&trajectory_id, traj_id, nullptr, num_traj, GDF_INT32);
-        gdf_column_view(&length, traj_count, nullptr, num_traj, GDF_INT32);
-        gdf_column_view(&offset, traj_pos, nullptr, num_traj, GDF_INT32);
-
-        return num_traj;
+        rmm::device_vector<gdf_size_type> order(num_rec);
+        sort_by_id_and_time(id_ptr, time_ptr, num_rec, order.data().get());
+
+        gather_in_place(x_ptr, order.data().get(), num_rec);
+        gather_in_place(y_ptr, order.data().get(), num_rec);
+        gather_in_place(id_ptr, order.data().get(), num_rec);
+        gather_in_place(time_ptr, order.data().get(), num_rec);
+
+        return group_by_id(id_ptr, num_rec, trajectory_id, length, offset);
     }
 
     template <typename T, std::enable_if_t< !is_supported<T>() >* = nullptr>
@@ -134,4 +227,45 @@ gdf_size_type derive_trajectories(const gdf_column& x, const gdf_column& y,
     return num_trajectories;
 }
 
+/*
+ * Derive trajectories from object IDs and timestamps without modifying them,
+ * returning the permutation that orders points by id and timestamp.
+ * see trajectory.hpp
+*/
+gdf_size_type derive_trajectories_order(const gdf_column& object_id,
+                                        const gdf_column& timestamp,
+                                        gdf_column& trajectory_id,
+                                        gdf_column& length,
+                                        gdf_column& offset,
+                                        gdf_column& order,
+                                        bool assume_sorted)
+{
+    CUDF_EXPECTS(object_id.data != nullptr && timestamp.data != nullptr,
+                 "Null input data");
+    CUDF_EXPECTS(object_id.size == timestamp.size, "Data size mismatch");
+    CUDF_EXPECTS(object_id.dtype == GDF_INT32,
+                 "Invalid trajectory ID datatype");
+    CUDF_EXPECTS(timestamp.dtype == GDF_TIMESTAMP,
+                 "Invalid timestamp datatype");
+    CUDF_EXPECTS(object_id.null_count==0 && timestamp.null_count==0,
+                 "NULL support unimplemented");
+
+    const int32_t* id_ptr = static_cast<const int32_t*>(object_id.data);
+    const int64_t* time_ptr = static_cast<const int64_t*>(timestamp.data);
+    gdf_size_type num_rec = object_id.size;
+
+    if (assume_sorted) {
+        gdf_column_view(&order, nullptr, nullptr, 0, GDF_INT32);
+        return group_by_id(id_ptr, num_rec, trajectory_id, length, offset);
+    }
+
+    gdf_size_type* order_ptr{nullptr};
+    RMM_TRY( RMM_ALLOC(&order_ptr, num_rec * sizeof(gdf_size_type), 0) );
+    sort_by_id_and_time(id_ptr, time_ptr, num_rec, order_ptr);
+    gdf_column_view(&order, order_ptr, nullptr, num_rec, GDF_INT32);
+
+    auto sorted_id = thrust::make_permutation_iterator(id_ptr, order_ptr);
+    return group_by_id(sorted_id, num_rec, trajectory_id, length, offset);
+}
+
 }// namespace cuspatial
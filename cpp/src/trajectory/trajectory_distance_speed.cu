@@ -16,8 +16,13 @@
 
 #include <cudf/utilities/legacy/type_dispatcher.hpp>
 #include <utilities/legacy/cuda_utils.hpp>
+#include <cmath>
+#include <limits>
 #include <type_traits>
 #include <thrust/device_vector.h>
+#include <thrust/for_each.h>
+#include <thrust/iterator/counting_iterator.h>
+#include <rmm/thrust_rmm_allocator.h>
 
 #include <cuspatial/trajectory.hpp>
 
@@ -124,6 +129,108 @@ struct distspeed_functor
     }
 };
 
+/*
+ * CUDA kernel for computing the segment from the previous point of the same
+ * trajectory to every point; first[i] flags the first point of a trajectory
+ */
+template <typename T>
+__global__ void segment_kernel(gdf_size_type num_points,
+                               const T* const __restrict__ x,
+                               const T* const __restrict__ y,
+                               const cudf::timestamp * const __restrict__ time,
+                               const bool * const __restrict__ first,
+                               T* const __restrict__ dis,
+                               T* const __restrict__ dur,
+                               T* const __restrict__ sp,
+                               T* const __restrict__ bearing)
+{
+    int pid = blockIdx.x * blockDim.x + threadIdx.x;
+    if (pid >= num_points) return;
+
+    const T nan = std::numeric_limits<T>::quiet_NaN();
+    if (first[pid])
+    {
+        dis[pid] = 0;
+        dur[pid] = 0;
+        sp[pid] = nan;
+        bearing[pid] = nan;
+        return;
+    }
+    T dx = x[pid] - x[pid - 1];
+    T dy = y[pid] - y[pid - 1];
+    T ds = sqrt(dx * dx + dy * dy) * 1000; //km to m
+    T dt = static_cast<T>(unwrap(time[pid] - time[pid - 1])) / 1000; //ms to s
+    dis[pid] = ds;
+    dur[pid] = dt;
+    sp[pid] = (dt > 0) ? ds / dt : nan;
+    bearing[pid] = (ds > 0) ? atan2(dy, dx) * 180 / M_PI : nan;
+}
+
+struct segment_functor
+{
+    template <typename T>
+    static constexpr bool is_supported()
+    {
+        return std::is_floating_point<T>::value;
+    }
+
+    template <typename T, std::enable_if_t< is_supported<T>() >* = nullptr>
+    void operator()(const gdf_column& x, const gdf_column& y,
+                    const gdf_column& timestamp,
+                    const gdf_column& length, const gdf_column& offset,
+                    gdf_column& distance, gdf_column& duration,
+                    gdf_column& speed, gdf_column& bearing)
+    {
+        gdf_size_type num_points = x.size;
+        const char* names[] = {"distance", "duration", "speed", "bearing"};
+        gdf_column* outputs[] = {&distance, &duration, &speed, &bearing};
+        for (int i = 0; i < 4; i++) {
+            T* temp{nullptr};
+            RMM_TRY( RMM_ALLOC(&temp, num_points * sizeof(T), 0) );
+            gdf_column_view_augmented(outputs[i], temp, nullptr, num_points,
+                                      x.dtype, 0,
+                                      gdf_dtype_extra_info{TIME_UNIT_NONE},
+                                      names[i]);
+        }
+        if (num_points == 0) return;
+
+        // flag the first point of every trajectory
+        rmm::device_vector<bool> first(num_points, false);
+        bool* first_ptr = first.data().get();
+        const int32_t* pos = static_cast<int32_t*>(offset.data);
+        thrust::for_each(rmm::exec_policy(0)->on(0),
+            thrust::make_counting_iterator(0),
+            thrust::make_counting_iterator(length.size),
+            [=] __device__ (gdf_size_type t) {
+                gdf_size_type bp = (t == 0) ? 0 : pos[t - 1];
+                if (bp < num_points) first_ptr[bp] = true;
+            });
+        first[0] = true;
+
+        gdf_size_type min_grid_size = 0, block_size = 0;
+        CUDA_TRY( cudaOccupancyMaxPotentialBlockSize(&min_grid_size,
+                                                     &block_size,
+                                                     segment_kernel<T>) );
+        cudf::util::cuda::grid_config_1d grid{num_points, block_size, 1};
+        segment_kernel<T><<<grid.num_blocks, block_size>>>(num_points,
+            static_cast<T*>(x.data), static_cast<T*>(y.data),
+            static_cast<cudf::timestamp*>(timestamp.data), first_ptr,
+            static_cast<T*>(distance.data), static_cast<T*>(duration.data),
+            static_cast<T*>(speed.data), static_cast<T*>(bearing.data) );
+        CUDA_TRY( cudaDeviceSynchronize() );
+    }
+
+    template <typename T, std::enable_if_t< !is_supported<T>() >* = nullptr>
+    void operator()(const gdf_column& x, const gdf_column& y,
+                    const gdf_column& timestamp,
+                    const gdf_column& length, const gdf_column& offset,
+                    gdf_column& distance, gdf_column& duration,
+                    gdf_column& speed, gdf_column& bearing)
+    {
+        CUDF_FAIL("Non-floating point operation is not supported");
+    }
+};
+
 } // namespace anonymous
 
 
@@ -167,4 +274,43 @@ trajectory_distance_and_speed(const gdf_column& x, const gdf_column& y,
     return res_pair;
 }
 
+/*
+ * Compute the distance, duration, speed and bearing of every segment of
+ * trajectories
+ *
+ * see trajectory.hpp
+ */
+void trajectory_segment_distance_and_speed(const gdf_column& x,
+                                           const gdf_column& y,
+                                           const gdf_column& timestamp,
+                                           const gdf_column& length,
+                                           const gdf_column& offset,
+                                           gdf_column& distance,
+                                           gdf_column& duration,
+                                           gdf_column& speed,
+                                           gdf_column& bearing)
+{
+    CUDF_EXPECTS(x.data != nullptr && y.data != nullptr &&
+                 timestamp.data != nullptr && length.data != nullptr &&
+                 offset.data != nullptr,
+                 "Null input data");
+    CUDF_EXPECTS(x.size == y.size && x.size == timestamp.size &&
+                 length.size == offset.size, "Data size mismatch");
+    CUDF_EXPECTS(timestamp.dtype == GDF_TIMESTAMP,
+                 "Invalid timestamp datatype");
+    CUDF_EXPECTS(length.dtype == GDF_INT32,
+                 "Invalid trajectory length datatype");
+    CUDF_EXPECTS(offset.dtype == GDF_INT32,
+                 "Invalid trajectory offset datatype");
+    CUDF_EXPECTS(x.null_count == 0 && y.null_count == 0 &&
+                 timestamp.null_count == 0 &&
+                 length.null_count == 0 && offset.null_count == 0,
+                 "NULL support unimplemented");
+    CUDF_EXPECTS(x.size >= offset.size ,
+                 "Insufficient trajectory data");
+
+    cudf::type_dispatcher(x.dtype, segment_functor(), x, y, timestamp,
+                          length, offset, distance, duration, speed, bearing);
+}
+
 }// namespace cuspatial
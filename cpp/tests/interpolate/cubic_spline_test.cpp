@@ -213,3 +213,173 @@ TEST_F(CubicSplineTest, test_interpolate_full)
     }
 }
 
+
+TEST_F(CubicSplineTest, test_interpolate_between_knots)
+{
+    int point_len = 5;
+    float t[point_len] = {0, 1, 2, 3, 4};
+    float x[point_len] = {3, 2, 3, 4, 3};
+    int ids_len = 2;
+    int ids[ids_len] = {0, 0};
+    int prefix[ids_len] = {0, 5};
+    int query_len = 6;
+    float query[query_len] = {0.5, 1.5, 2.5, 3.5, 4, 0};
+    int query_ids[query_len] = {0, 0, 0, 0, 0, 0};
+    float expect[query_len] = {2.3125, 2.3125, 3.6875, 3.6875, 3, 3};
+
+    cudf::column t_column = make_device_column<float>(t, point_len);
+    cudf::column x_column = make_device_column<float>(x, point_len);
+    cudf::column ids_column = make_device_column<int>(ids, ids_len);
+    cudf::column prefix_column = make_device_column<int>(prefix, ids_len);
+    cudf::column query_column = make_device_column<float>(query, query_len);
+    cudf::column query_ids_column = make_device_column<int>(query_ids, query_len);
+
+    std::unique_ptr<cudf::experimental::table> splines =
+        cuspatial::cubicspline_coefficients(
+            t_column,
+            x_column,
+            ids_column,
+            prefix_column
+        );
+
+    std::unique_ptr<cudf::column> interpolates =
+        cuspatial::cubicspline_interpolate(
+            query_column,
+            query_ids_column,
+            prefix_column,
+            t_column,
+            splines->view()
+        );
+
+    cudf::column_view device_column = interpolates->view();
+    EXPECT_EQ(query_len, device_column.size());
+    std::vector<float> host_data;
+    host_data.resize(device_column.size());
+    cudaMemcpy(host_data.data(), device_column.data<float>(),
+          device_column.size() * sizeof(float),
+          cudaMemcpyDeviceToHost);
+
+    for(int i = 0 ; i < device_column.size() ; ++i){
+      EXPECT_FLOAT_EQ(expect[i], host_data[i]);
+    }
+}
+
+TEST_F(CubicSplineTest, test_columns)
+{
+    int point_len = 10;
+    float t[point_len] = {0, 1, 2, 3, 4, 0, 1, 2, 3, 4};
+    float x[point_len] = {3, 2, 3, 4, 3, 3, 2, 3, 4, 3};
+    float y[point_len] = {6, 4, 6, 8, 6, 6, 4, 6, 8, 6};
+    int ids_len = 3;
+    int ids[ids_len] = {0, 0, 1};
+    int prefix[ids_len] = {0, 5, 10};
+    int point_ids[point_len] = {0, 0, 0, 0, 0, 1, 1, 1, 1, 1};
+
+    cudf::column t_column = make_device_column<float>(t, point_len);
+    cudf::column x_column = make_device_column<float>(x, point_len);
+    cudf::column y_column = make_device_column<float>(y, point_len);
+    cudf::column ids_column = make_device_column<int>(ids, ids_len);
+    cudf::column prefix_column = make_device_column<int>(prefix, ids_len);
+    cudf::column point_ids_column = make_device_column<int>(point_ids, point_len);
+    cudf::table_view xy{{x_column, y_column}};
+
+    std::unique_ptr<cudf::experimental::table> splines =
+        cuspatial::cubicspline_coefficients_columns(
+            t_column,
+            xy,
+            ids_column,
+            prefix_column
+        );
+    EXPECT_EQ(8, splines->num_columns());
+
+    // y = 2x, so its coefficients are twice those of x
+    auto d_expect = get_d_expect();
+    for(int c = 0 ; c < 2 ; ++c){
+      for(unsigned int i = 0 ; i < d_expect.size() ; ++i){
+        cudf::column_view device_column = splines->view().column(4 * c + i);
+        std::vector<float> host_data;
+        host_data.resize(device_column.size());
+        cudaMemcpy(host_data.data(), device_column.data<float>(),
+              device_column.size() * sizeof(float),
+              cudaMemcpyDeviceToHost);
+        for(unsigned int j = 0 ; j < host_data.size() ; ++j ){
+          EXPECT_EQ((c + 1) * d_expect[i][j%d_expect[i].size()], host_data[j]);
+        }
+      }
+    }
+
+    std::unique_ptr<cudf::experimental::table> interpolates =
+        cuspatial::cubicspline_interpolate_columns(
+            t_column,
+            point_ids_column,
+            prefix_column,
+            t_column,
+            splines->view()
+        );
+    EXPECT_EQ(2, interpolates->num_columns());
+
+    float* expect[2] = {x, y};
+    for(int c = 0 ; c < 2 ; ++c){
+      cudf::column_view device_column = interpolates->view().column(c);
+      std::vector<float> host_data;
+      host_data.resize(device_column.size());
+      cudaMemcpy(host_data.data(), device_column.data<float>(),
+            device_column.size() * sizeof(float),
+            cudaMemcpyDeviceToHost);
+      for(int i = 0 ; i < device_column.size() ; ++i){
+        EXPECT_EQ(expect[c][i], host_data[i]);
+      }
+    }
+}
+
+TEST_F(CubicSplineTest, test_interpolate_variable_length)
+{
+    // a spline of 5 evenly spaced vertices and one of 3 uneven vertices
+    int point_len = 8;
+    float t[point_len] = {0, 1, 2, 3, 4, 0, 2, 3};
+    float x[point_len] = {3, 2, 3, 4, 3, 1, 5, 3};
+    int ids_len = 3;
+    int ids[ids_len] = {0, 0, 1};
+    int prefix[ids_len] = {0, 5, 8};
+    int query_len = 7;
+    float query[query_len] = {0.5, 3.5, 0, 1, 2, 2.5, 3};
+    int query_ids[query_len] = {0, 0, 1, 1, 1, 1, 1};
+    // natural cubic spline of the second curve: z = {0, -4, 0}
+    float expect[query_len] = {2.3125, 3.6875, 1, 4, 5, 4.25, 3};
+
+    cudf::column t_column = make_device_column<float>(t, point_len);
+    cudf::column x_column = make_device_column<float>(x, point_len);
+    cudf::column ids_column = make_device_column<int>(ids, ids_len);
+    cudf::column prefix_column = make_device_column<int>(prefix, ids_len);
+    cudf::column query_column = make_device_column<float>(query, query_len);
+    cudf::column query_ids_column = make_device_column<int>(query_ids, query_len);
+
+    std::unique_ptr<cudf::experimental::table> splines =
+        cuspatial::cubicspline_coefficients(
+            t_column,
+            x_column,
+            ids_column,
+            prefix_column
+        );
+    EXPECT_EQ(point_len - (ids_len - 1), splines->num_rows());
+
+    std::unique_ptr<cudf::column> interpolates =
+        cuspatial::cubicspline_interpolate(
+            query_column,
+            query_ids_column,
+            prefix_column,
+            t_column,
+            splines->view()
+        );
+
+    cudf::column_view device_column = interpolates->view();
+    std::vector<float> host_data;
+    host_data.resize(device_column.size());
+    cudaMemcpy(host_data.data(), device_column.data<float>(),
+          device_column.size() * sizeof(float),
+          cudaMemcpyDeviceToHost);
+
+    for(int i = 0 ; i < device_column.size() ; ++i){
+      EXPECT_NEAR(expect[i], host_data[i], 1e-5);
+    }
+}
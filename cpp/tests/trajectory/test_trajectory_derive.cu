@@ -158,3 +158,78 @@ TEST_F(TrajectoryDerive, BadData)
                                                              out_offset),
         "NULL support unimplemented");
 }
+
+TEST_F(TrajectoryDerive, DeriveOrder)
+{
+    std::vector<int32_t> sequence(column_size);
+    std::iota(sequence.begin(), sequence.end(), 0);
+
+    std::vector<int32_t> id_vector(column_size);
+    std::transform(sequence.cbegin(), sequence.cend(), id_vector.begin(),
+                   [](int32_t i) {
+                       return (i < 2 * column_size / 3) ? 0 :
+                              (i < 5 * column_size / 6) ? 1 : 2;
+                    });
+
+    std::seed_seq seed{0};
+    std::mt19937 g(seed);
+
+    std::shuffle(sequence.begin(), sequence.end(), g);
+
+    auto make_id = [&](cudf::size_type i) { return id_vector[sequence[i]]; };
+    auto make_ts = [&](cudf::size_type i) {
+        return static_cast<cudf::timestamp>(sequence[i]);
+    };
+    wrapper<int32_t> in_id(column_size, make_id);
+    wrapper<cudf::timestamp> in_ts(column_size, make_ts);
+
+    gdf_column traj_id{}, traj_len{}, traj_offset{}, order{};
+
+    gdf_size_type num_traj{0};
+    EXPECT_NO_THROW(
+        num_traj = cuspatial::derive_trajectories_order(in_id, in_ts,
+                                                        traj_id, traj_len,
+                                                        traj_offset, order);
+    );
+
+    // the i-th point in sorted order has timestamp i
+    std::vector<int32_t> expected_order(column_size);
+    for (int32_t k = 0; k < column_size; k++)
+        expected_order[sequence[k]] = k;
+
+    EXPECT_EQ(num_traj, 3);
+    EXPECT_TRUE((wrapper<gdf_size_type>{0, 1, 2}) == traj_id);
+    EXPECT_TRUE((wrapper<gdf_size_type>{2 * column_size / 3,
+                                        (column_size + 5) / 6,
+                                        (column_size + 5) / 6}) == traj_len);
+    EXPECT_TRUE((wrapper<gdf_size_type>{2 * column_size / 3,
+                                        5 * column_size / 6,
+                                        column_size}) == traj_offset);
+    EXPECT_TRUE(wrapper<gdf_size_type>(expected_order) == order);
+
+    // inputs are left untouched
+    EXPECT_TRUE(wrapper<int32_t>(column_size, make_id) == in_id);
+    EXPECT_TRUE(wrapper<cudf::timestamp>(column_size, make_ts) == in_ts);
+}
+
+TEST_F(TrajectoryDerive, DeriveOrderAssumeSorted)
+{
+    wrapper<int32_t> in_id{3, 3, 5, 7, 7, 7};
+    wrapper<cudf::timestamp> in_ts{0, 1, 0, 0, 1, 2};
+
+    gdf_column traj_id{}, traj_len{}, traj_offset{}, order{};
+
+    gdf_size_type num_traj{0};
+    EXPECT_NO_THROW(
+        num_traj = cuspatial::derive_trajectories_order(in_id, in_ts,
+                                                        traj_id, traj_len,
+                                                        traj_offset, order,
+                                                        true);
+    );
+
+    EXPECT_EQ(num_traj, 3);
+    EXPECT_EQ(order.size, 0);
+    EXPECT_TRUE((wrapper<gdf_size_type>{3, 5, 7}) == traj_id);
+    EXPECT_TRUE((wrapper<gdf_size_type>{2, 1, 3}) == traj_len);
+    EXPECT_TRUE((wrapper<gdf_size_type>{2, 3, 6}) == traj_offset);
+}
@@ -200,3 +200,43 @@ TEST_F(TrajectoryDistanceSpeed, BadData)
 
     
 }
+
+TEST_F(TrajectoryDistanceSpeed, SegmentDistanceAndSpeed)
+{
+    // two trajectories: (0,0) -> (0.003,0.004) -> (0.003,0.004), and (1,1)
+    wrapper<double> in_x{0.0, 0.003, 0.003, 1.0};
+    wrapper<double> in_y{0.0, 0.004, 0.004, 1.0};
+    wrapper<cudf::timestamp> in_ts{0, 1000, 1000, 0};
+    wrapper<gdf_size_type> traj_len{3, 1};
+    wrapper<gdf_size_type> traj_offset{3, 4};
+
+    gdf_column distance{}, duration{}, speed{}, bearing{};
+    EXPECT_NO_THROW(
+        cuspatial::trajectory_segment_distance_and_speed(in_x, in_y, in_ts,
+                                                         traj_len, traj_offset,
+                                                         distance, duration,
+                                                         speed, bearing);
+    );
+    EXPECT_EQ(distance.size, 4);
+
+    std::vector<double> gpu[4];
+    gdf_column* outputs[] = {&distance, &duration, &speed, &bearing};
+    for (int i = 0; i < 4; i++) {
+        gpu[i].resize(4);
+        cudaMemcpy(gpu[i].data(), outputs[i]->data, 4 * sizeof(double),
+                   cudaMemcpyDefault);
+    }
+
+    std::vector<double> expected_distance{0, 5, 0, 0};
+    std::vector<double> expected_duration{0, 1, 0, 0};
+    for (int i = 0; i < 4; i++) {
+        EXPECT_NEAR(gpu[0][i], expected_distance[i], 1e-9);
+        EXPECT_NEAR(gpu[1][i], expected_duration[i], 1e-9);
+    }
+    EXPECT_NEAR(gpu[2][1], 5, 1e-9);
+    EXPECT_NEAR(gpu[3][1], atan2(0.004, 0.003) * 180 / M_PI, 1e-9);
+    // first points and zero-length or zero-duration segments
+    EXPECT_TRUE(std::isnan(gpu[2][0]) && std::isnan(gpu[3][0]));
+    EXPECT_TRUE(std::isnan(gpu[2][2]) && std::isnan(gpu[3][2]));
+    EXPECT_TRUE(std::isnan(gpu[2][3]) && std::isnan(gpu[3][3]));
+}
@@ -1,5 +1,6 @@
 from .core import interpolate
 from .core.gis import (
+    directed_hausdorff_blocked,
     directed_hausdorff_distance,
     haversine_distance,
     lonlat_to_xy_km_coordinates,
@@ -7,17 +8,53 @@ from .core.gis import (
     window_points,
 )
 from .core.interpolate import CubicSpline
+from .core.point_index import PointIndex
+from .core.simplify import simplify_trajectories
+from .core.spatial_join import point_in_polygon_join, points_in_windows
 from .core.trajectory import (
     derive,
     distance_and_speed,
     spatial_bounds,
     subset_trajectory_id,
 )
+from .core.trajectory_store import TrajectoryStore
+from .io.arrow import (
+    read_points_arrow,
+    read_points_parquet,
+    read_polygons_arrow,
+    read_polygons_parquet,
+    write_points_arrow,
+    write_points_parquet,
+    write_polygons_arrow,
+    write_polygons_parquet,
+)
+from .io.container import map_container, read_container, write_container
+from .io.json_soa import json_to_soa
+from .io.polygon_catalog import read_polygon_catalog
 from .io.shapefile import read_polygon_shapefile
 from .io.soa import (
+    decode_its_timestamps,
+    encode_its_timestamps,
+    its_timestamps_to_datetime,
+    iter_its_timestamps,
+    iter_points_lonlat,
+    iter_points_soa,
+    iter_points_xy_km,
+    iter_uint,
     read_its_timestamps,
     read_points_lonlat,
     read_points_xy_km,
     read_polygon,
     read_uint,
+    write_its_timestamps,
+    write_points_lonlat,
+    write_points_xy_km,
+    write_polygon,
+    write_uint,
+)
+from .io.soa_mmap import (
+    map_its_timestamps,
+    map_points_lonlat,
+    map_points_xy_km,
+    map_uint,
 )
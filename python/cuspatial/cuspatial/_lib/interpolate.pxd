@@ -27,3 +27,20 @@ cdef extern from "cubic_spline.hpp" namespace "cuspatial" nogil:
         const column_view & old_t,
         const table_view & coefficients
     ) except +
+
+    cdef unique_ptr[table] cpp_cubicspline_coefficients_columns \
+        "cuspatial::cubicspline_coefficients_columns" (
+        const column_view & t,
+        const table_view & y,
+        const column_view & ids,
+        const column_view & prefix_sums
+    ) except +
+
+    cdef unique_ptr[table] cpp_cubicspline_interpolate_columns \
+        "cuspatial::cubicspline_interpolate_columns" (
+        const column_view & p,
+        const column_view & ids,
+        const column_view & prefix_sums,
+        const column_view & old_t,
+        const table_view & coefficients
+    ) except +
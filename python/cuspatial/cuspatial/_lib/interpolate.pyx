@@ -57,3 +57,54 @@ cpdef cubicspline_interpolate(
         )
     result = Column.from_unique_ptr(move(c_result))
     return result
+
+cpdef cubicspline_coefficients_columns(
+    Column t,
+    Table y,
+    Column ids,
+    Column prefixes,
+    names
+):
+    t_v = t.view()
+    y_v = y.data_view()
+    ids_v = ids.view()
+    prefixes_v = prefixes.view()
+    cdef unique_ptr[table] c_result
+    with nogil:
+        c_result = move(
+            cpp_cubicspline_coefficients_columns(
+                t_v,
+                y_v,
+                ids_v,
+                prefixes_v
+            )
+        )
+    result = Table.from_unique_ptr(move(c_result), names)
+    return result
+
+cpdef cubicspline_interpolate_columns(
+    Column points,
+    Column ids,
+    Column prefixes,
+    Column original_t,
+    Table coefficients,
+    names
+):
+    p_v = points.view()
+    ids_v = ids.view()
+    prefixes_v = prefixes.view()
+    original_t_v = original_t.view()
+    coefs_v = coefficients.data_view()
+    cdef unique_ptr[table] c_result
+    with nogil:
+        c_result = move(
+            cpp_cubicspline_interpolate_columns(
+                p_v,
+                ids_v,
+                prefixes_v,
+                original_t_v,
+                coefs_v
+            )
+        )
+    result = Table.from_unique_ptr(move(c_result), names)
+    return result
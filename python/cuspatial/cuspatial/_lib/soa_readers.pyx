@@ -71,23 +71,23 @@ cpdef cpp_read_pnt_xy_soa(soa_file_name):
 cpdef cpp_read_polygon_soa(soa_file_name):
     cdef bytes py_bytes = soa_file_name.encode()
     cdef char* c_string = py_bytes
-    cdef gdf_column* c_ply_fpos = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_ply_rpos = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_ply_x = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_ply_y = <gdf_column*>malloc(sizeof(gdf_column))
+    cdef gdf_column c_ply_fpos
+    cdef gdf_column c_ply_rpos
+    cdef gdf_column c_ply_x
+    cdef gdf_column c_ply_y
 
     with nogil:
         read_polygon_soa(
             c_string,
-            c_ply_fpos,
-            c_ply_rpos,
-            c_ply_x,
-            c_ply_y
+            &c_ply_fpos,
+            &c_ply_rpos,
+            &c_ply_x,
+            &c_ply_y
         )
 
-    f_pos = gdf_column_to_column(c_ply_fpos)
-    r_pos = gdf_column_to_column(c_ply_rpos)
-    x = gdf_column_to_column(c_ply_x)
-    y = gdf_column_to_column(c_ply_y)
+    f_pos = gdf_column_to_column(&c_ply_fpos)
+    r_pos = gdf_column_to_column(&c_ply_rpos)
+    x = gdf_column_to_column(&c_ply_x)
+    y = gdf_column_to_column(&c_ply_y)
 
     return f_pos, r_pos, x, y
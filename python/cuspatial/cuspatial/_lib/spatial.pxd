@@ -6,6 +6,7 @@
 # cython: language_level = 3
 
 from cudf._lib.cudf cimport *
+from libcpp cimport bool
 from libcpp.pair cimport pair
 
 cdef extern from "point_in_polygon.hpp" namespace "cuspatial" nogil:
@@ -40,6 +41,26 @@ cdef extern from "hausdorff.hpp" namespace "cuspatial" nogil:
         const gdf_column& coor_y,
         const gdf_column& cnt
     ) except +
+    gdf_column directed_hausdorff_distance_within(
+        const gdf_column& coor_x,
+        const gdf_column& coor_y,
+        const gdf_column& cnt,
+        double max_distance
+    ) except +
+    gdf_column directed_hausdorff_distance_pairs(
+        const gdf_column& coor_x,
+        const gdf_column& coor_y,
+        const gdf_column& cnt,
+        const gdf_column& source,
+        const gdf_column& target,
+        bool symmetric,
+        double max_distance
+    ) except +
+    gdf_column symmetric_hausdorff_distance_condensed(
+        const gdf_column& coor_x,
+        const gdf_column& coor_y,
+        const gdf_column& cnt
+    ) except +
 
 cdef extern from "query.hpp" namespace "cuspatial" nogil:
     cdef pair[gdf_column, gdf_column] spatial_window_points(
@@ -9,19 +9,23 @@
 from cudf._lib.cudf import *
 from cudf._lib.cudf cimport *
 from cudf import Series
+from libcpp cimport bool
 from libcpp.pair cimport pair
 
 from libc.stdlib cimport calloc, malloc, free
 
+from cuspatial.utils.column_utils import column_as, float_dtype
+
 cpdef cpp_point_in_polygon_bitmap(
     points_x, points_y, poly_fpos, poly_rpos, poly_x, poly_y
 ):
-    points_x = points_x.astype('float64')._column
-    points_y = points_y.astype('float64')._column
-    poly_fpos = poly_fpos.astype('int32')._column
-    poly_rpos = poly_rpos.astype('int32')._column
-    poly_x = poly_x.astype('float64')._column
-    poly_y = poly_y.astype('float64')._column
+    dtype = float_dtype(points_x, points_y, poly_x, poly_y)
+    points_x = column_as(points_x, dtype)
+    points_y = column_as(points_y, dtype)
+    poly_fpos = column_as(poly_fpos, 'int32')
+    poly_rpos = column_as(poly_rpos, 'int32')
+    poly_x = column_as(poly_x, dtype)
+    poly_y = column_as(poly_y, dtype)
     cdef gdf_column* c_points_x = column_view_from_column(points_x)
     cdef gdf_column* c_points_y = column_view_from_column(points_y)
 
@@ -30,10 +34,10 @@ cpdef cpp_point_in_polygon_bitmap(
 
     cdef gdf_column* c_poly_x = column_view_from_column(poly_x)
     cdef gdf_column* c_poly_y = column_view_from_column(poly_y)
-    cdef gdf_column* result_bitmap = <gdf_column*>malloc(sizeof(gdf_column))
+    cdef gdf_column result_bitmap
 
     with nogil:
-        result_bitmap[0] = point_in_polygon_bitmap(
+        result_bitmap = point_in_polygon_bitmap(
             c_points_x[0],
             c_points_y[0],
             c_poly_fpos[0],
@@ -48,26 +52,25 @@ cpdef cpp_point_in_polygon_bitmap(
     free(c_poly_rpos)
     free(c_poly_x)
     free(c_poly_y)
-    result = gdf_column_to_column(result_bitmap)
-    free(result_bitmap)
 
-    return result
+    return gdf_column_to_column(&result_bitmap)
 
 cpdef cpp_haversine_distance(x1, y1, x2, y2):
-    x1 = x1.astype('float64')._column
-    y1 = y1.astype('float64')._column
-    x2 = x2.astype('float64')._column
-    y2 = y2.astype('float64')._column
+    dtype = float_dtype(x1, y1, x2, y2)
+    x1 = column_as(x1, dtype)
+    y1 = column_as(y1, dtype)
+    x2 = column_as(x2, dtype)
+    y2 = column_as(y2, dtype)
 
     cdef gdf_column* c_x1 = column_view_from_column(x1)
     cdef gdf_column* c_y1 = column_view_from_column(y1)
     cdef gdf_column* c_x2 = column_view_from_column(x2)
     cdef gdf_column* c_y2 = column_view_from_column(y2)
 
-    cdef gdf_column* c_h_dist = <gdf_column*>malloc(sizeof(gdf_column))
+    cdef gdf_column c_h_dist
 
     with nogil:
-        c_h_dist[0] = haversine_distance(
+        c_h_dist = haversine_distance(
             c_x1[0],
             c_y1[0],
             c_x2[0],
@@ -79,16 +82,15 @@ cpdef cpp_haversine_distance(x1, y1, x2, y2):
     free(c_x2)
     free(c_y2)
 
-    result = Series(gdf_column_to_column(c_h_dist))
-    free(c_h_dist)
 
-    return result
+    return Series(gdf_column_to_column(&c_h_dist))
 
 cpdef cpp_lonlat2coord(cam_lon, cam_lat, in_lon, in_lat):
     cam_lon = np.float64(cam_lon)
     cam_lat = np.float64(cam_lat)
-    in_lon = in_lon.astype('float64')._column
-    in_lat = in_lat.astype('float64')._column
+    dtype = float_dtype(in_lon, in_lat)
+    in_lon = column_as(in_lon, dtype)
+    in_lat = column_as(in_lat, dtype)
     cdef gdf_scalar* c_cam_lon = gdf_scalar_from_scalar(cam_lon)
     cdef gdf_scalar* c_cam_lat = gdf_scalar_from_scalar(cam_lat)
     cdef gdf_column* c_in_lon = column_view_from_column(in_lon)
@@ -104,6 +106,8 @@ cpdef cpp_lonlat2coord(cam_lon, cam_lat, in_lon, in_lat):
             c_in_lat[0]
         )
 
+    free(c_cam_lon)
+    free(c_cam_lat)
     free(c_in_lon)
     free(c_in_lat)
 
@@ -111,29 +115,117 @@ cpdef cpp_lonlat2coord(cam_lon, cam_lat, in_lon, in_lat):
             Series(gdf_column_to_column(&coords.second)))
 
 cpdef cpp_directed_hausdorff_distance(coor_x, coor_y, cnt):
-    coor_x = coor_x.astype('float64')._column
-    coor_y = coor_y.astype('float64')._column
-    cnt = cnt.astype('int32')._column
+    dtype = float_dtype(coor_x, coor_y)
+    coor_x = column_as(coor_x, dtype)
+    coor_y = column_as(coor_y, dtype)
+    cnt = column_as(cnt, 'int32')
     cdef gdf_column* c_coor_x = column_view_from_column(coor_x)
     cdef gdf_column* c_coor_y = column_view_from_column(coor_y)
     cdef gdf_column* c_cnt = column_view_from_column(cnt)
-    cdef gdf_column* c_dist = <gdf_column*>malloc(sizeof(gdf_column))
+    cdef gdf_column c_dist
     with nogil:
-        c_dist[0] = directed_hausdorff_distance(
+        c_dist = directed_hausdorff_distance(
             c_coor_x[0],
             c_coor_y[0],
             c_cnt[0]
         )
 
-    return Series(gdf_column_to_column(c_dist))
+    free(c_coor_x)
+    free(c_coor_y)
+    free(c_cnt)
+
+    return Series(gdf_column_to_column(&c_dist))
+
+cpdef cpp_directed_hausdorff_within(coor_x, coor_y, cnt, max_distance):
+    dtype = float_dtype(coor_x, coor_y)
+    coor_x = column_as(coor_x, dtype)
+    coor_y = column_as(coor_y, dtype)
+    cnt = column_as(cnt, 'int32')
+    cdef gdf_column* c_coor_x = column_view_from_column(coor_x)
+    cdef gdf_column* c_coor_y = column_view_from_column(coor_y)
+    cdef gdf_column* c_cnt = column_view_from_column(cnt)
+    cdef double c_max_distance = max_distance
+    cdef gdf_column c_dist
+    with nogil:
+        c_dist = directed_hausdorff_distance_within(
+            c_coor_x[0],
+            c_coor_y[0],
+            c_cnt[0],
+            c_max_distance
+        )
+
+    free(c_coor_x)
+    free(c_coor_y)
+    free(c_cnt)
+
+    return Series(gdf_column_to_column(&c_dist))
+
+cpdef cpp_directed_hausdorff_pairs(coor_x, coor_y, cnt, source, target,
+                                   symmetric, max_distance):
+    dtype = float_dtype(coor_x, coor_y)
+    coor_x = column_as(coor_x, dtype)
+    coor_y = column_as(coor_y, dtype)
+    cnt = column_as(cnt, 'int32')
+    source = column_as(source, 'int32')
+    target = column_as(target, 'int32')
+    cdef gdf_column* c_coor_x = column_view_from_column(coor_x)
+    cdef gdf_column* c_coor_y = column_view_from_column(coor_y)
+    cdef gdf_column* c_cnt = column_view_from_column(cnt)
+    cdef gdf_column* c_source = column_view_from_column(source)
+    cdef gdf_column* c_target = column_view_from_column(target)
+    cdef bool c_symmetric = symmetric
+    cdef double c_max_distance = max_distance
+    cdef gdf_column c_dist
+    with nogil:
+        c_dist = directed_hausdorff_distance_pairs(
+            c_coor_x[0],
+            c_coor_y[0],
+            c_cnt[0],
+            c_source[0],
+            c_target[0],
+            c_symmetric,
+            c_max_distance
+        )
+
+    free(c_coor_x)
+    free(c_coor_y)
+    free(c_cnt)
+    free(c_source)
+    free(c_target)
+
+    return Series(gdf_column_to_column(&c_dist))
+
+cpdef cpp_symmetric_hausdorff_condensed(coor_x, coor_y, cnt):
+    dtype = float_dtype(coor_x, coor_y)
+    coor_x = column_as(coor_x, dtype)
+    coor_y = column_as(coor_y, dtype)
+    cnt = column_as(cnt, 'int32')
+    cdef gdf_column* c_coor_x = column_view_from_column(coor_x)
+    cdef gdf_column* c_coor_y = column_view_from_column(coor_y)
+    cdef gdf_column* c_cnt = column_view_from_column(cnt)
+    cdef gdf_column c_dist
+    with nogil:
+        c_dist = symmetric_hausdorff_distance_condensed(
+            c_coor_x[0],
+            c_coor_y[0],
+            c_cnt[0]
+        )
+
+    free(c_coor_x)
+    free(c_coor_y)
+    free(c_cnt)
+
+    return Series(gdf_column_to_column(&c_dist))
 
 cpdef cpp_spatial_window_points(left, bottom, right, top, x, y):
-    left = np.float64(left)
-    bottom = np.float64(bottom)
-    right = np.float64(right)
-    top = np.float64(top)
-    x = x.astype('float64')._column
-    y = y.astype('float64')._column
+    # the window bounds are read as the type of the points
+    dtype = float_dtype(x, y)
+    left = dtype.type(left)
+    bottom = dtype.type(bottom)
+    right = dtype.type(right)
+    top = dtype.type(top)
+    x = column_as(x, dtype)
+    y = column_as(y, dtype)
     cdef gdf_scalar* c_left = gdf_scalar_from_scalar(left)
     cdef gdf_scalar* c_bottom = gdf_scalar_from_scalar(bottom)
     cdef gdf_scalar* c_right = gdf_scalar_from_scalar(right)
@@ -142,9 +234,6 @@ cpdef cpp_spatial_window_points(left, bottom, right, top, x, y):
     cdef gdf_column* c_x = column_view_from_column(x)
     cdef gdf_column* c_y = column_view_from_column(y)
 
-    cdef gdf_column* c_out_x = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_out_y = <gdf_column*>malloc(sizeof(gdf_column))
-
     cdef pair[gdf_column, gdf_column] xy
 
     with nogil:
@@ -157,5 +246,12 @@ cpdef cpp_spatial_window_points(left, bottom, right, top, x, y):
             c_y[0]
         )
 
+    free(c_left)
+    free(c_bottom)
+    free(c_right)
+    free(c_top)
+    free(c_x)
+    free(c_y)
+
     return (Series(gdf_column_to_column(&xy.first)),
             Series(gdf_column_to_column(&xy.second)))
@@ -6,6 +6,7 @@
 # cython: language_level = 3
 
 from cudf._lib.cudf cimport *
+from libcpp cimport bool
 from libcpp.pair cimport pair
 
 cdef extern from "trajectory.hpp" namespace "cuspatial" nogil:
@@ -20,6 +21,16 @@ cdef extern from "trajectory.hpp" namespace "cuspatial" nogil:
         gdf_column& pos
     ) except +
 
+    cdef size_type derive_trajectories_order(
+        const gdf_column& pid,
+        const gdf_column& ts,
+        gdf_column& tid,
+        gdf_column& len,
+        gdf_column& pos,
+        gdf_column& order,
+        bool assume_sorted
+    ) except +
+
     cdef pair[gdf_column, gdf_column] trajectory_distance_and_speed(
         const gdf_column& x,
         const gdf_column& y,
@@ -28,6 +39,18 @@ cdef extern from "trajectory.hpp" namespace "cuspatial" nogil:
         const gdf_column& pos
     ) except +
 
+    cdef void trajectory_segment_distance_and_speed(
+        const gdf_column& x,
+        const gdf_column& y,
+        const gdf_column& ts,
+        const gdf_column& len,
+        const gdf_column& pos,
+        gdf_column& distance,
+        gdf_column& duration,
+        gdf_column& speed,
+        gdf_column& bearing
+    ) except +
+
     cdef void trajectory_spatial_bounds(
         const gdf_column& x,
         const gdf_column& y,
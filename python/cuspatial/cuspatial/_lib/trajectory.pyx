@@ -10,33 +10,42 @@ from cudf import Series, DataFrame
 from cudf._lib.cudf import *
 
 from libc.stdlib cimport calloc, malloc, free
+from libcpp cimport bool
 from libcpp.pair cimport pair
 
+from cuspatial.utils.column_utils import column_as, float_dtype
+
 cpdef cpp_derive_trajectories(x, y, object_id, timestamp):
-    x = x.astype('float64')._column
-    y = y.astype('float64')._column
-    object_id = object_id.astype('int32')._column
-    timestamp = timestamp.astype('datetime64[ms]')._column
+    dtype = float_dtype(x, y)
+    x = column_as(x, dtype)
+    y = column_as(y, dtype)
+    object_id = column_as(object_id, 'int32')
+    timestamp = column_as(timestamp, 'datetime64[ms]')
     cdef gdf_column* c_x = column_view_from_column(x)
     cdef gdf_column* c_y = column_view_from_column(y)
     cdef gdf_column* c_object_id = column_view_from_column(object_id)
     cdef gdf_column* c_timestamp = column_view_from_column(timestamp)
-    cdef gdf_column* c_trajectory_id = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_length = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_pos = <gdf_column*>malloc(sizeof(gdf_column))
+    cdef gdf_column c_trajectory_id
+    cdef gdf_column c_length
+    cdef gdf_column c_pos
 
     with nogil:
         num_trajectories = derive_trajectories(
             c_x[0], c_y[0],
             c_object_id[0],
             c_timestamp[0],
-            c_trajectory_id[0],
-            c_length[0], c_pos[0]
+            c_trajectory_id,
+            c_length, c_pos
         )
 
-    trajectory_id = gdf_column_to_column(c_trajectory_id)
-    length = gdf_column_to_column(c_length)
-    pos = gdf_column_to_column(c_pos)
+    free(c_x)
+    free(c_y)
+    free(c_object_id)
+    free(c_timestamp)
+
+    trajectory_id = gdf_column_to_column(&c_trajectory_id)
+    length = gdf_column_to_column(&c_length)
+    pos = gdf_column_to_column(&c_pos)
 
     return (
         num_trajectories,
@@ -50,12 +59,57 @@ cpdef cpp_derive_trajectories(x, y, object_id, timestamp):
     )
 
 
+cpdef cpp_derive_trajectories_order(object_id, timestamp, assume_sorted):
+    object_id = column_as(object_id, 'int32')
+    timestamp = column_as(timestamp, 'datetime64[ms]')
+    cdef gdf_column* c_object_id = column_view_from_column(object_id)
+    cdef gdf_column* c_timestamp = column_view_from_column(timestamp)
+    cdef gdf_column c_trajectory_id
+    cdef gdf_column c_length
+    cdef gdf_column c_pos
+    cdef gdf_column c_order
+    cdef bool c_assume_sorted = assume_sorted
+
+    with nogil:
+        num_trajectories = derive_trajectories_order(
+            c_object_id[0],
+            c_timestamp[0],
+            c_trajectory_id,
+            c_length, c_pos,
+            c_order,
+            c_assume_sorted
+        )
+
+    trajectory_id = gdf_column_to_column(&c_trajectory_id)
+    length = gdf_column_to_column(&c_length)
+    pos = gdf_column_to_column(&c_pos)
+    if assume_sorted:
+        order = None
+    else:
+        order = Series(gdf_column_to_column(&c_order))
+    free(c_object_id)
+    free(c_timestamp)
+
+    return (
+        num_trajectories,
+        DataFrame(
+            {
+                'trajectory_id': Series(trajectory_id),
+                'length': Series(length),
+                'position': Series(pos)
+            }
+        ),
+        order
+    )
+
+
 cpdef cpp_trajectory_distance_and_speed(x, y, timestamp, length, pos):
-    x = x.astype('float64')._column
-    y = y.astype('float64')._column
-    timestamp = timestamp.astype('datetime64[ms]')._column
-    length = length.astype('int32')._column
-    pos = pos.astype('int32')._column
+    dtype = float_dtype(x, y)
+    x = column_as(x, dtype)
+    y = column_as(y, dtype)
+    timestamp = column_as(timestamp, 'datetime64[ms]')
+    length = column_as(length, 'int32')
+    pos = column_as(pos, 'int32')
     cdef gdf_column* c_x = column_view_from_column(x)
     cdef gdf_column* c_y = column_view_from_column(y)
     cdef gdf_column* c_timestamp = column_view_from_column(timestamp)
@@ -68,24 +122,68 @@ cpdef cpp_trajectory_distance_and_speed(x, y, timestamp, length, pos):
                                                          c_timestamp[0],
                                                          c_length[0], c_pos[0])
 
+    free(c_x)
+    free(c_y)
+    free(c_timestamp)
+    free(c_length)
+    free(c_pos)
     dist = gdf_column_to_column(&c_distance_speed.first)
     speed = gdf_column_to_column(&c_distance_speed.second)
 
     return Series(dist), Series(speed)
 
+cpdef cpp_trajectory_segment_distance_and_speed(x, y, timestamp, length,
+                                                pos):
+    dtype = float_dtype(x, y)
+    x = column_as(x, dtype)
+    y = column_as(y, dtype)
+    timestamp = column_as(timestamp, 'datetime64[ms]')
+    length = column_as(length, 'int32')
+    pos = column_as(pos, 'int32')
+    cdef gdf_column* c_x = column_view_from_column(x)
+    cdef gdf_column* c_y = column_view_from_column(y)
+    cdef gdf_column* c_timestamp = column_view_from_column(timestamp)
+    cdef gdf_column* c_length = column_view_from_column(length)
+    cdef gdf_column* c_pos = column_view_from_column(pos)
+    cdef gdf_column c_distance
+    cdef gdf_column c_duration
+    cdef gdf_column c_speed
+    cdef gdf_column c_bearing
+
+    with nogil:
+        trajectory_segment_distance_and_speed(c_x[0], c_y[0],
+                                              c_timestamp[0],
+                                              c_length[0], c_pos[0],
+                                              c_distance, c_duration,
+                                              c_speed, c_bearing)
+
+    free(c_x)
+    free(c_y)
+    free(c_timestamp)
+    free(c_length)
+    free(c_pos)
+
+    distance = gdf_column_to_column(&c_distance)
+    duration = gdf_column_to_column(&c_duration)
+    speed = gdf_column_to_column(&c_speed)
+    bearing = gdf_column_to_column(&c_bearing)
+
+    return Series(distance), Series(duration), Series(speed), Series(bearing)
+
 cpdef cpp_trajectory_spatial_bounds(coor_x, coor_y, length, pos):
-    coor_x = coor_x.astype('float64')._column
-    coor_y = coor_y.astype('float64')._column
-    length = length.astype('int32')._column
-    pos = pos.astype('int32')._column
+    dtype = float_dtype(coor_x, coor_y)
+    coor_x = column_as(coor_x, dtype)
+    coor_y = column_as(coor_y, dtype)
+    length = column_as(length, 'int32')
+    pos = column_as(pos, 'int32')
     cdef gdf_column* c_coor_x = column_view_from_column(coor_x)
     cdef gdf_column* c_coor_y = column_view_from_column(coor_y)
     cdef gdf_column* c_length = column_view_from_column(length)
     cdef gdf_column* c_pos = column_view_from_column(pos)
-    cdef gdf_column* c_x1 = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_x2 = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_y1 = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_y2 = <gdf_column*>malloc(sizeof(gdf_column))
+    cdef gdf_column c_x1
+    cdef gdf_column c_x2
+    cdef gdf_column c_y1
+    cdef gdf_column c_y2
 
     with nogil:
         trajectory_spatial_bounds(
@@ -93,45 +191,57 @@ cpdef cpp_trajectory_spatial_bounds(coor_x, coor_y, length, pos):
             c_coor_y[0],
             c_length[0],
             c_pos[0],
-            c_x1[0],
-            c_y1[0],
-            c_x2[0],
-            c_y2[0]
+            c_x1,
+            c_y1,
+            c_x2,
+            c_y2
         )
 
-    x1 = gdf_column_to_column(c_x1)
-    x2 = gdf_column_to_column(c_x2)
-    y1 = gdf_column_to_column(c_y1)
-    y2 = gdf_column_to_column(c_y2)
+    free(c_coor_x)
+    free(c_coor_y)
+    free(c_length)
+    free(c_pos)
+
+    x1 = gdf_column_to_column(&c_x1)
+    x2 = gdf_column_to_column(&c_x2)
+    y1 = gdf_column_to_column(&c_y1)
+    y2 = gdf_column_to_column(&c_y2)
 
     return DataFrame({'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2})
 
 cpdef cpp_subset_trajectory_id(ids, in_x, in_y, in_id, in_timestamp):
-    ids = ids.astype('int32')._column
-    in_x = in_x.astype('float64')._column
-    in_y = in_y.astype('float64')._column
-    in_id = in_id.astype('int32')._column
-    in_timestamp = in_timestamp.astype('datetime64[ms]')._column
+    ids = column_as(ids, 'int32')
+    dtype = float_dtype(in_x, in_y)
+    in_x = column_as(in_x, dtype)
+    in_y = column_as(in_y, dtype)
+    in_id = column_as(in_id, 'int32')
+    in_timestamp = column_as(in_timestamp, 'datetime64[ms]')
     cdef gdf_column* c_id = column_view_from_column(ids)
     cdef gdf_column* c_in_x = column_view_from_column(in_x)
     cdef gdf_column* c_in_y = column_view_from_column(in_y)
     cdef gdf_column* c_in_id = column_view_from_column(in_id)
     cdef gdf_column* c_in_timestamp = column_view_from_column(in_timestamp)
 
-    cdef gdf_column* c_out_x = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_out_y = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_out_id = <gdf_column*>malloc(sizeof(gdf_column))
-    cdef gdf_column* c_out_timestamp = <gdf_column*>malloc(sizeof(gdf_column))
+    cdef gdf_column c_out_x
+    cdef gdf_column c_out_y
+    cdef gdf_column c_out_id
+    cdef gdf_column c_out_timestamp
 
     with nogil:
         count = subset_trajectory_id(c_id[0], c_in_x[0], c_in_y[0], c_in_id[0],
-                                     c_in_timestamp[0], c_out_x[0], c_out_y[0],
-                                     c_out_id[0], c_out_timestamp[0])
-
-    x = gdf_column_to_column(c_out_x)
-    y = gdf_column_to_column(c_out_y)
-    ids = gdf_column_to_column(c_out_id)
-    timestamp = gdf_column_to_column(c_out_timestamp)
+                                     c_in_timestamp[0], c_out_x, c_out_y,
+                                     c_out_id, c_out_timestamp)
+
+    free(c_id)
+    free(c_in_x)
+    free(c_in_y)
+    free(c_in_id)
+    free(c_in_timestamp)
+
+    x = gdf_column_to_column(&c_out_x)
+    y = gdf_column_to_column(&c_out_y)
+    ids = gdf_column_to_column(&c_out_id)
+    timestamp = gdf_column_to_column(&c_out_timestamp)
 
     return DataFrame({'x': Series(x),
                       'y': Series(y),
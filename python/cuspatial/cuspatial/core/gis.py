@@ -1,18 +1,27 @@
 # Copyright (c) 2019, NVIDIA CORPORATION.
 
-from cudf import DataFrame
+import cupy as cp
+import numpy as np
+
+from cudf import DataFrame, Series
 
 from cuspatial._lib.spatial import (
     cpp_directed_hausdorff_distance,
+    cpp_directed_hausdorff_pairs,
+    cpp_directed_hausdorff_within,
     cpp_haversine_distance,
     cpp_lonlat2coord,
     cpp_point_in_polygon_bitmap,
     cpp_spatial_window_points,
+    cpp_symmetric_hausdorff_condensed,
 )
-from cuspatial.utils import gis_utils
+from cuspatial.utils import gis_utils, hausdorff_utils
+from cuspatial.utils.column_utils import to_host
 
 
-def directed_hausdorff_distance(x, y, count):
+def directed_hausdorff_distance(
+    x, y, count, max_distance=None, symmetric=False, pairs=None
+):
     """ Compute the directed Hausdorff distances between all pairs of
     trajectories.
 
@@ -20,6 +29,20 @@ def directed_hausdorff_distance(x, y, count):
     x: x coordinates
     y: y coordinates
     count: size of each trajectory
+    max_distance: if given, only report pairs whose distance is at most
+                  `max_distance`, as a sparse table. Uses the early-break
+                  algorithm of Taha and Hanbury on the GPU: a point stops
+                  scanning the other trajectory once it cannot raise the
+                  running maximum, and a pair is abandoned as soon as it
+                  exceeds the threshold.
+    symmetric: if True, compute the symmetric Hausdorff distance
+               max(h(i, j), h(j, i)) of each pair i < j only, returned as a
+               condensed vector in the layout of scipy.spatial.distance.pdist.
+               The second direction of a pair breaks early against the
+               first.
+    pairs: optional tuple of (i, j) trajectory index arrays; only the
+           distances of these pairs are computed on the GPU, in the given
+           order.
 
     Parameters
     ----------
@@ -56,15 +79,182 @@ def directed_hausdorff_distance(x, y, count):
         0  0.0  1.414214
         1  2.0  0.000000
 
+        result = cuspatial.directed_hausdorff_distance(
+            cudf.Series([0, 1, 0, 0]),
+            cudf.Series([0, 0, 1, 2]),
+            cudf.Series([2, 2,]),
+            max_distance=1.5,
+        )
+        print(result)
+           source  target  distance
+        0       0       0  0.000000
+        1       0       1  1.414214
+        2       1       1  0.000000
+
+        result = cuspatial.directed_hausdorff_distance(
+            cudf.Series([0, 1, 0, 0]),
+            cudf.Series([0, 0, 1, 2]),
+            cudf.Series([2, 2,]),
+            symmetric=True,
+        )
+        print(result)
+        0    2.0
+        dtype: float64
+
     Returns
     -------
     DataFrame: The pairwise directed distance matrix with one row and one
     column per input trajectory; the value at row i, column j represents the
     hausdorff distance from trajectory i to trajectory j.
+    With `max_distance`, a DataFrame of int32 'source' and 'target'
+    trajectory indices and float64 'distance' for each pair within
+    `max_distance`, sorted by source then target; with `pairs`, only the
+    given pairs are considered and they are returned in the given order.
+    With `symmetric`, a float64 Series of length N * (N - 1) / 2 where the
+    distance of i < j is at index N * i - i * (i + 1) / 2 + j - i - 1.
+    With `pairs`, a float64 Series of the distance of each pair.
+    """
+    if symmetric and max_distance is not None:
+        raise ValueError("max_distance is not supported with symmetric")
+    if max_distance is None and pairs is None and not symmetric:
+        result = cpp_directed_hausdorff_distance(x, y, count)
+        dim = len(count)
+        return DataFrame.from_gpu_matrix(
+            result.to_gpu_array().reshape(dim, dim)
+        )
+
+    _check_trajectories(x, y, count)
+    n = len(count)
+    if pairs is not None:
+        source, target = _pair_columns(pairs, n)
+        result = cpp_directed_hausdorff_pairs(
+            x,
+            y,
+            count,
+            source,
+            target,
+            symmetric,
+            np.inf if max_distance is None else max_distance,
+        )
+    elif symmetric:
+        result = cpp_symmetric_hausdorff_condensed(x, y, count)
+    else:
+        result = cpp_directed_hausdorff_within(x, y, count, max_distance)
+    distance = cp.asarray(result.to_gpu_array())
+    if max_distance is None:
+        return Series(distance.astype("float64"))
+
+    # abandoned pairs hold infinity
+    k = cp.flatnonzero(distance <= max_distance)
+    if pairs is not None:
+        source = cp.asarray(source.to_gpu_array())[k]
+        target = cp.asarray(target.to_gpu_array())[k]
+    else:
+        source = (k // n).astype("int32")
+        target = (k % n).astype("int32")
+    return DataFrame(
+        {
+            "source": Series(source),
+            "target": Series(target),
+            "distance": Series(distance[k].astype("float64")),
+        }
+    )
+
+
+def _check_trajectories(x, y, count):
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same length")
+    count = to_host(count, np.int64)
+    if len(count) == 0:
+        raise ValueError("count cannot be empty")
+    if np.any(count <= 0):
+        raise ValueError("every trajectory must have at least one point")
+    if count.sum() > len(x):
+        raise ValueError("sum of count exceeds the number of points")
+
+
+def _pair_columns(pairs, num_trajectories):
+    source, target = Series(pairs[0]), Series(pairs[1])
+    if len(source) != len(target):
+        raise ValueError("pair index arrays must have the same length")
+    if len(source) and (
+        min(source.min(), target.min()) < 0
+        or max(source.max(), target.max()) >= num_trajectories
+    ):
+        raise ValueError("pair index out of range")
+    return source.astype("int32"), target.astype("int32")
+
+
+def directed_hausdorff_blocked(
+    x, y, count, tile_size=1024, callback=None, out=None
+):
+    """ Compute the directed Hausdorff distance matrix tile by tile, for
+    trajectory sets whose N x N matrix does not fit in memory.
+
+    Tiles of `tile_size` x `tile_size` trajectories are computed on the host
+    one at a time and handed to `callback`, written to `out`, or both, so
+    only one tile is held in memory. Trajectories may have any number of
+    points.
+
+    params
+    x: x coordinates
+    y: y coordinates
+    count: size of each trajectory
+    tile_size: number of trajectories along each side of a tile
+    callback: called as callback(row_start, column_start, tile) with each
+              tile, a float64 numpy array whose value at [r, c] is the
+              distance from trajectory row_start + r to trajectory
+              column_start + c
+    out: a writable N x N array such as a `numpy.memmap`, or a file name
+         under which a float64 N x N `numpy.memmap` is created
+
+    Parameters
+    ----------
+    {params}
+
+    Examples
+    --------
+        # stream the matrix of a large trajectory set to disk
+        matrix = cuspatial.directed_hausdorff_blocked(
+            x, y, count, tile_size=4096, out="hausdorff.bin"
+        )
+
+        # or keep only close pairs while the tiles stream by
+        close = []
+        def keep_close(row_start, column_start, tile):
+            r, c = np.nonzero(tile < 1.5)
+            close.append((r + row_start, c + column_start))
+        cuspatial.directed_hausdorff_blocked(x, y, count, callback=keep_close)
+
+    Returns
+    -------
+    `out` (the memmap created for a file name), or None when `out` is not
+    given.
     """
-    result = cpp_directed_hausdorff_distance(x, y, count)
-    dim = len(count)
-    return DataFrame.from_gpu_matrix(result.to_gpu_array().reshape(dim, dim))
+    trajectories = hausdorff_utils.Trajectories(
+        to_host(x), to_host(y), to_host(count)
+    )
+    n = len(trajectories)
+    if tile_size <= 0:
+        raise ValueError("tile_size must be positive")
+    if isinstance(out, str):
+        out = np.memmap(out, dtype=np.float64, mode="w+", shape=(n, n))
+    if out is not None and out.shape != (n, n):
+        raise ValueError("out must have shape ({0}, {0})".format(n))
+    for row_start in range(0, n, tile_size):
+        rows = range(row_start, min(row_start + tile_size, n))
+        for column_start in range(0, n, tile_size):
+            cols = range(column_start, min(column_start + tile_size, n))
+            tile = hausdorff_utils.directed_hausdorff_tile(
+                trajectories, rows, cols
+            )
+            if callback is not None:
+                callback(row_start, column_start, tile)
+            if out is not None:
+                out[rows.start : rows.stop, cols.start : cols.stop] = tile
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
 
 
 def haversine_distance(p1_lon, p1_lat, p2_lon, p2_lat):
@@ -117,6 +307,7 @@ def point_in_polygon_bitmap(
     polygon_end_indices,
     polygons_x,
     polygons_y,
+    output="dataframe",
 ):
     """ Compute from a set of points and a set of polygons which points fall
     within which polygons. Note that `polygons_(x,y)` must be specified as
@@ -131,6 +322,10 @@ def point_in_polygon_bitmap(
                          polygon in the next parameters
     polygons_x: x closed coordinates of all polygon points
     polygons_y: y closed coordinates of all polygon points
+    output: "dataframe" (default) for a Boolean DataFrame with one column
+            per polygon, "pairs" for only the (point, polygon) hits, or
+            "packed" for the raw per-point bitmap. "pairs" and "packed"
+            avoid materializing the points x polygons matrix.
 
     Parameters
     ----------
@@ -161,10 +356,36 @@ def point_in_polygon_bitmap(
         # Point 1: (-8, -8) falls in the first polygon
         # Point 2: (6.0, 6.0) falls in the second polygon
 
+        # The same query with output="pairs" lists only the hits, using
+        # the position of each polygon in `polygon_ids`.
+        result = cuspatial.point_in_polygon_bitmap(
+            cudf.Series([0, -8, 6.0]),
+            cudf.Series([0, -8, 6.0]),
+            cudf.Series([1, 2]),
+            cudf.Series([5, 10]),
+            cudf.Series([-10.0, 5, 5, -10, -10, 0, 10, 10, 0, 0]),
+            cudf.Series([-10.0, -10, 5, 5, -10, 0, 0, 10, 10, 0]),
+            output="pairs",
+        )
+        print(result)
+           point_index  polygon_index
+        0            0              0
+        1            0              1
+        2            1              0
+        3            2              1
+
     returns
     DataFrame: a DataFrame of Boolean values indicating whether each point
     falls within each polygon.
+    With output="pairs", a DataFrame of int32 'point_index' and
+    'polygon_index' columns, sorted by point then polygon.
+    With output="packed", an int32 Series with one bitmap per point; bit j
+    is set when the point falls within the jth polygon.
     """
+    if output not in ("dataframe", "pairs", "packed"):
+        raise ValueError(
+            "output must be one of 'dataframe', 'pairs' or 'packed'"
+        )
     bitmap_result = cpp_point_in_polygon_bitmap(
         x_points,
         y_points,
@@ -173,6 +394,15 @@ def point_in_polygon_bitmap(
         polygons_x,
         polygons_y,
     )
+    if output == "packed":
+        return Series(bitmap_result)
+    if output == "pairs":
+        points, polygons = gis_utils.pip_bitmap_column_to_pairs(
+            bitmap_result
+        )
+        return DataFrame(
+            {"point_index": Series(points), "polygon_index": Series(polygons)}
+        )
 
     result_binary = gis_utils.pip_bitmap_column_to_binary_array(
         polygon_bitmap_column=bitmap_result, width=len(polygon_ids)
@@ -7,8 +7,13 @@ from cudf import DataFrame, Series
 
 from cuspatial._lib.interpolate import (
     cubicspline_coefficients,
+    cubicspline_coefficients_columns,
     cubicspline_interpolate,
+    cubicspline_interpolate_columns,
 )
+from cuspatial.utils.column_utils import float_dtype
+
+_COEFFICIENTS = ["d3", "d2", "d1", "d0"]
 
 
 def _cubic_spline_coefficients(x, y, ids, prefix_sums):
@@ -21,6 +26,19 @@ def _cubic_spline_coefficients(x, y, ids, prefix_sums):
     return result
 
 
+def _cubic_spline_coefficients_columns(x, y, ids, prefix_sums):
+    names = [
+        "{}_{}".format(i, d)
+        for i in range(len(y.columns))
+        for d in _COEFFICIENTS
+    ]
+    result_table = cubicspline_coefficients_columns(
+        x._column, y, ids._column, prefix_sums._column, names
+    )
+    result = DataFrame._from_table(result_table)
+    return result
+
+
 def _cubic_spline_fit(points, points_ids, prefixes, original_t, c):
     points_c = points._column
     points_ids_c = points_ids._column
@@ -32,10 +50,40 @@ def _cubic_spline_fit(points, points_ids, prefixes, original_t, c):
     return result_column
 
 
+def _cubic_spline_fit_columns(points, points_ids, prefixes, original_t, c):
+    result_table = cubicspline_interpolate_columns(
+        points._column,
+        points_ids._column,
+        prefixes._column,
+        original_t._column,
+        c,
+        list(range(len(c.columns) // 4)),
+    )
+    return DataFrame._from_table(result_table)
+
+
+def _spline_offsets(prefixes, size):
+    """Offsets of the splines in points, prefixed by 0, from either those
+    offsets or the inclusive end positions of the splines.
+    """
+    offsets = prefixes.to_array()
+    if len(offsets) == 0 or offsets[0] != 0:
+        offsets = np.concatenate([[0], offsets])
+    if offsets[-1] != size:
+        raise ValueError("Error: prefixes do not end at the length of t")
+    if np.diff(offsets).min() < 2:
+        raise ValueError("Error: every spline requires at least two points")
+    return Series(offsets.astype(np.int32))
+
+
 class CubicSpline:
     """
     Fits each column of the input Series `y` to a hermetic cubic spline.
 
+    When `y` is a DataFrame, such as the x and y coordinates of
+    trajectories, all of its columns are fit against the shared `t` in one
+    batched solve and evaluated together in one pass.
+
     cuspatial.CubicSpline supports two usage patterns: The first is
     identical to scipy.interpolate.CubicSpline:
 
@@ -49,16 +97,34 @@ class CubicSpline:
     cuspatial massively outperforms scipy however when many
     splines are fit simultaneously. Data must be arranged in a SoA format,
     and the inclusive/exclusive prefix_sum of the separate curves must also
-    be passed to the function.
+    be passed to the function. Here 100 curves of 1000 points each are
+    fit, then each is evaluated at 10000 new samples, whose spline index is
+    given by `groups`:
 
-        t = cudf.Series(np.repeat(cp.arange(100), 1000)).astype('float32')
+        t = cudf.Series(np.tile(np.arange(1000), 100)).astype('float32')
         y = cudf.Series(np.random.random(100*1000)).astype('float32')
-        prefix_sum = cudf.Series(cp.arange(1000)*100).astype('int32')
-        new_samples = cudf.Series(np.repeat(np.linspace(0, 100, 1000), 1000)
+        prefix_sum = cudf.Series(cp.arange(1, 101)*1000).astype('int32')
+        new_samples = cudf.Series(np.tile(np.linspace(0, 999, 10000), 100)
             .astype('float32'))
+        groups = cudf.Series(np.repeat(np.arange(100), 10000)
+            .astype('int32'))
 
         curve = cuspatial.CubicSpline(t, y, prefixes=prefix_sum)
-        new_points = curve(new_samples, prefix_sum*10)
+        new_points = curve(new_samples, groups)
+
+    Splines may have different lengths, so the trajectories returned by
+    `cuspatial.derive` can be smoothed and resampled in one call by passing
+    their `position` column as prefixes:
+
+        num, traj, objects = cuspatial.derive(
+            x, y, object_ids, timestamps, return_points=True
+        )
+        ms = objects['timestamp'].astype('int64')
+        t = ((ms - ms.min()) / 1000).astype('float32')
+        curve = cuspatial.CubicSpline(
+            t, objects[['x', 'y']], prefixes=traj['position']
+        )
+        t_new, xy_new, prefixes_new = curve.resample(traj['length'] * 2)
 
     """
 
@@ -72,7 +138,9 @@ class CubicSpline:
         ----------
         t : cudf.Series
             time sample values. Must be monotonically increasing.
-        y : cudf.Series
+            Splines are fit in float32 when `t` and `y` are all float32,
+            and in float64 otherwise.
+        y : cudf.Series or cudf.DataFrame
             columns to have curves fit to according to x
         ids (Optional) : cudf.Series
             ids of each spline
@@ -80,7 +148,11 @@ class CubicSpline:
             fixed size of each spline
         prefixes (Optional) : cudf.Series
             alternative to `size`, allows splines of varying
-            length. Not yet fully supported.
+            length: the offsets of the splines in `t`, prefixed by 0,
+            such as [0, 5, 8] for splines of 5 and 3 points. The
+            inclusive end positions without the leading 0, such as the
+            `position` column of `cuspatial.derive`, are also accepted.
+            Every spline needs at least two points.
 
         Returns
         -------
@@ -115,23 +187,27 @@ class CubicSpline:
             if not ids.dtype == np.int32:
                 raise TypeError("Error: int32 only supported at this time.")
             self.ids = ids
-        self.size = size if size is not None else len(t)
-        if not isinstance(self.size, int):
-            raise TypeError("Error: size must be an integer")
-        if not ((len(t) % self.size) == 0):
-            raise ValueError(
-                "Error: length of input is not a multiple of size"
-            )
+        if prefixes is None:
+            self.size = size if size is not None else len(t)
+            if not isinstance(self.size, int):
+                raise TypeError("Error: size must be an integer")
+            if not ((len(t) % self.size) == 0):
+                raise ValueError(
+                    "Error: length of input is not a multiple of size"
+                )
         if not isinstance(t, Series):
             raise TypeError("cuspatial.CubicSpline requires a cudf.Series")
-        if not t.dtype == np.float32:
-            raise TypeError("Error: float32 only supported at this time.")
-        if not isinstance(y, Series):
-            raise TypeError("cuspatial.CubicSpline requires a cudf.Series")
-        if not y.dtype == np.float32:
-            raise TypeError("Error: float32 only supported at this time.")
-        self.t = t
-        self.y = y
+        columns = [t] + (
+            [y] if isinstance(y, Series) else [y[col] for col in y.columns]
+        )
+        if not all(col.dtype in (np.float32, np.float64) for col in columns):
+            raise TypeError(
+                "Error: float32 and float64 only supported at this time."
+            )
+        # fit in float32 only when every input is float32
+        dtype = float_dtype(*columns)
+        self.t = t.astype(dtype)
+        self.y = y.astype(dtype)
         if prefixes is None:
             self.prefix = Series(
                 cp.arange((len(t) / self.size) + 1) * self.size
@@ -141,7 +217,7 @@ class CubicSpline:
                 raise TypeError("cuspatial.CubicSpline requires a cudf.Series")
             if not prefixes.dtype == np.int32:
                 raise TypeError("Error: int32 only supported at this time.")
-            self.prefix = prefixes
+            self.prefix = _spline_offsets(prefixes, len(t))
 
         self.c = self._compute_coefficients()
 
@@ -154,33 +230,81 @@ class CubicSpline:
                 self.t, self.y, self.ids, self.prefix
             )
         else:
+            self._c_columns = _cubic_spline_coefficients_columns(
+                self.t, self.y, self.ids, self.prefix
+            )
             c = {}
-            for col in self.y.columns:
-                c[col] = _cubic_spline_coefficients(
-                    self.t, self.y, self.ids, self.prefix
+            for i, col in enumerate(self.y.columns):
+                c[col] = DataFrame(
+                    {
+                        d: self._c_columns["{}_{}".format(i, d)]
+                        for d in _COEFFICIENTS
+                    }
                 )
             return c
 
     def __call__(self, coordinates, groups=None):
         """
         Interpolates new input values `coordinates` using the `.c` DataFrame
-        or map of DataFrames.
+        or map of DataFrames. `groups` gives the index of the spline of each
+        coordinate and defaults to the first spline.
         """
+        if groups is not None:
+            self.groups = groups.astype("int32")
+        else:
+            self.groups = Series(
+                cp.repeat(cp.array(0), len(coordinates))
+            ).astype("int32")
+        coordinates = coordinates.astype(self.t.dtype)
         if isinstance(self.y, Series):
-            if groups is not None:
-                self.groups = groups.astype("int32")
-            else:
-                self.groups = Series(
-                    cp.repeat(cp.array(0), len(self.t))
-                ).astype("int32")
             result = _cubic_spline_fit(
                 coordinates, self.groups, self.prefix, self.t, self.c
             )
             return Series(result)
         else:
-            result = DataFrame()
-            for col in self.y.columns:
-                result[col] = Series(
-                    _cubic_spline_fit(self.c[col], coordinates)
-                )
+            result = _cubic_spline_fit_columns(
+                coordinates, self.groups, self.prefix, self.t, self._c_columns
+            )
+            result.columns = self.y.columns
             return result
+
+    def resample(self, counts):
+        """
+        Evaluates every spline at evenly spaced values of `t`, from the
+        first to the last `t` of that spline.
+
+        Parameters
+        ----------
+        counts : int or cudf.Series
+            number of samples for all splines, or for each spline
+
+        Returns
+        -------
+        tuple (t, values, prefixes): the sample values of `t`, the
+        interpolated values as a Series or DataFrame like the result of
+        `o(t)`, and the int32 offsets of the resampled splines, prefixed by
+        0.
+        """
+        num_splines = len(self.prefix) - 1
+        if isinstance(counts, Series):
+            if len(counts) != num_splines:
+                raise ValueError("Error: one count is required per spline")
+            counts = cp.asarray(counts.astype("int32").to_gpu_array())
+        else:
+            counts = cp.full(num_splines, counts, dtype=cp.int32)
+        if num_splines and int(counts.min()) < 0:
+            raise ValueError("Error: counts must not be negative")
+        prefix = cp.asarray(self.prefix.to_gpu_array())
+        new_prefix = cp.concatenate(
+            [cp.zeros(1, dtype=cp.int32), cp.cumsum(counts, dtype=cp.int32)]
+        )
+        sample = cp.arange(int(new_prefix[-1]), dtype=cp.int32)
+        spline = cp.searchsorted(new_prefix[1:], sample, side="right")
+        spline = spline.astype(cp.int32)
+        t = cp.asarray(self.t.to_gpu_array()).astype(cp.float64)
+        first = t[prefix[:-1]]
+        step = (t[prefix[1:] - 1] - first) / cp.maximum(counts - 1, 1)
+        local = sample - new_prefix[spline]
+        new_t = first[spline] + step[spline] * local
+        new_t = Series(new_t.astype(self.t.dtype))
+        return new_t, self(new_t, groups=Series(spline)), Series(new_prefix)
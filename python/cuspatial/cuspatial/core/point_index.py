@@ -0,0 +1,186 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+
+from cudf import DataFrame, Series
+
+from cuspatial.utils import grid_utils
+from cuspatial.utils.column_utils import to_host
+
+
+class PointIndex:
+    """Uniform grid index over a static set of points, built once and
+    reused to answer many window queries.
+
+    `window_points` scans every point for each window. The index instead
+    sorts the points by grid cell, so a window only visits the points of
+    the cells it overlaps. Windows are open boxes, as in `window_points`:
+    points on a border are not reported, nor are points with a NaN or
+    infinite coordinate, which are left out of the index and its length.
+
+    The index is built and queried on the host.
+
+    params
+    x: x coordinates of the points
+    y: y coordinates of the points
+    grid_shape: (nx, ny) cells of the index; by default about one cell per
+                16 points
+
+    Parameters
+    ----------
+    {params}
+
+    Examples
+    --------
+        index = cuspatial.PointIndex(
+            cudf.Series([0.0, 1.0, 2.0, 3.0]),
+            cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        )
+        print(index.query(0.5, 0.5, 2.5, 2.5))
+             x    y
+        0  1.0  1.0
+        1  2.0  2.0
+
+        print(index.query_windows(
+            [0.5, -1.0], [0.5, -1.0], [2.5, 0.5], [2.5, 0.5],
+            return_indices=True,
+        ))
+           window_index  point_index
+        0             0            1
+        1             0            2
+        2             1            0
+    """
+
+    def __init__(self, x, y, grid_shape=None):
+        x = to_host(x, np.float64)
+        y = to_host(y, np.float64)
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same length")
+        # NaN or infinite points are inside no open window, so they are
+        # parked in no cell rather than stretching the grid
+        indexed = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        x = x[indexed]
+        y = y[indexed]
+        if grid_shape is None:
+            grid_shape = grid_utils.grid_shape(len(x), 1.0 / 16)
+        if len(x) == 0:
+            self.extent = (np.inf, np.inf, -np.inf, -np.inf)
+            self.spec = grid_utils.grid_spec(0, 0, 0, 0, (1, 1))
+        else:
+            self.extent = (x.min(), y.min(), x.max(), y.max())
+            self.spec = grid_utils.grid_spec(*self.extent, grid_shape)
+        cx, cy = grid_utils.cell_coords(x, y, self.spec)
+        num_cells = self.spec[4] * self.spec[5]
+        self.offsets, order = grid_utils.build_cell_table(
+            cy * self.spec[4] + cx, num_cells
+        )
+        self.order = indexed[order]
+        # coordinates in cell order, so each cell is a contiguous slice
+        self.x = x[order]
+        self.y = y[order]
+
+    def __len__(self):
+        return len(self.order)
+
+    def _candidates(self, lefts, bottoms, rights, tops):
+        """Return (window, slot) pairs of the points inside each window,
+        where `slot` is a position in cell order.
+        """
+        xmin, ymin, xmax, ymax = self.extent
+        hit = np.flatnonzero(
+            (lefts < xmax)
+            & (rights > xmin)
+            & (bottoms < ymax)
+            & (tops > ymin)
+            & (lefts < rights)
+            & (bottoms < tops)
+        )
+        owner, first, last = grid_utils.box_row_ranges(
+            lefts[hit], bottoms[hit], rights[hit], tops[hit], self.spec
+        )
+        run, slot = grid_utils.expand_ranges(
+            self.offsets[first], self.offsets[last]
+        )
+        window = hit[owner[run]]
+        px = self.x[slot]
+        py = self.y[slot]
+        inside = (
+            (px > lefts[window])
+            & (px < rights[window])
+            & (py > bottoms[window])
+            & (py < tops[window])
+        )
+        return window[inside], slot[inside]
+
+    def query_windows(
+        self, lefts, bottoms, rights, tops, return_indices=False
+    ):
+        """Find the points inside each of a batch of windows.
+
+        params
+        lefts: x coordinates of the left boundary of each window
+        bottoms: y coordinates of the bottom boundary of each window
+        rights: x coordinates of the right boundary of each window
+        tops: y coordinates of the top boundary of each window
+        return_indices: if True, return point indices instead of copying
+                        the coordinates
+
+        Parameters
+        ----------
+        {params}
+
+        Returns
+        -------
+        DataFrame: int32 'window_index' and either int32 'point_index' or
+        float64 'x' and 'y' columns, one row per point inside a window,
+        sorted by window then point index.
+        """
+        lefts = to_host(lefts, np.float64)
+        bottoms = to_host(bottoms, np.float64)
+        rights = to_host(rights, np.float64)
+        tops = to_host(tops, np.float64)
+        if not len(lefts) == len(bottoms) == len(rights) == len(tops):
+            raise ValueError("window bounds must have the same length")
+        window, slot = self._candidates(lefts, bottoms, rights, tops)
+        point = self.order[slot]
+        order = np.lexsort((point, window))
+        window = window[order].astype(np.int32)
+        if return_indices:
+            return DataFrame(
+                {
+                    "window_index": window,
+                    "point_index": point[order].astype(np.int32),
+                }
+            )
+        slot = slot[order]
+        return DataFrame(
+            {"window_index": window, "x": self.x[slot], "y": self.y[slot]}
+        )
+
+    def query(self, left, bottom, right, top, return_indices=False):
+        """Find the points inside one window.
+
+        params
+        left: x coordinate of window left boundary
+        bottom: y coordinate of window bottom boundary
+        right: x coordinate of window right boundary
+        top: y coordinate of window top boundary
+        return_indices: if True, return point indices instead of copying
+                        the coordinates
+
+        Parameters
+        ----------
+        {params}
+
+        Returns
+        -------
+        DataFrame: 'x', 'y' coordinates of the points inside the window in
+        input order, or with `return_indices` an int32 Series of their
+        indices.
+        """
+        result = self.query_windows(
+            [left], [bottom], [right], [top], return_indices
+        )
+        if return_indices:
+            return Series(result["point_index"])
+        return DataFrame({"x": result["x"], "y": result["y"]})
@@ -0,0 +1,116 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+
+from cudf import DataFrame, Series
+
+from cuspatial.utils import simplify_utils
+from cuspatial.utils.column_utils import to_host
+
+_METHODS = ("douglas_peucker", "visvalingam")
+
+
+def simplify_trajectories(
+    x,
+    y,
+    length,
+    position,
+    tolerance,
+    method="douglas_peucker",
+):
+    """Simplify trajectories by dropping points that barely change their
+    shape.
+
+    Fewer points make `directed_hausdorff_distance`, whose cost grows with
+    the product of trajectory sizes, and stored trajectories much cheaper.
+    The first and last point of every trajectory are always kept.
+
+    Trajectories are simplified on the host. Douglas-Peucker simplifies
+    all of them together, one vectorized pass per level of its recursion;
+    Visvalingam removes points one at a time from a heap and runs serially,
+    trajectory by trajectory.
+
+    params
+    x: x coordinates ordered by trajectory, e.g. from `derive`
+    y: y coordinates ordered by trajectory
+    length: number of points of each trajectory
+    position: inclusive end position of each trajectory
+    tolerance: for 'douglas_peucker', the largest distance a dropped point
+               may lie from the simplified trajectory; for 'visvalingam',
+               the smallest triangle area, in squared coordinate units, a
+               kept point must form with its neighbours
+    method: 'douglas_peucker' or 'visvalingam'
+
+    Parameters
+    ----------
+    {params}
+
+    Examples
+    --------
+        mask, trajectories = cuspatial.simplify_trajectories(
+            cudf.Series([0.0, 1.0, 2.0, 3.0, 0.0, 1.0, 2.0]),
+            cudf.Series([0.0, 0.1, 0.0, 0.0, 0.0, 5.0, 0.0]),
+            cudf.Series([4, 3]),
+            cudf.Series([4, 7]),
+            tolerance=0.5,
+        )
+        print(mask)
+        0     True
+        1    False
+        2    False
+        3     True
+        4     True
+        5     True
+        6     True
+        dtype: bool
+        print(trajectories)
+           length  position
+        0       2         2
+        1       3         5
+
+    Returns
+    -------
+    tuple (mask, trajectories): a bool Series that is True for every kept
+    point, and a DataFrame of the int32 'length' and 'position' of the
+    simplified trajectories, which index `x[mask]` and `y[mask]`.
+    """
+    if method not in _METHODS:
+        raise ValueError(
+            "method must be one of {}, got {!r}".format(
+                sorted(_METHODS), method
+            )
+        )
+    px = to_host(x, np.float64)
+    py = to_host(y, np.float64)
+    if len(px) != len(py):
+        raise ValueError("x and y must have the same length")
+    length = to_host(length, np.int64)
+    end = to_host(position, np.int64)
+    if len(length) != len(end):
+        raise ValueError("length and position must have the same length")
+    start = end - length
+    if len(end) and (start.min() < 0 or end.max() > len(px)):
+        raise ValueError("position out of range of the points")
+
+    if method == "douglas_peucker":
+        mask = simplify_utils.douglas_peucker_batch(
+            px, py, start, end, tolerance
+        )
+    else:
+        mask = np.zeros(len(px), dtype=bool)
+        for i in range(len(length)):
+            span = slice(start[i], end[i])
+            mask[span] = simplify_utils.visvalingam(
+                px[span], py[span], tolerance
+            )
+    kept = np.concatenate([[0], np.cumsum(mask)])
+    new_length = kept[end] - kept[start]
+    return (
+        Series(mask),
+        DataFrame(
+            {
+                "length": new_length.astype(np.int32),
+                "position": np.cumsum(new_length).astype(np.int32),
+            }
+        ),
+    )
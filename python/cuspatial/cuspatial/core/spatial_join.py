@@ -0,0 +1,241 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from cudf import DataFrame
+
+from cuspatial.core.point_index import PointIndex
+from cuspatial.utils import grid_utils
+from cuspatial.utils.column_utils import to_host
+from cuspatial.utils.pip_utils import PolygonEdges
+
+
+class _BoxGrid:
+    """Uniform grid over a set of closed boxes: each cell lists the boxes
+    that overlap it.
+    """
+
+    def __init__(self, xmin, ymin, xmax, ymax, grid_shape=None):
+        self.xmin, self.ymin, self.xmax, self.ymax = xmin, ymin, xmax, ymax
+        boxes = np.flatnonzero((xmin <= xmax) & (ymin <= ymax))
+        if grid_shape is None:
+            grid_shape = grid_utils.grid_shape(len(boxes))
+        if len(boxes) == 0:
+            self.extent = (np.inf, np.inf, -np.inf, -np.inf)
+            self.spec = grid_utils.grid_spec(0, 0, 0, 0, (1, 1))
+        else:
+            self.extent = (
+                xmin[boxes].min(),
+                ymin[boxes].min(),
+                xmax[boxes].max(),
+                ymax[boxes].max(),
+            )
+            self.spec = grid_utils.grid_spec(*self.extent, grid_shape)
+        owner, cells = grid_utils.box_cells(
+            xmin[boxes], ymin[boxes], xmax[boxes], ymax[boxes], self.spec
+        )
+        num_cells = self.spec[4] * self.spec[5]
+        self.offsets, order = grid_utils.build_cell_table(cells, num_cells)
+        self.boxes = boxes[owner[order]]
+
+    def candidates(self, px, py, first, last):
+        """Return the (point, box) pairs for points [first, last) where the
+        point lies in the closed box.
+        """
+        x = px[first:last]
+        y = py[first:last]
+        xmin, ymin, xmax, ymax = self.extent
+        inside = np.flatnonzero(
+            (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+        )
+        cx, cy = grid_utils.cell_coords(x[inside], y[inside], self.spec)
+        cells = cy * self.spec[4] + cx
+        owner, slot = grid_utils.expand_ranges(
+            self.offsets[cells], self.offsets[cells + 1]
+        )
+        point_idx = inside[owner] + first
+        box_idx = self.boxes[slot]
+
+        px_c = px[point_idx]
+        py_c = py[point_idx]
+        in_box = (
+            (px_c >= self.xmin[box_idx])
+            & (px_c <= self.xmax[box_idx])
+            & (py_c >= self.ymin[box_idx])
+            & (py_c <= self.ymax[box_idx])
+        )
+        return point_idx[in_box], box_idx[in_box]
+
+
+class _PolygonGrid(_BoxGrid):
+    """Uniform grid over polygon bounding boxes: each cell lists the
+    polygons whose bounding box overlaps it.
+    """
+
+    def __init__(self, edges, grid_shape=None):
+        super().__init__(
+            edges.xmin, edges.ymin, edges.xmax, edges.ymax, grid_shape
+        )
+        self.edges = edges
+
+    def join(self, px, py, first, last):
+        """Return the (point, polygon) pairs for points [first, last)."""
+        point_idx, poly_idx = self.candidates(px, py, first, last)
+        hits = self.edges.contains(px, py, point_idx, poly_idx)
+        return point_idx[hits], poly_idx[hits]
+
+
+def point_in_polygon_join(
+    x_points,
+    y_points,
+    poly_fpos,
+    poly_rpos,
+    poly_x,
+    poly_y,
+    grid_shape=None,
+    chunk_size=1 << 16,
+    num_threads=None,
+):
+    """Find every (point, polygon) pair where the point falls within the
+    polygon, for any number of polygons.
+
+    Unlike `point_in_polygon_bitmap`, which tests every point against every
+    polygon and is limited to 32 polygons, this builds a uniform grid over
+    the polygon bounding boxes and only tests each point against the
+    polygons whose boxes overlap its grid cell. Uses the same even-odd rule
+    as `point_in_polygon_bitmap`, so polygons must be closed.
+
+    The join runs on the host, splitting the points into chunks that are
+    processed by a pool of threads, so it does not require a GPU.
+
+    params
+    x_points: x coordinates of points to test
+    y_points: y coordinates of points to test
+    poly_fpos: inclusive prefix sum of the number of rings of each polygon,
+               e.g. `f_pos` from `read_polygon_shapefile`
+    poly_rpos: inclusive prefix sum of the number of vertices of each ring,
+               e.g. `r_pos` from `read_polygon_shapefile`
+    poly_x: x closed coordinates of all polygon points
+    poly_y: y closed coordinates of all polygon points
+    grid_shape: (nx, ny) cells of the polygon index; by default about one
+                cell per polygon
+    chunk_size: number of points joined per task
+    num_threads: number of worker threads; defaults to `os.cpu_count()`
+
+    Parameters
+    ----------
+    {params}
+
+    Examples
+    --------
+        result = cuspatial.point_in_polygon_join(
+            cudf.Series([0, -8, 6.0]),
+            cudf.Series([0, -8, 6.0]),
+            cudf.Series([1, 2]),
+            cudf.Series([5, 10]),
+            cudf.Series([-10.0, 5, 5, -10, -10, 0, 10, 10, 0, 0]),
+            cudf.Series([-10.0, -10, 5, 5, -10, 0, 0, 10, 10, 0]),
+        )
+        print(result)
+           point_index  polygon_index
+        0            0              0
+        1            0              1
+        2            1              0
+        3            2              1
+
+    returns
+    DataFrame: 'point_index', 'polygon_index' int32 columns, one row per
+    point/polygon hit, sorted by point then polygon.
+    """
+    px = to_host(x_points, np.float64)
+    py = to_host(y_points, np.float64)
+    if len(px) != len(py):
+        raise ValueError("query points size mismatch between x/y arrays")
+    edges = PolygonEdges(
+        to_host(poly_fpos),
+        to_host(poly_rpos),
+        to_host(poly_x, np.float64),
+        to_host(poly_y, np.float64),
+    )
+    grid = _PolygonGrid(edges, grid_shape)
+
+    chunks = [
+        (first, min(first + chunk_size, len(px)))
+        for first in range(0, len(px), chunk_size)
+    ]
+    with ThreadPoolExecutor(num_threads or os.cpu_count()) as pool:
+        results = list(
+            pool.map(lambda c: grid.join(px, py, c[0], c[1]), chunks)
+        )
+    if results:
+        point_idx = np.concatenate([r[0] for r in results])
+        poly_idx = np.concatenate([r[1] for r in results])
+    else:
+        point_idx = poly_idx = np.zeros(0, dtype=np.int64)
+    return DataFrame(
+        {
+            "point_index": point_idx.astype(np.int32),
+            "polygon_index": poly_idx.astype(np.int32),
+        }
+    )
+
+
+def points_in_windows(
+    lefts,
+    bottoms,
+    rights,
+    tops,
+    x,
+    y,
+    grid_shape=None,
+):
+    """Find every (window, point) pair where the point falls within the
+    window, for a batch of windows in a single pass over the points.
+
+    This replaces one `window_points` call per window, each of which scans
+    all points and copies the result. The points are indexed once by a
+    transient `PointIndex`, so each window only visits the points of the
+    grid cells it overlaps. As in `window_points`, windows are open and
+    points on a border are not reported. To query the same points
+    repeatedly, build a `PointIndex` and reuse it instead.
+
+    params
+    lefts: x coordinates of the left boundary of each window
+    bottoms: y coordinates of the bottom boundary of each window
+    rights: x coordinates of the right boundary of each window
+    tops: y coordinates of the top boundary of each window
+    x: x coordinates of the points
+    y: y coordinates of the points
+    grid_shape: (nx, ny) cells of the point index; by default about one
+                cell per 16 points
+
+    Parameters
+    ----------
+    {params}
+
+    Examples
+    --------
+        result = cuspatial.points_in_windows(
+            cudf.Series([0.5, -1.0]),
+            cudf.Series([0.5, -1.0]),
+            cudf.Series([2.5, 0.5]),
+            cudf.Series([2.5, 0.5]),
+            cudf.Series([0.0, 1.0, 2.0, 3.0]),
+            cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        )
+        print(result)
+           window_index  point_index
+        0             0            1
+        1             0            2
+        2             1            0
+
+    returns
+    DataFrame: 'window_index', 'point_index' int32 columns, one row per
+    point inside a window, sorted by window then point.
+    """
+    return PointIndex(x, y, grid_shape).query_windows(
+        lefts, bottoms, rights, tops, return_indices=True
+    )
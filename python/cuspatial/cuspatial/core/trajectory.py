@@ -2,12 +2,16 @@
 
 import warnings
 
+import cupy as cp
+import numpy as np
+
 import cudf
 
 from cuspatial._lib.trajectory import (
-    cpp_derive_trajectories,
+    cpp_derive_trajectories_order,
     cpp_subset_trajectory_id,
     cpp_trajectory_distance_and_speed,
+    cpp_trajectory_segment_distance_and_speed,
     cpp_trajectory_spatial_bounds,
 )
 
@@ -50,9 +54,42 @@ def spatial_bounds(
     )
 
 
-def derive(x_coords, y_coords, object_ids, timestamps):
+def derive(
+    x_coords,
+    y_coords,
+    object_ids,
+    timestamps,
+    assume_sorted=False,
+    return_points=False,
+    max_gap=None,
+    max_jump_km=None,
+):
     """ Derive trajectories from points, timestamps, and ids.
 
+    Points are ordered by object id and timestamp with a single sort on the
+    (object_id, timestamp) pair. The inputs are not modified: earlier
+    versions sorted them in place, so callers that pass the inputs on to
+    `distance_and_speed`, `spatial_bounds` or `subset_trajectory_id` must
+    now pass `return_points=True` and use the returned points, which are in
+    trajectory order.
+
+    params
+    x_coords: x coordinates of the points
+    y_coords: y coordinates of the points
+    object_ids: object (e.g., vehicle) id of each point
+    timestamps: timestamp of each point
+    assume_sorted: if True, the points are already grouped by object id and
+                   ordered by timestamp within each object, so the sort is
+                   skipped
+    return_points: if True, also return the points in trajectory order
+    max_gap: if given, split an object's points into separate trajectories
+             wherever consecutive timestamps are more than `max_gap` apart;
+             a number of milliseconds or a timedelta
+    max_jump_km: if given, split an object's points into separate
+                 trajectories wherever consecutive points are more than
+                 `max_jump_km` apart, with x/y in kilometers as returned by
+                 `lonlat_to_xy_km_coordinates`
+
     Parameters
     ----------
     {params}
@@ -62,6 +99,11 @@ def derive(x_coords, y_coords, object_ids, timestamps):
     result_tuple : tuple (number of discovered trajectories,DataFrame)
     DataFrame    : id, length, and positions of trajectories
                    for feeding into compute_distance_and_speed
+    With `return_points`, a third DataFrame of 'x', 'y', 'object_id' and
+    'timestamp' columns holding the points ordered by (object_id, timestamp).
+    With `max_gap` or `max_jump_km`, trajectories are numbered from 0 in
+    'trajectory_id' and an int32 'object_id' column holds the object each
+    one belongs to.
 
     Examples
     --------
@@ -77,12 +119,90 @@ def derive(x_coords, y_coords, object_ids, timestamps):
         0              0       2         2
         1              1       2         4
     """
-    return cpp_derive_trajectories(x_coords, y_coords, object_ids, timestamps)
+    sizes = {len(x_coords), len(y_coords), len(object_ids), len(timestamps)}
+    if len(sizes) > 1:
+        raise ValueError("x, y, object_ids and timestamps size mismatch")
+    num_trajectories, trajectories, order = cpp_derive_trajectories_order(
+        object_ids, timestamps, assume_sorted
+    )
+    split = max_gap is not None or max_jump_km is not None
+    if not (return_points or split):
+        return num_trajectories, trajectories
+    points = cudf.DataFrame(
+        {
+            "x": x_coords,
+            "y": y_coords,
+            "object_id": object_ids,
+            "timestamp": timestamps,
+        }
+    )
+    if order is not None:
+        points = points.take(order).reset_index(drop=True)
+    if split:
+        trajectories = _split_at_gaps(points, max_gap, max_jump_km)
+        num_trajectories = len(trajectories)
+    if not return_points:
+        return num_trajectories, trajectories
+    return num_trajectories, trajectories, points
+
+
+def _milliseconds(duration):
+    if isinstance(duration, (int, float, np.integer, np.floating)):
+        return duration
+    return np.timedelta64(duration) / np.timedelta64(1, "ms")
+
+
+def _split_at_gaps(points, max_gap, max_jump_km):
+    """Split points ordered by (object_id, timestamp) into trajectories at
+    object boundaries and at time or space gaps, with one vectorized diff
+    over consecutive points followed by a scan for the break positions.
+    """
+    if len(points) == 0:
+        columns = ("trajectory_id", "object_id", "length", "position")
+        return cudf.DataFrame(
+            {name: cudf.Series(cp.zeros(0, dtype="int32")) for name in columns}
+        )
+    ids = cp.asarray(points["object_id"].to_gpu_array())
+    breaks = cp.ones(len(ids), dtype="bool")
+    breaks[1:] = ids[1:] != ids[:-1]
+    if max_gap is not None:
+        # in ms whatever the unit of the timestamps, as max_gap is
+        ts = points["timestamp"].astype("datetime64[ms]").astype("int64")
+        ts = cp.asarray(ts.to_gpu_array())
+        breaks[1:] |= cp.diff(ts) > _milliseconds(max_gap)
+    if max_jump_km is not None:
+        x = cp.asarray(points["x"].astype("float64").to_gpu_array())
+        y = cp.asarray(points["y"].astype("float64").to_gpu_array())
+        breaks[1:] |= cp.hypot(cp.diff(x), cp.diff(y)) > max_jump_km
+    starts = cp.flatnonzero(breaks)
+    ends = cp.concatenate([starts[1:], cp.array([len(ids)])])
+    return cudf.DataFrame(
+        {
+            "trajectory_id": cudf.Series(
+                cp.arange(len(starts), dtype="int32")
+            ),
+            "object_id": cudf.Series(ids[starts].astype("int32")),
+            "length": cudf.Series((ends - starts).astype("int32")),
+            "position": cudf.Series(ends.astype("int32")),
+        }
+    )
 
 
-def distance_and_speed(x_coords, y_coords, timestamps, length, position):
+def distance_and_speed(
+    x_coords, y_coords, timestamps, length, position, per_segment=False
+):
     """ Compute the distance travelled and speed of sets of trajectories
 
+    params
+    x_coords: x coordinates in km, ordered by (object_id, timestamp)
+    y_coords: y coordinates in km, ordered by (object_id, timestamp)
+    timestamps: timestamps, ordered by (object_id, timestamp)
+    length: number of points of each trajectory
+    position: inclusive end position of each trajectory
+    per_segment: if True, describe every segment between consecutive
+                 points instead of whole trajectories, in a single pass over
+                 the points
+
     Parameters
     ----------
     {params}
@@ -92,6 +212,16 @@ def distance_and_speed(x_coords, y_coords, timestamps, length, position):
     result : DataFrame
         meters - travelled distance of trajectory
         speed - speed in m/sec of trajectory
+    With `per_segment`, one row per point, aligned with the points so that
+    `position` indexes it too; row i describes the segment from point i-1
+    to point i:
+        meters - length of the segment
+        seconds - duration of the segment
+        speed - speed in m/sec over the segment, NaN if its duration is 0
+        bearing - direction of travel in degrees counterclockwise from the
+                  +x axis, in (-180, 180], NaN if its length is 0
+    The first point of each trajectory has 0 meters and seconds and a NaN
+    speed and bearing.
 
     Examples
     --------
@@ -105,6 +235,18 @@ def distance_and_speed(x_coords, y_coords, timestamps, length, position):
         0              1000.0  100000.000000
         1              1000.0  111111.109375
     """
+    if per_segment:
+        result = cpp_trajectory_segment_distance_and_speed(
+            x_coords, y_coords, timestamps, length, position
+        )
+        return cudf.DataFrame(
+            {
+                "meters": result[0],
+                "seconds": result[1],
+                "speed": result[2],
+                "bearing": result[3],
+            }
+        )
     result = cpp_trajectory_distance_and_speed(
         x_coords, y_coords, timestamps, length, position
     )
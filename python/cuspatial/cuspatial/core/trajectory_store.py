@@ -0,0 +1,231 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+
+from cudf import DataFrame
+
+from cuspatial.utils import grid_utils
+from cuspatial.utils.column_utils import to_host
+
+
+class TrajectoryStore:
+    """Incrementally built trajectories for append-only point feeds.
+
+    Holds points ordered by (object_id, timestamp) in the layout returned
+    by `derive`: one trajectory per object id with its `length` and the
+    inclusive end `position` of its points. Each trajectory keeps its points
+    in a segment of shared storage with slack capacity, so `append` only
+    re-sorts the trajectories that receive new points, in place; the points
+    of all other trajectories are not copied. A trajectory that outgrows its
+    segment moves to a new one of twice its length, and the storage is
+    compacted when it fills up, so each point is copied amortized O(1)
+    times. `append` returns the ids of the touched trajectories so that
+    `distance_and_speed` and `spatial_bounds` can be recomputed for them
+    alone, using `subset`.
+
+    The store is kept on the host.
+
+    Examples
+    --------
+        store = cuspatial.TrajectoryStore()
+        store.append(
+            cudf.Series([0.0, 1.0]),
+            cudf.Series([0.0, 0.0]),
+            cudf.Series([7, 3]),
+            cudf.Series([0, 0]).astype("datetime64[ms]"),
+        )
+        changed = store.append(
+            cudf.Series([0.0]),
+            cudf.Series([1.0]),
+            cudf.Series([7]),
+            cudf.Series([1000]).astype("datetime64[ms]"),
+        )
+        print(changed)
+        [7]
+        points, trajectories = store.subset(changed)
+        cuspatial.distance_and_speed(
+            points["x"],
+            points["y"],
+            points["timestamp"],
+            trajectories["length"],
+            trajectories["position"],
+        )
+    """
+
+    def __init__(self):
+        self._x = np.zeros(0, dtype=np.float64)
+        self._y = np.zeros(0, dtype=np.float64)
+        self._object_id = np.zeros(0, dtype=np.int32)
+        self._timestamp = np.zeros(0, dtype=np.int64)
+        # end of the used part of the storage
+        self._used = 0
+        self._ids = np.zeros(0, dtype=np.int32)
+        self._start = np.zeros(0, dtype=np.int64)
+        self._length = np.zeros(0, dtype=np.int64)
+        self._capacity = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return int(self._length.sum())
+
+    @property
+    def num_trajectories(self):
+        return len(self._ids)
+
+    @property
+    def trajectories(self):
+        """DataFrame of int32 'trajectory_id', 'length' and 'position' of
+        every trajectory, as returned by `derive`.
+        """
+        return self._table(self._ids, self._length)
+
+    @property
+    def points(self):
+        """DataFrame of 'x', 'y', 'object_id' and 'timestamp' of every
+        point, ordered by (object_id, timestamp).
+        """
+        return self._points(self._segments(slice(None)))
+
+    def append(self, x, y, object_ids, timestamps):
+        """Merge a batch of points into the store.
+
+        params
+        x: x coordinates of the new points
+        y: y coordinates of the new points
+        object_ids: object id of each new point
+        timestamps: timestamp of each new point, as datetime64 or integer
+                    milliseconds
+
+        Parameters
+        ----------
+        {params}
+
+        Returns
+        -------
+        numpy.ndarray: sorted int32 ids of the trajectories that received
+        new points.
+        """
+        x = to_host(x, np.float64)
+        y = to_host(y, np.float64)
+        ids = to_host(object_ids, np.int32)
+        ts = to_host(timestamps, "datetime64[ms]").view(np.int64)
+        if not len(x) == len(y) == len(ids) == len(ts):
+            raise ValueError("x, y, object_ids and timestamps size mismatch")
+
+        new_ids, new_counts = np.unique(ids, return_counts=True)
+        ids_out = np.union1d(self._ids, new_ids).astype(np.int32)
+        old_slot = np.searchsorted(ids_out, self._ids)
+        new_slot = np.searchsorted(ids_out, new_ids)
+        start = np.zeros(len(ids_out), dtype=np.int64)
+        old_length = np.zeros(len(ids_out), dtype=np.int64)
+        capacity = np.zeros(len(ids_out), dtype=np.int64)
+        start[old_slot] = self._start
+        old_length[old_slot] = self._length
+        capacity[old_slot] = self._capacity
+        length = old_length.copy()
+        length[new_slot] += new_counts
+
+        # trajectories that outgrow their segment move to a new one
+        grow = new_slot[length[new_slot] > capacity[new_slot]]
+        capacity[grow] = 2 * length[grow]
+        read_start = start.copy()
+        if self._used + capacity[grow].sum() <= len(self._x):
+            start[grow] = self._used + np.cumsum(capacity[grow])
+            start[grow] -= capacity[grow]
+            self._used += int(capacity[grow].sum())
+        else:
+            start = np.cumsum(capacity) - capacity
+            self._compact(read_start, start, old_length, int(capacity.sum()))
+            read_start = start
+
+        # touched trajectories merge their old points with the new ones;
+        # the stable sort keeps old points first among equal timestamps
+        owner, old_src = grid_utils.expand_ranges(
+            read_start[new_slot], read_start[new_slot] + old_length[new_slot]
+        )
+        slot = np.concatenate([new_slot[owner], np.searchsorted(ids_out, ids)])
+        order = np.lexsort(
+            (np.concatenate([self._timestamp[old_src], ts]), slot)
+        )
+        slot = slot[order]
+        rank = np.arange(len(slot)) - np.searchsorted(slot, slot)
+        dst = start[slot] + rank
+        for name, new in (
+            ("_x", x),
+            ("_y", y),
+            ("_object_id", ids),
+            ("_timestamp", ts),
+        ):
+            column = getattr(self, name)
+            column[dst] = np.concatenate([column[old_src], new])[order]
+        self._ids = ids_out
+        self._start = start
+        self._length = length
+        self._capacity = capacity
+        return new_ids.astype(np.int32)
+
+    def _compact(self, read_start, start, length, used):
+        """Move the points of every trajectory from `read_start` to `start`
+        in new storage of twice the `used` size.
+        """
+        owner, src = grid_utils.expand_ranges(read_start, read_start + length)
+        dst = start[owner] + src - read_start[owner]
+        for name in ("_x", "_y", "_object_id", "_timestamp"):
+            column = getattr(self, name)
+            out = np.empty(2 * used, dtype=column.dtype)
+            out[dst] = column[src]
+            setattr(self, name, out)
+        self._used = used
+
+    def subset(self, trajectory_ids):
+        """Select the points and trajectory table of some trajectories, for
+        example those returned by `append`.
+
+        params
+        trajectory_ids: ids of the trajectories to select; unknown ids are
+                        ignored
+
+        Parameters
+        ----------
+        {params}
+
+        Returns
+        -------
+        tuple (points, trajectories): DataFrames like `points` and
+        `trajectories`, restricted to the selected trajectories in id order,
+        with positions relative to the selected points.
+        """
+        wanted = np.unique(to_host(trajectory_ids, np.int32))
+        slot = np.searchsorted(self._ids, wanted)
+        found = slot < len(self._ids)
+        found[found] = self._ids[slot[found]] == wanted[found]
+        slot = slot[found]
+        return (
+            self._points(self._segments(slot)),
+            self._table(self._ids[slot], self._length[slot]),
+        )
+
+    def _segments(self, slot):
+        """Storage indices of the points of the trajectories at `slot`."""
+        start = self._start[slot]
+        _, idx = grid_utils.expand_ranges(start, start + self._length[slot])
+        return idx
+
+    def _points(self, idx):
+        return DataFrame(
+            {
+                "x": self._x[idx],
+                "y": self._y[idx],
+                "object_id": self._object_id[idx],
+                "timestamp": self._timestamp[idx].view("datetime64[ms]"),
+            }
+        )
+
+    @staticmethod
+    def _table(ids, length):
+        return DataFrame(
+            {
+                "trajectory_id": ids.astype(np.int32),
+                "length": length.astype(np.int32),
+                "position": np.cumsum(length).astype(np.int32),
+            }
+        )
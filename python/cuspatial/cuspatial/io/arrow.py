@@ -0,0 +1,314 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from cudf import DataFrame, Series
+
+from cuspatial.utils.column_utils import to_host
+
+# Points are stored as one column per coordinate. Polygons are stored one
+# per row, each coordinate as a list<list<double>> column of rings, so the
+# list offsets are the feature (ring) and ring (vertex) offsets of the
+# polygon SoA layout.
+
+
+def _intersects(bbox, x_range, y_range):
+    if bbox is None or x_range is None or y_range is None:
+        return True
+    left, bottom, right, top = bbox
+    return (
+        x_range[0] <= right
+        and x_range[1] >= left
+        and y_range[0] <= top
+        and y_range[1] >= bottom
+    )
+
+
+def _statistics_range(row_group, name):
+    """The (min, max) of the parquet column `name`, or of its leaf column
+    if it is nested, in `row_group`; None if not recorded.
+    """
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        path = column.path_in_schema
+        if path == name or path.startswith(name + "."):
+            stats = column.statistics
+            if stats is None or not stats.has_min_max:
+                return None
+            return stats.min, stats.max
+    raise KeyError("no column {!r}".format(name))
+
+
+def _values_range(values):
+    """The (min, max) of `values`, skipping nulls and NaNs; None if there
+    are no other values.
+    """
+    if len(values) == values.null_count:
+        return None
+    # read the buffers directly: pyarrow 0.15 only converts null-free
+    # arrays to numpy
+    validity, data = values.buffers()[:2]
+    dtype = np.dtype(values.type.to_pandas_dtype())
+    result = np.frombuffer(
+        data,
+        dtype=dtype,
+        count=len(values),
+        offset=dtype.itemsize * values.offset,
+    )
+    if values.null_count:
+        valid = np.unpackbits(
+            np.frombuffer(validity, dtype=np.uint8), bitorder="little"
+        )[values.offset : values.offset + len(values)]
+        result = result[valid.astype(bool)]
+    if dtype.kind == "f":
+        result = result[~np.isnan(result)]
+    if len(result) == 0:
+        return None
+    return result.min(), result.max()
+
+
+def _leaf_values(array):
+    while isinstance(array, pa.ListArray):
+        array = _list_offsets(array)[1]
+    return array
+
+
+def _read_parquet(filename, columns, coordinates, bbox):
+    parquet = pq.ParquetFile(filename)
+    metadata = parquet.metadata
+    if columns is not None:
+        columns = list(columns)
+    x, y = coordinates
+    tables = [
+        parquet.read_row_group(i, columns=columns)
+        for i in range(metadata.num_row_groups)
+        if bbox is None
+        or _intersects(
+            bbox,
+            _statistics_range(metadata.row_group(i), x),
+            _statistics_range(metadata.row_group(i), y),
+        )
+    ]
+    if not tables:
+        schema = parquet.schema.to_arrow_schema()
+        if columns is not None:
+            schema = pa.schema(
+                [schema.field(schema.get_field_index(c)) for c in columns]
+            )
+        return pa.Table.from_batches([], schema)
+    return pa.concat_tables(tables)
+
+
+def _read_arrow(filename, columns, coordinates, bbox):
+    reader = pa.RecordBatchFileReader(pa.memory_map(filename))
+    x, y = coordinates
+    batches = []
+    for i in range(reader.num_record_batches):
+        batch = reader.get_batch(i)
+        names = batch.schema.names
+        if bbox is not None and not _intersects(
+            bbox,
+            _values_range(_leaf_values(batch.column(names.index(x)))),
+            _values_range(_leaf_values(batch.column(names.index(y)))),
+        ):
+            continue
+        batches.append(batch)
+    table = pa.Table.from_batches(batches, reader.schema)
+    if columns is not None:
+        table = pa.Table.from_arrays(
+            [table.column(name) for name in columns], names=list(columns)
+        )
+    return table
+
+
+def _list_offsets(array):
+    """The offsets, relative to the first, and the child values of the
+    list array `array`.
+    """
+    offsets = np.frombuffer(
+        array.buffers()[1],
+        dtype=np.int32,
+        count=len(array) + 1,
+        offset=4 * array.offset,
+    )
+    values = array.flatten()
+    if len(values) != offsets[-1] - offsets[0]:
+        values = values.slice(offsets[0], offsets[-1] - offsets[0])
+    return offsets - offsets[0], values
+
+
+def _polygon_column(chunked):
+    """The inclusive end ring of every polygon, end vertex of every ring
+    and the vertices of a list<list<double>> column.
+    """
+    f_len, r_len, values = [], [], []
+    for chunk in chunked.chunks:
+        rings, ring_array = _list_offsets(chunk)
+        vertices, vertex_array = _list_offsets(ring_array)
+        f_len.append(np.diff(rings))
+        r_len.append(np.diff(vertices))
+        values.append(vertex_array.to_numpy())
+    if not values:
+        return (
+            np.zeros(0, dtype=np.int32),
+            np.zeros(0, dtype=np.int32),
+            np.zeros(0),
+        )
+    return (
+        np.cumsum(np.concatenate(f_len), dtype=np.int32),
+        np.cumsum(np.concatenate(r_len), dtype=np.int32),
+        np.concatenate(values).astype(np.float64),
+    )
+
+
+def _polygons(table, coordinates):
+    x_name, y_name = coordinates
+    f_pos, r_pos, x = _polygon_column(table.column(x_name))
+    y_f_pos, y_r_pos, y = _polygon_column(table.column(y_name))
+    if not (np.array_equal(f_pos, y_f_pos) and np.array_equal(r_pos, y_r_pos)):
+        raise ValueError(
+            "{!r} and {!r} have different rings".format(x_name, y_name)
+        )
+    return (
+        Series(f_pos, name="f_pos"),
+        Series(r_pos, name="r_pos"),
+        DataFrame({"x": x, "y": y}),
+    )
+
+
+def _points_table(points):
+    if isinstance(points, DataFrame):
+        return points.to_arrow(preserve_index=False)
+    names = list(points)
+    return pa.Table.from_arrays(
+        [pa.array(to_host(points[name])) for name in names], names=names
+    )
+
+
+def _polygons_table(f_pos, r_pos, x, y, coordinates):
+    rings = np.concatenate([[0], to_host(f_pos)]).astype(np.int32)
+    vertices = np.concatenate([[0], to_host(r_pos)]).astype(np.int32)
+    x = to_host(x, np.float64)
+    y = to_host(y, np.float64)
+    if rings[-1] != len(vertices) - 1 or vertices[-1] != len(x):
+        raise ValueError(
+            "f_pos must end at the number of rings and r_pos at the number "
+            "of vertices"
+        )
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same length")
+    columns = [
+        pa.ListArray.from_arrays(
+            pa.array(rings),
+            pa.ListArray.from_arrays(pa.array(vertices), pa.array(values)),
+        )
+        for values in (x, y)
+    ]
+    return pa.Table.from_arrays(columns, names=list(coordinates))
+
+
+def read_points_parquet(
+    filename, columns=None, coordinates=("lon", "lat"), bbox=None
+):
+    """Read point columns of a Parquet file into a `cudf.DataFrame`.
+
+    params
+    columns: names of the columns to read; all columns if None
+    coordinates: names of the x and y columns `bbox` applies to
+    bbox: (left, bottom, right, top); row groups whose column statistics
+          show that none of their points can lie in the box are skipped.
+          Points of the other row groups are returned unfiltered, e.g. for
+          `window_points`.
+
+    Parameters
+    ----------
+    {params}
+    """
+    table = _read_parquet(filename, columns, coordinates, bbox)
+    return DataFrame.from_arrow(table)
+
+
+def read_points_arrow(
+    filename, columns=None, coordinates=("lon", "lat"), bbox=None
+):
+    """Read point columns of an Arrow IPC file into a `cudf.DataFrame`.
+
+    The file is memory-mapped, so record batches skipped by `bbox` are not
+    read beyond their coordinates. See `read_points_parquet` for the other
+    parameters, which apply per record batch.
+    """
+    table = _read_arrow(filename, columns, coordinates, bbox)
+    return DataFrame.from_arrow(table)
+
+
+def write_points_parquet(filename, points, row_group_size=None):
+    """Write a `cudf.DataFrame`, or a dict of column name to Series, of
+    points to a Parquet file in row groups of `row_group_size` rows.
+
+    Spatially sorted points, e.g. by `PointIndex`, make the row group
+    statistics used by `read_points_parquet(bbox=...)` selective.
+    """
+    pq.write_table(
+        _points_table(points), filename, row_group_size=row_group_size
+    )
+
+
+def write_points_arrow(filename, points, batch_rows=None):
+    """Write points as in `write_points_parquet` to an Arrow IPC file in
+    record batches of `batch_rows` rows.
+    """
+    table = _points_table(points)
+    with pa.OSFile(filename, "wb") as sink:
+        writer = pa.RecordBatchFileWriter(sink, table.schema)
+        for batch in table.to_batches(batch_rows):
+            writer.write_batch(batch)
+        writer.close()
+
+
+def read_polygons_parquet(filename, coordinates=("x", "y"), bbox=None):
+    """Read polygons, stored one per row as list<list<double>> columns of
+    ring coordinates, from a Parquet file.
+
+    Row groups whose statistics show that none of their polygons can
+    intersect `bbox`, (left, bottom, right, top), are skipped.
+
+    Returns
+    -------
+    tuple (f_pos, r_pos, points) as returned by `read_polygon_shapefile`
+    """
+    table = _read_parquet(filename, list(coordinates), coordinates, bbox)
+    return _polygons(table, coordinates)
+
+
+def read_polygons_arrow(filename, coordinates=("x", "y"), bbox=None):
+    """Read polygons as in `read_polygons_parquet` from a memory-mapped
+    Arrow IPC file, skipping record batches outside `bbox`.
+    """
+    table = _read_arrow(filename, list(coordinates), coordinates, bbox)
+    return _polygons(table, coordinates)
+
+
+def write_polygons_parquet(
+    filename, f_pos, r_pos, x, y, coordinates=("x", "y"), row_group_size=None
+):
+    """Write a polygon SoA, e.g. from `read_polygon_shapefile`, to a
+    Parquet file with one polygon per row, `row_group_size` per row group.
+    """
+    table = _polygons_table(f_pos, r_pos, x, y, coordinates)
+    pq.write_table(table, filename, row_group_size=row_group_size)
+
+
+def write_polygons_arrow(
+    filename, f_pos, r_pos, x, y, coordinates=("x", "y"), batch_rows=None
+):
+    """Write a polygon SoA as in `write_polygons_parquet` to an Arrow IPC
+    file in record batches of `batch_rows` polygons.
+    """
+    table = _polygons_table(f_pos, r_pos, x, y, coordinates)
+    with pa.OSFile(filename, "wb") as sink:
+        writer = pa.RecordBatchFileWriter(sink, table.schema)
+        for batch in table.to_batches(batch_rows):
+            writer.write_batch(batch)
+        writer.close()
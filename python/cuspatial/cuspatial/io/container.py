@@ -0,0 +1,184 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import json
+import struct
+import zlib
+
+import numpy as np
+
+from cudf import DataFrame, Series
+
+from cuspatial.utils.column_utils import to_host
+
+# A container file is a fixed-size prefix, a JSON header and the column
+# blocks. The prefix holds the magic, the format version and the size and
+# CRC-32 of the header; the header holds the schema, i.e. the name, dtype,
+# length, offset, size and CRC-32 of every column, plus user metadata.
+# Column offsets count from the first block, which like every block starts
+# at a multiple of ALIGNMENT bytes, so mapped columns are aligned views.
+MAGIC = b"CUSPSOA\0"
+VERSION = 1
+ALIGNMENT = 64
+_PREFIX = struct.Struct("<8sIII")
+
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _columns(columns):
+    if isinstance(columns, DataFrame):
+        columns = {name: columns[name] for name in columns.columns}
+    result = {}
+    for name, values in columns.items():
+        values = to_host(values)
+        if values.dtype.kind not in "biufcmM":
+            raise TypeError(
+                "column {!r} of dtype {} is not numeric".format(
+                    name, values.dtype
+                )
+            )
+        result[str(name)] = np.ascontiguousarray(
+            values, dtype=values.dtype.newbyteorder("<")
+        )
+    return result
+
+
+def _bytes(values):
+    # datetime64 arrays do not export the buffer protocol themselves
+    return values.view(np.uint8)
+
+
+def write_container(filename, columns, metadata=None):
+    """Write columns of possibly different lengths, such as derived
+    trajectories or a polygon SoA, to a self-describing container file.
+
+    params
+    columns: a `cudf.DataFrame` or a dict of column name to `cudf.Series`
+             or numpy array; columns must have numeric or datetime dtypes
+    metadata: optional JSON-serializable object stored in the header
+
+    Parameters
+    ----------
+    {params}
+
+    Examples
+    --------
+    Checkpoint a polygon set read from a catalog:
+
+    >>> g_pos, f_pos, r_pos, points = cuspatial.read_polygon_catalog(cat)
+    >>> cuspatial.write_container("polygons.cusp", {
+    >>>     "g_pos": g_pos, "f_pos": f_pos, "r_pos": r_pos,
+    >>>     "x": points["x"], "y": points["y"]})
+    """
+    columns = _columns(columns)
+    schema = []
+    offset = 0
+    for name, values in columns.items():
+        schema.append(
+            {
+                "name": name,
+                "dtype": values.dtype.str,
+                "length": len(values),
+                "offset": offset,
+                "nbytes": values.nbytes,
+                "crc32": zlib.crc32(_bytes(values)),
+            }
+        )
+        offset = _align(offset + values.nbytes)
+    header = json.dumps(
+        {"columns": schema, "metadata": metadata}, separators=(",", ":")
+    ).encode()
+    data_start = _align(_PREFIX.size + len(header))
+    with open(filename, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, len(header), zlib.crc32(header)))
+        f.write(header)
+        for column, values in zip(schema, columns.values()):
+            f.seek(data_start + column["offset"])
+            f.write(_bytes(values))
+        f.truncate(data_start + offset)
+
+
+def _read_header(mapped, filename):
+    if len(mapped) < _PREFIX.size:
+        raise ValueError("{} is not a cuspatial container".format(filename))
+    magic, version, header_size, header_crc = _PREFIX.unpack(
+        mapped[: _PREFIX.size].tobytes()
+    )
+    if magic != MAGIC:
+        raise ValueError("{} is not a cuspatial container".format(filename))
+    if version > VERSION:
+        raise ValueError(
+            "{} has container version {}; versions up to {} are "
+            "supported".format(filename, version, VERSION)
+        )
+    header = mapped[_PREFIX.size : _PREFIX.size + header_size].tobytes()
+    if len(header) != header_size or zlib.crc32(header) != header_crc:
+        raise ValueError("{} has a corrupt header".format(filename))
+    return json.loads(header.decode()), _align(_PREFIX.size + header_size)
+
+
+def map_container(filename, verify=False):
+    """Memory-map the columns of a file written by `write_container`.
+
+    Only the header is read and checked; every column is a read-only,
+    aligned numpy view of the mapping, read from disk when accessed.
+
+    params
+    verify: also check the CRC-32 of every column, which reads all of them
+
+    Parameters
+    ----------
+    {params}
+
+    Returns
+    -------
+    tuple (columns, metadata): a dict of column name to numpy array, in
+    written order, and the metadata passed to `write_container`.
+    """
+    mapped = np.memmap(filename, dtype=np.uint8, mode="r")
+    header, data_start = _read_header(mapped, filename)
+    columns = {}
+    for column in header["columns"]:
+        start = data_start + column["offset"]
+        block = mapped[start : start + column["nbytes"]]
+        if len(block) != column["nbytes"]:
+            raise ValueError(
+                "{} is truncated in column {!r}".format(
+                    filename, column["name"]
+                )
+            )
+        if verify and zlib.crc32(block) != column["crc32"]:
+            raise ValueError(
+                "{} has a corrupt column {!r}".format(filename, column["name"])
+            )
+        values = block.view(column["dtype"])
+        if len(values) != column["length"]:
+            raise ValueError("{} has a corrupt header".format(filename))
+        columns[column["name"]] = values
+    return columns, header["metadata"]
+
+
+def read_container(filename, columns=None, verify=False):
+    """Read columns of a file written by `write_container` into GPU memory.
+
+    `columns` selects the names to read; only their blocks are read from
+    the file. See `map_container` for `verify`.
+
+    Returns
+    -------
+    tuple (columns, metadata): a dict of column name to `cudf.Series` and
+    the metadata passed to `write_container`.
+    """
+    mapped, metadata = map_container(filename, verify)
+    if columns is None:
+        columns = list(mapped)
+    missing = set(columns) - set(mapped)
+    if missing:
+        raise KeyError(
+            "{} has no columns {}".format(filename, sorted(missing))
+        )
+    return (
+        {name: Series(np.ascontiguousarray(mapped[name])) for name in columns},
+        metadata,
+    )
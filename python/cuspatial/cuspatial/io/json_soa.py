@@ -0,0 +1,237 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from cudf import DataFrame, Series
+
+from cuspatial.io import soa_mmap
+from cuspatial.utils import traj_utils
+
+# The fields of one camera record kept by data/json2soa.cpp, staged per
+# chunk before its timestamps are packed into its_timestamps
+_RECORD_DTYPE = np.dtype(
+    [("object_id", "<i4"), ("pid", "<i4"), ("ms", "<i4")]
+    + soa_mmap.LOCATION_DTYPE.descr
+    + soa_mmap.BBOX_DTYPE.descr
+)
+# Extensions of the SoA files written for every JSON file
+_EXTENSIONS = (".time", ".objectid", ".bbox", ".location")
+_COLUMNS = ("object_id", "timestamp", "lon", "lat", "alt") + (
+    soa_mmap.BBOX_DTYPE.names
+)
+
+
+class _ColumnBuffer(object):
+    """A preallocated array of `dtype` that doubles its capacity when an
+    `extend` would overflow it.
+    """
+
+    def __init__(self, dtype, capacity):
+        self._data = np.empty(capacity, dtype=dtype)
+        self._size = 0
+
+    def extend(self, values):
+        end = self._size + len(values)
+        if end > len(self._data):
+            grown = np.empty(max(end, 2 * len(self._data)), self._data.dtype)
+            grown[: self._size] = self._data[: self._size]
+            self._data = grown
+        self._data[self._size : end] = values
+        self._size = end
+
+    @property
+    def data(self):
+        return self._data[: self._size]
+
+
+class _BufferSink(object):
+    def __init__(self, capacity):
+        self.records = _ColumnBuffer(_RECORD_DTYPE, capacity)
+        self.timestamps = _ColumnBuffer(soa_mmap.TIMESTAMP_DTYPE, capacity)
+
+    def write(self, records, timestamps):
+        self.records.extend(records)
+        self.timestamps.extend(timestamps)
+
+    def close(self):
+        records = self.records.data
+        columns = {"timestamp": self.timestamps.data}
+        for name in _COLUMNS:
+            if name != "timestamp":
+                columns[name] = np.ascontiguousarray(records[name])
+        return columns
+
+
+class _FileSink(object):
+    def __init__(self, out_root):
+        self.files = {ext: open(out_root + ext, "wb") for ext in _EXTENSIONS}
+
+    def write(self, records, timestamps):
+        timestamps.tofile(self.files[".time"])
+        records["object_id"].tofile(self.files[".objectid"])
+        for ext, dtype in (
+            (".bbox", soa_mmap.BBOX_DTYPE),
+            (".location", soa_mmap.LOCATION_DTYPE),
+        ):
+            out = np.empty(len(records), dtype=dtype)
+            for name in dtype.names:
+                out[name] = records[name]
+            out.tofile(self.files[ext])
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+
+
+def _parse(line):
+    record = json.loads(line)
+    obj = record["object"]
+    location = obj["location"]
+    bbox = obj["bbox"]
+    # "%Y-%m-%dT%H:%M:%S" followed by optional fractional seconds and zone
+    t = record["@timestamp"]
+    digits = t[20:23] if t[19:20] == "." else ""
+    digits = digits[: len(digits) - len(digits.lstrip("0123456789"))]
+    return (
+        t[:19],
+        (
+            int(obj["id"]),
+            int(record["place"]["id"]),
+            int(digits.ljust(3, "0")),
+            location["lat"],
+            location["lon"],
+            location["alt"],
+            bbox["topleftx"],
+            bbox["toplefty"],
+            bbox["bottomrightx"],
+            bbox["bottomrighty"],
+        ),
+    )
+
+
+def _flush(sink, records, seconds):
+    times = np.array(seconds, dtype="datetime64[s]").astype("datetime64[ms]")
+    times += records["ms"].astype("timedelta64[ms]")
+    sink.write(
+        records, traj_utils.encode_its_timestamps(times, records["pid"])
+    )
+
+
+def _convert(filename, out_root, num_records, chunk_rows):
+    """Stream one JSON file into SoA files at `out_root`, or into column
+    buffers if it is None, holding at most `chunk_rows` parsed records at a
+    time. Returns the number of records and the columns, if buffered.
+    """
+    if out_root is None:
+        sink = _BufferSink(chunk_rows)
+    else:
+        sink = _FileSink(out_root)
+    stage = np.empty(chunk_rows, dtype=_RECORD_DTYPE)
+    seconds = []
+    count = 0
+    try:
+        with open(filename) as f:
+            for number, line in enumerate(f, 1):
+                if num_records is not None and count == num_records:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    second, stage[len(seconds)] = _parse(line)
+                except (ValueError, KeyError, TypeError) as e:
+                    raise ValueError(
+                        "{}:{}: invalid camera record: {!r}".format(
+                            filename, number, e
+                        )
+                    )
+                seconds.append(second)
+                count += 1
+                if len(seconds) == chunk_rows:
+                    _flush(sink, stage, seconds)
+                    seconds = []
+            if seconds:
+                _flush(sink, stage[: len(seconds)], seconds)
+    finally:
+        result = sink.close()
+    return count, result
+
+
+def json_to_soa(
+    filenames,
+    out_root=None,
+    num_records=None,
+    chunk_rows=1 << 16,
+    num_workers=None,
+):
+    """Convert camera records in the schema_HWY_20_AND_LOCUST JSON format,
+    one record per line, to SoA columns, as data/json2soa.cpp does.
+
+    Each file is parsed record by record; parsed records are packed into
+    column buffers `chunk_rows` at a time, so memory does not grow with
+    the input when writing files. Several files are converted in parallel
+    by worker processes and their outputs concatenated in input order.
+
+    params
+    filenames: a JSON file or a list of JSON files
+    out_root: if given, write `out_root`.time, .objectid, .bbox and
+              .location SoA files, readable by `read_its_timestamps`,
+              `read_uint` and `read_points_lonlat`; otherwise return the
+              columns in a DataFrame
+    num_records: convert at most this many records of every file; all
+                 records if None
+    chunk_rows: number of records parsed between writes to the buffers
+    num_workers: number of worker processes; defaults to `os.cpu_count()`
+
+    Parameters
+    ----------
+    {params}
+
+    Returns
+    -------
+    The number of records written if `out_root` is given, else a DataFrame
+    of 'object_id', packed its_timestamp 'timestamp', 'lon', 'lat', 'alt',
+    'topleftx', 'toplefty', 'bottomrightx' and 'bottomrighty' columns.
+    """
+    if isinstance(filenames, str):
+        filenames = [filenames]
+    filenames = list(filenames)
+    if not filenames:
+        raise ValueError("no JSON files to convert")
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+    if len(filenames) == 1 or out_root is None:
+        roots = [out_root] * len(filenames)
+    else:
+        roots = [
+            "{}.part{}".format(out_root, i) for i in range(len(filenames))
+        ]
+    args = [
+        (f, root, num_records, chunk_rows) for f, root in zip(filenames, roots)
+    ]
+    if len(filenames) == 1 or num_workers == 1:
+        results = [_convert(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(num_workers or os.cpu_count()) as pool:
+            results = list(pool.map(_convert, *zip(*args)))
+    count = sum(n for n, _ in results)
+
+    if out_root is not None:
+        if roots[0] != out_root:
+            for ext in _EXTENSIONS:
+                with open(out_root + ext, "wb") as out:
+                    for root in roots:
+                        with open(root + ext, "rb") as part:
+                            shutil.copyfileobj(part, out)
+                        os.remove(root + ext)
+        return count
+    return DataFrame(
+        {
+            name: Series(np.concatenate([r[name] for _, r in results]))
+            for name in _COLUMNS
+        }
+    )
@@ -0,0 +1,134 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from cudf import DataFrame, Series
+
+from cuspatial.io.shapefile import parse_polygon_shapefile
+
+
+def _read_ply(filename):
+    """Read a polygon SoA file written by data/poly2soa.cpp: the int32
+    numbers of groups, features, rings and vertices, then the int32 lengths
+    of every group, feature and ring, then the float64 x and y vertices.
+    """
+    data = np.fromfile(filename, dtype=np.uint8)
+    if len(data) < 16:
+        raise ValueError("{} is not a polygon SoA file".format(filename))
+    gc, fc, rc, vc = data[:16].view("<i4").astype(np.int64)
+    lengths_end = 16 + 4 * (gc + fc + rc)
+    if len(data) != lengths_end + 16 * vc:
+        raise ValueError(
+            "{} holds {} bytes, its header describes {}".format(
+                filename, len(data), lengths_end + 16 * vc
+            )
+        )
+    lengths = data[16:lengths_end].view("<i4")
+    xy = data[lengths_end:].view("<f8")
+    return (
+        lengths[:gc],
+        lengths[gc : gc + fc],
+        lengths[gc + fc :],
+        xy[:vc],
+        xy[vc:],
+    )
+
+
+def _read_shp(filename):
+    f_pos, r_pos, x, y = parse_polygon_shapefile(filename)
+    return (
+        np.array([len(f_pos)], dtype=np.int32),
+        np.diff(f_pos, prepend=0),
+        np.diff(r_pos, prepend=0),
+        x,
+        y,
+    )
+
+
+_READERS = {".shp": _read_shp, ".ply": _read_ply}
+
+
+def _reader(filename):
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in _READERS:
+        raise ValueError(
+            "{}: polygon files must be one of {}".format(
+                filename, sorted(_READERS)
+            )
+        )
+    return _READERS[ext]
+
+
+def read_catalog(filename):
+    """The polygon files listed one per line in the catalog `filename`,
+    such as data/its.cat. Relative paths are relative to the catalog.
+    """
+    root = os.path.dirname(os.path.abspath(filename))
+    with open(filename) as f:
+        return [os.path.join(root, line.strip()) for line in f if line.strip()]
+
+
+def read_polygon_catalog(catalog, num_threads=None):
+    """Read many polygon files into one polygon SoA, each file as one or
+    more polygon groups.
+
+    Files are parsed on a pool of threads, then copied straight into
+    their slice of the preallocated output arrays, so the cost of
+    assembling the result does not grow with the number of files.
+
+    params
+    catalog: a catalog file listing one polygon file per line, or a list of
+             polygon files. Shapefiles (`.shp`) are one group each; polygon
+             SoA files (`.ply`, from data/poly2soa.cpp) hold their own groups.
+    num_threads: number of worker threads; defaults to `os.cpu_count()`
+
+    Parameters
+    ----------
+    {params}
+
+    Returns
+    -------
+    tuple (g_pos, f_pos, r_pos, points): int32 Series of the inclusive end
+    feature of every group, the inclusive end ring of every feature and the
+    inclusive end vertex of every ring, and a DataFrame of the float64 'x'
+    and 'y' of every vertex.
+    """
+    if isinstance(catalog, str):
+        catalog = read_catalog(catalog)
+    filenames = list(catalog)
+    if not filenames:
+        raise ValueError("catalog lists no polygon files")
+    readers = [_reader(filename) for filename in filenames]
+
+    with ThreadPoolExecutor(num_threads or os.cpu_count()) as pool:
+        parts = list(pool.map(lambda f, r: r(f), filenames, readers))
+
+        # every level of every file lands at its running offset
+        sizes = np.array([[len(a) for a in part[:4]] for part in parts])
+        starts = np.cumsum(sizes, axis=0) - sizes
+        g_len, f_len, r_len = (
+            np.empty(total, dtype=np.int32) for total in sizes[:, :3].sum(0)
+        )
+        x = np.empty(sizes[:, 3].sum(), dtype=np.float64)
+        y = np.empty_like(x)
+
+        def copy(i):
+            g, f, r, v = starts[i]
+            g_size, f_size, r_size, v_size = sizes[i]
+            g_len[g : g + g_size] = parts[i][0]
+            f_len[f : f + f_size] = parts[i][1]
+            r_len[r : r + r_size] = parts[i][2]
+            x[v : v + v_size] = parts[i][3]
+            y[v : v + v_size] = parts[i][4]
+
+        list(pool.map(copy, range(len(parts))))
+
+    return (
+        Series(np.cumsum(g_len, dtype=np.int32), name="g_pos"),
+        Series(np.cumsum(f_len, dtype=np.int32), name="f_pos"),
+        Series(np.cumsum(r_len, dtype=np.int32), name="r_pos"),
+        DataFrame({"x": x, "y": y}),
+    )
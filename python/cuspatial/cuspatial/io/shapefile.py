@@ -1,17 +1,112 @@
 # Copyright (c) 2019, NVIDIA CORPORATION.
 
+import os
+
+import numpy as np
+
 from cudf import DataFrame, Series
 
-from cuspatial._lib.shapefile_reader import cpp_read_polygon_shapefile
+# ESRI shapefile layout: a 100 byte file header, then records of a big-endian
+# (record number, content length) header followed by little-endian content.
+# Offsets and lengths in the header and the .shx index count 16-bit words.
+_FILE_CODE = 9994
+_HEADER_BYTES = 100
+_RECORD_HEADER_BYTES = 8
+# Polygon, PolygonZ and PolygonM records share the layout up to the points:
+# shape type, bounding box, number of parts, number of points, part starts
+_POLYGON_TYPES = (5, 15, 25)
+_NUM_PARTS_OFFSET = 36
+_NUM_POINTS_OFFSET = 40
+_PARTS_OFFSET = 44
+
+
+def _gather(buf, positions, dtype):
+    """Read one value of `dtype` at each byte position of `buf`."""
+    dtype = np.dtype(dtype)
+    index = positions[:, None] + np.arange(dtype.itemsize)
+    return buf[index].view(dtype).ravel()
+
+
+def _gather_ranges(buf, starts, sizes):
+    """Concatenate the byte ranges [starts, starts + sizes) of `buf`."""
+    out_starts = np.cumsum(sizes) - sizes
+    index = np.arange(sizes.sum()) + np.repeat(starts - out_starts, sizes)
+    return buf[index]
+
+
+def _index_filename(filename):
+    root, ext = os.path.splitext(filename)
+    return root + (".SHX" if ext == ".SHP" else ".shx")
+
+
+def parse_polygon_shapefile(filename):
+    """Parse the polygons of an ESRI shapefile on the host, without GDAL.
+
+    The record offsets of the `.shx` index next to `filename` locate every
+    record, whose ring starts and vertices are then gathered from the `.shp`
+    file in bulk. Rings are returned in file order with their vertices
+    reversed, i.e. counter-clockwise outer rings. This matches the GDAL
+    based reader of libcuspatial only when every polygon stores its outer
+    ring before its holes; otherwise OGR regroups the rings and the two
+    readers return them in different orders.
+
+    Returns
+    -------
+    (f_pos, r_pos, x, y): numpy arrays of the int32 inclusive end ring of
+    every polygon, the int32 inclusive end vertex of every ring, and the
+    float64 vertex coordinates.
+    """
+    shx = np.fromfile(_index_filename(filename), dtype=np.uint8)
+    shp = np.fromfile(filename, dtype=np.uint8)
+    for name, buf in ((filename, shp), (_index_filename(filename), shx)):
+        if len(buf) < _HEADER_BYTES or buf[:4].view(">i4")[0] != _FILE_CODE:
+            raise ValueError("{} is not an ESRI shapefile".format(name))
+
+    index = shx[_HEADER_BYTES:].view(">i4").reshape(-1, 2)
+    if len(index) == 0:
+        raise ValueError("Shapefile must have at least one polygon")
+    content = index[:, 0].astype(np.int64) * 2 + _RECORD_HEADER_BYTES
+    if (content + _PARTS_OFFSET > len(shp)).any():
+        raise ValueError("{} is truncated".format(filename))
+    shape_type = _gather(shp, content, "<i4")
+    if not np.isin(shape_type, _POLYGON_TYPES).all():
+        raise ValueError("must be polygonal geometry")
+    num_parts = _gather(shp, content + _NUM_PARTS_OFFSET, "<i4")
+    num_points = _gather(shp, content + _NUM_POINTS_OFFSET, "<i4")
+    num_parts = num_parts.astype(np.int64)
+    num_points = num_points.astype(np.int64)
+    parts_start = content + _PARTS_OFFSET
+    points_start = parts_start + 4 * num_parts
+    if (points_start + 16 * num_points > len(shp)).any():
+        raise ValueError("{} is truncated".format(filename))
+
+    parts = _gather_ranges(shp, parts_start, 4 * num_parts).view("<i4")
+    xy = _gather_ranges(shp, points_start, 16 * num_points)
+    xy = xy.view("<f8").reshape(-1, 2)
+
+    # part starts are relative to their record; make them global
+    record_start = np.cumsum(num_points) - num_points
+    ring_start = parts + np.repeat(record_start, num_parts)
+    ring_end = np.append(ring_start[1:], len(xy))
+    ring_length = ring_end - ring_start
+    if (ring_length < 0).any():
+        raise ValueError("{} has invalid ring offsets".format(filename))
+
+    ring = np.repeat(np.arange(len(ring_start)), ring_length)
+    reverse = (ring_start + ring_end - 1)[ring] - np.arange(len(xy))
+    return (
+        np.cumsum(num_parts).astype(np.int32),
+        np.cumsum(ring_length).astype(np.int32),
+        xy[reverse, 0],
+        xy[reverse, 1],
+    )
 
 
 def read_polygon_shapefile(filename):
     """Reads a shapefile into GPU memory."""
-    result = cpp_read_polygon_shapefile(filename)
-    f_pos = Series(result[0], name="f_pos")
-    r_pos = Series(result[1], name="r_pos")
+    f_pos, r_pos, x, y = parse_polygon_shapefile(filename)
     return (
-        f_pos,
-        r_pos,
-        DataFrame({"x": result[2], "y": result[3]}),
+        Series(f_pos, name="f_pos"),
+        Series(r_pos, name="r_pos"),
+        DataFrame({"x": x, "y": y}),
     )
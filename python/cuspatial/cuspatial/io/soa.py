@@ -1,5 +1,10 @@
 # Copyright (c) 2019, NVIDIA CORPORATION.
 
+import queue
+import threading
+
+import numpy as np
+
 from cudf import DataFrame, Series
 
 from cuspatial._lib.soa_readers import (
@@ -9,28 +14,242 @@ from cuspatial._lib.soa_readers import (
     cpp_read_ts_soa,
     cpp_read_uint_soa,
 )
+from cuspatial.io import soa_mmap
+from cuspatial.utils import traj_utils
+from cuspatial.utils.column_utils import to_host
+
+
+def _is_partial(offset, count):
+    return offset != 0 or count is not None
+
+
+def _to_series(view):
+    # device copies need contiguous host memory; only the mapped slice is
+    # touched
+    return Series(np.ascontiguousarray(view))
+
+
+def _prefetch(chunks):
+    """Iterate `chunks`, producing the next item on a background thread
+    while the caller consumes the current one.
+    """
+    ready = queue.Queue(maxsize=1)
+    done = object()
+    stop = threading.Event()
+
+    def put(item):
+        # never block once the consumer has stopped, so that joining the
+        # worker cannot hang on a full queue
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for chunk in chunks:
+                if not put((chunk, None)):
+                    return
+            put((done, None))
+        except BaseException as e:
+            put((done, e))
+
+    worker = threading.Thread(target=produce, daemon=True)
+    worker.start()
+    try:
+        while True:
+            chunk, error = ready.get()
+            if error is not None:
+                raise error
+            if chunk is done:
+                return
+            yield chunk
+    finally:
+        stop.set()
+        worker.join()
+
+
+def _iter_views(mappers, chunk_rows, prefetch):
+    """Yield contiguous host copies of aligned `chunk_rows` slices of every
+    memory-mapped array returned by `mappers`.
+    """
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+    arrays = [a for mapper in mappers for a in mapper()]
+    num_rows = {len(a) for a in arrays}
+    if len(num_rows) != 1:
+        raise ValueError("SoA files have different numbers of records")
+    num_rows = num_rows.pop()
+
+    def chunks():
+        for first in range(0, num_rows, chunk_rows):
+            yield [
+                np.ascontiguousarray(a[first : first + chunk_rows])
+                for a in arrays
+            ]
+
+    return _prefetch(chunks()) if prefetch else chunks()
+
+
+def iter_uint(filename, chunk_rows=1 << 22, prefetch=True):
+    """Iterate over a binary file of uint32s in `cudf.Series` chunks of at
+    most `chunk_rows` records.
+
+    Only one chunk (two with `prefetch`) is held in memory at a time; with
+    `prefetch` the next chunk is read from disk on a background thread.
+    """
+    for (ids,) in _iter_views(
+        [lambda: [soa_mmap.map_uint(filename)]], chunk_rows, prefetch
+    ):
+        yield Series(ids)
+
+
+def iter_its_timestamps(filename, chunk_rows=1 << 22, prefetch=True):
+    """Iterate over a binary its_timestamp file in `cudf.Series` chunks of
+    at most `chunk_rows` records. See `iter_uint`.
+    """
+    for (ts,) in _iter_views(
+        [lambda: [soa_mmap.map_its_timestamps(filename)]], chunk_rows, prefetch
+    ):
+        yield Series(ts)
+
+
+def iter_points_lonlat(filename, chunk_rows=1 << 22, prefetch=True):
+    """Iterate over a `.location` file in `cudf.DataFrame` chunks of at most
+    `chunk_rows` lon/lat points. See `iter_uint`.
+
+    Examples
+    --------
+    Count the points inside a window of a file larger than memory:
+
+    >>> total = 0
+    >>> for chunk in cuspatial.iter_points_lonlat("locust.location"):
+    >>>     total += len(cuspatial.window_points(
+    >>>         -180, -90, 180, 90, chunk["lon"], chunk["lat"]))
+    """
+    for lon, lat in _iter_views(
+        [lambda: soa_mmap.map_points_lonlat(filename)], chunk_rows, prefetch
+    ):
+        yield DataFrame({"lon": Series(lon), "lat": Series(lat)})
+
+
+def iter_points_xy_km(filename, chunk_rows=1 << 22, prefetch=True):
+    """Iterate over a binary file of x/y points in `cudf.DataFrame` chunks
+    of at most `chunk_rows` points. See `iter_uint`.
+    """
+    for x, y in _iter_views(
+        [lambda: soa_mmap.map_points_xy_km(filename)], chunk_rows, prefetch
+    ):
+        yield DataFrame({"x": Series(x), "y": Series(y)})
+
+
+def iter_points_soa(
+    location_file, objectid_file, time_file, chunk_rows=1 << 22, prefetch=True
+):
+    """Iterate over the parallel `.location`, `.objectid` and `.time` files
+    written by json2soa in aligned chunks of at most `chunk_rows` records.
+
+    Yields `cudf.DataFrame` chunks with 'lon', 'lat', 'object_id' and
+    'timestamp' columns; row i of a chunk holds record i of each file. See
+    `iter_uint` for memory use and prefetching.
+    """
+    for lon, lat, ids, ts in _iter_views(
+        [
+            lambda: soa_mmap.map_points_lonlat(location_file),
+            lambda: [soa_mmap.map_uint(objectid_file)],
+            lambda: [soa_mmap.map_its_timestamps(time_file)],
+        ],
+        chunk_rows,
+        prefetch,
+    ):
+        yield DataFrame(
+            {
+                "lon": Series(lon),
+                "lat": Series(lat),
+                "object_id": Series(ids),
+                "timestamp": Series(ts),
+            }
+        )
 
 
-def read_uint(filename):
+def read_uint(filename, offset=0, count=None):
     """Reads a binary file of uint32s into a `cudf.Series`
+
+    `offset` and `count` select a range of records, which is read through a
+    memory map instead of loading the whole file.
     """
+    if _is_partial(offset, count):
+        return _to_series(soa_mmap.map_uint(filename, offset, count))
     return Series(cpp_read_uint_soa(filename))
 
 
-def read_its_timestamps(filename):
+def read_its_timestamps(filename, offset=0, count=None):
     """Reads a binary formatted its_timestamp file into a Series of uint64s.
+
+    `offset` and `count` select a range of records, which is read through a
+    memory map instead of loading the whole file.
     """
+    if _is_partial(offset, count):
+        return _to_series(soa_mmap.map_its_timestamps(filename, offset, count))
     return Series(cpp_read_ts_soa(filename))
 
 
-def read_points_lonlat(filename):
-    """Reads a binary file of float64s into a `cudf.DataFrame`"""
+def decode_its_timestamps(timestamps):
+    """Unpack a Series of packed its_timestamps, as returned by
+    `read_its_timestamps`, into one int32 column per bitfield.
+
+    Returns
+    -------
+    DataFrame: y (years since 2000), m (zero-based month), d, hh, mm, ss,
+    wd (weekday, Sunday is 0), yd (zero-based day of year), ms and pid
+    (place id) columns
+    """
+    fields = traj_utils.decode_its_timestamps(to_host(timestamps))
+    return DataFrame({name: Series(v) for name, v in fields.items()})
+
+
+def its_timestamps_to_datetime(timestamps):
+    """Convert a Series of packed its_timestamps to a datetime64[ms] Series,
+    which sorts and compares chronologically.
+    """
+    return Series(traj_utils.its_timestamps_to_datetime(to_host(timestamps)))
+
+
+def encode_its_timestamps(times, pid=0):
+    """Pack a datetime64 Series and place ids (a scalar or a Series) into
+    an int64 Series of its_timestamps, the inverse of
+    `its_timestamps_to_datetime`.
+    """
+    if not np.isscalar(pid):
+        pid = to_host(pid)
+    return Series(traj_utils.encode_its_timestamps(to_host(times), pid))
+
+
+def read_points_lonlat(filename, offset=0, count=None):
+    """Reads a binary file of float64s into a `cudf.DataFrame`
+
+    `offset` and `count` select a range of records, which is read through a
+    memory map instead of loading the whole file.
+    """
+    if _is_partial(offset, count):
+        lon, lat = soa_mmap.map_points_lonlat(filename, offset, count)
+        return DataFrame({"lon": _to_series(lon), "lat": _to_series(lat)})
     result = cpp_read_pnt_lonlat_soa(filename)
     return DataFrame({"lon": result[0], "lat": result[1]})
 
 
-def read_points_xy_km(filename):
-    """Reads a binary file of float64s into a `cudf.DataFrame`"""
+def read_points_xy_km(filename, offset=0, count=None):
+    """Reads a binary file of float64s into a `cudf.DataFrame`
+
+    `offset` and `count` select a range of records, which is read through a
+    memory map instead of loading the whole file.
+    """
+    if _is_partial(offset, count):
+        x, y = soa_mmap.map_points_xy_km(filename, offset, count)
+        return DataFrame({"x": _to_series(x), "y": _to_series(y)})
     result = cpp_read_pnt_xy_soa(filename)
     return DataFrame({"x": result[0], "y": result[1]})
 
@@ -46,3 +265,76 @@ def read_polygon(filename):
             "y": result[3],
         }
     )
+
+
+def write_uint(filename, ids):
+    """Write a Series of ids as a binary file of uint32s, such as
+    `.objectid`, readable by `read_uint`.
+    """
+    soa_mmap.write_array(filename, to_host(ids), soa_mmap.UINT_DTYPE)
+
+
+def write_its_timestamps(filename, timestamps):
+    """Write a Series of packed its_timestamps, such as the output of
+    `encode_its_timestamps`, as a `.time` file readable by
+    `read_its_timestamps`.
+    """
+    soa_mmap.write_array(
+        filename, to_host(timestamps), soa_mmap.TIMESTAMP_DTYPE
+    )
+
+
+def write_points_lonlat(filename, lon, lat):
+    """Write lon/lat Series as a `.location` file of (lat, lon, alt)
+    float64 records with zero altitude, readable by `read_points_lonlat`.
+    """
+    soa_mmap.write_records(
+        filename,
+        soa_mmap.LOCATION_DTYPE,
+        lon=to_host(lon),
+        lat=to_host(lat),
+    )
+
+
+def write_points_xy_km(filename, x, y):
+    """Write x/y Series as a binary file of (x, y) float64 records,
+    readable by `read_points_xy_km`.
+    """
+    soa_mmap.write_records(
+        filename, soa_mmap.COORD_DTYPE, x=to_host(x), y=to_host(y)
+    )
+
+
+def write_polygon(filename, f_pos, r_pos, x, y, g_pos=None):
+    """Write a polygon SoA in the `.ply` layout of data/poly2soa.cpp,
+    readable by `read_polygon` and `read_polygon_catalog`.
+
+    `g_pos`, `f_pos` and `r_pos` are the inclusive end feature of every
+    group, ring of every feature and vertex of every ring, as returned by
+    `read_polygon_catalog`; all features form one group if `g_pos` is None.
+    """
+    f_pos = to_host(f_pos, np.int64)
+    r_pos = to_host(r_pos, np.int64)
+    x = to_host(x, np.float64)
+    y = to_host(y, np.float64)
+    if g_pos is None:
+        g_pos = [len(f_pos)]
+    g_pos = to_host(g_pos, np.int64)
+    levels = [g_pos, f_pos, r_pos]
+    totals = [len(f_pos), len(r_pos), len(x)]
+    for name, pos, total in zip(["g_pos", "f_pos", "r_pos"], levels, totals):
+        if len(pos) and (pos[-1] != total or (np.diff(pos) < 0).any()):
+            raise ValueError(
+                "{} must increase to {}, its number of items".format(
+                    name, total
+                )
+            )
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same length")
+    header = [len(g_pos), len(f_pos), len(r_pos), len(x)]
+    with open(filename, "wb") as f:
+        np.array(header, dtype="<i4").tofile(f)
+        for pos in levels:
+            np.diff(pos, prepend=0).astype("<i4").tofile(f)
+        x.astype("<f8", copy=False).tofile(f)
+        y.astype("<f8", copy=False).tofile(f)
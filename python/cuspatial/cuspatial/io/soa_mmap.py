@@ -0,0 +1,116 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import os
+
+import numpy as np
+
+# Record layouts of the SoA files written by data/json2soa.cpp, matching
+# location_3d, coord_2d and its_timestamp in cpp/include/cuspatial/types.hpp
+# and the camera bounding boxes of `.bbox` files
+LOCATION_DTYPE = np.dtype([("lat", "<f8"), ("lon", "<f8"), ("alt", "<f8")])
+COORD_DTYPE = np.dtype([("x", "<f8"), ("y", "<f8")])
+BBOX_DTYPE = np.dtype(
+    [
+        ("topleftx", "<f8"),
+        ("toplefty", "<f8"),
+        ("bottomrightx", "<f8"),
+        ("bottomrighty", "<f8"),
+    ]
+)
+UINT_DTYPE = np.dtype("<i4")
+TIMESTAMP_DTYPE = np.dtype("<i8")
+
+
+def map_records(filename, dtype, offset=0, count=None):
+    """Memory-map `count` records of `dtype` starting at record `offset`.
+
+    The returned array is a read-only view of the page cache; nothing is
+    read until it is accessed and no copy is made. It supports the buffer
+    protocol, so `memoryview(result)` exposes the same memory.
+    """
+    dtype = np.dtype(dtype)
+    size = os.path.getsize(filename)
+    if size % dtype.itemsize != 0:
+        raise ValueError(
+            "record size {} does not divide file length {} of {}".format(
+                dtype.itemsize, size, filename
+            )
+        )
+    num_records = size // dtype.itemsize
+    if offset < 0 or offset > num_records:
+        raise ValueError(
+            "offset {} out of range for {} records".format(offset, num_records)
+        )
+    if count is None:
+        count = num_records - offset
+    if count < 0 or offset + count > num_records:
+        raise ValueError(
+            "count {} out of range for {} records after offset {}".format(
+                count, num_records - offset, offset
+            )
+        )
+    if count == 0:
+        # mmap cannot map zero bytes
+        return np.empty(0, dtype=dtype)
+    return np.memmap(
+        filename,
+        dtype=dtype,
+        mode="r",
+        offset=offset * dtype.itemsize,
+        shape=(count,),
+    )
+
+
+def map_points_lonlat(filename, offset=0, count=None):
+    """Memory-map a `.location` file of (lat, lon, alt) float64 records.
+
+    Returns (lon, lat) strided views into the mapping; neither is copied.
+    """
+    records = map_records(filename, LOCATION_DTYPE, offset, count)
+    return records["lon"], records["lat"]
+
+
+def map_points_xy_km(filename, offset=0, count=None):
+    """Memory-map a file of (x, y) float64 records.
+
+    Returns (x, y) strided views into the mapping; neither is copied.
+    """
+    records = map_records(filename, COORD_DTYPE, offset, count)
+    return records["x"], records["y"]
+
+
+def map_uint(filename, offset=0, count=None):
+    """Memory-map a file of 32-bit ids, such as `.objectid`."""
+    return map_records(filename, UINT_DTYPE, offset, count)
+
+
+def map_its_timestamps(filename, offset=0, count=None):
+    """Memory-map a file of packed 64-bit its_timestamps, such as `.time`."""
+    return map_records(filename, TIMESTAMP_DTYPE, offset, count)
+
+
+def write_records(filename, dtype, **fields):
+    """Write the equal-length arrays `fields` as records of `dtype`, the
+    inverse of `map_records`. Fields of `dtype` that are not given are
+    written as zeros.
+    """
+    dtype = np.dtype(dtype)
+    unknown = set(fields) - set(dtype.names or ())
+    if unknown:
+        raise ValueError(
+            "{} are not fields of {}".format(sorted(unknown), dtype)
+        )
+    lengths = {len(values) for values in fields.values()}
+    if len(lengths) > 1:
+        raise ValueError("fields have different lengths")
+    records = np.zeros(lengths.pop() if lengths else 0, dtype=dtype)
+    for name, values in fields.items():
+        records[name] = values
+    records.tofile(filename)
+
+
+def write_array(filename, values, dtype):
+    """Write `values` as a headerless file of `dtype`, such as `.objectid`
+    or `.time`, without a copy when they already are of `dtype`.
+    """
+    np.ascontiguousarray(values, dtype=np.dtype(dtype)).tofile(filename)
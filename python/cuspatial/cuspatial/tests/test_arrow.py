@@ -0,0 +1,141 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+
+formats = {
+    "parquet": (
+        cuspatial.read_points_parquet,
+        cuspatial.write_points_parquet,
+        cuspatial.read_polygons_parquet,
+        cuspatial.write_polygons_parquet,
+    ),
+    "arrow": (
+        cuspatial.read_points_arrow,
+        cuspatial.write_points_arrow,
+        cuspatial.read_polygons_arrow,
+        cuspatial.write_polygons_arrow,
+    ),
+}
+
+
+@pytest.fixture
+def points():
+    # sorted by x, so every chunk of 4 points covers a separate x range
+    return cudf.DataFrame(
+        {
+            "lon": np.arange(12.0),
+            "lat": np.arange(12.0) % 3,
+            "object_id": np.arange(12, dtype=np.int32),
+        }
+    )
+
+
+@pytest.mark.parametrize("fmt", formats)
+def test_points(tmp_path, points, fmt):
+    read, write, _, _ = formats[fmt]
+    filename = str(tmp_path / "points")
+    write(filename, points, 4)
+    assert_eq(read(filename), points)
+    assert_eq(
+        read(filename, columns=["lon", "object_id"]),
+        points[["lon", "object_id"]],
+    )
+
+
+@pytest.mark.parametrize("fmt", formats)
+def test_points_bbox(tmp_path, points, fmt):
+    read, write, _, _ = formats[fmt]
+    filename = str(tmp_path / "points")
+    write(filename, points, 4)
+    # only the middle chunk can hold points in the box
+    result = read(filename, bbox=(4.5, 0, 6.5, 2))
+    assert_eq(
+        result["object_id"],
+        cudf.Series(np.arange(4, 8, dtype="int32"), name="object_id"),
+    )
+    # no chunk holds points in the box
+    assert len(read(filename, bbox=(4.5, 5, 6.5, 6))) == 0
+    # the box may apply to other columns
+    result = read(
+        filename, coordinates=("object_id", "lat"), bbox=(9, 0, 20, 1)
+    )
+    assert_eq(
+        result["object_id"],
+        cudf.Series(np.arange(8, 12, dtype="int32"), name="object_id"),
+    )
+
+
+@pytest.mark.parametrize("fmt", formats)
+@pytest.mark.parametrize("missing", [np.nan, None])
+def test_points_bbox_missing(tmp_path, fmt, missing):
+    read, _, _, _ = formats[fmt]
+    filename = str(tmp_path / "points")
+    # a NaN or null coordinate must not hide the other points of its chunk
+    lon = pa.array([1.0, missing, 3.0, 4.0, 10.0, 11.0])
+    points = {
+        "lon": lon,
+        "lat": pa.array([1.0, 2.0, 3.0, 4.0, 10.0, 11.0]),
+        "object_id": pa.array(np.arange(6, dtype=np.int32)),
+    }
+    table = pa.Table.from_arrays(list(points.values()), names=list(points))
+    if fmt == "parquet":
+        pq.write_table(table, filename, row_group_size=4)
+    else:
+        with pa.OSFile(filename, "wb") as sink:
+            writer = pa.RecordBatchFileWriter(sink, table.schema)
+            for batch in table.to_batches(4):
+                writer.write_batch(batch)
+            writer.close()
+    result = read(filename, bbox=(0, 0, 5, 5))
+    assert_eq(
+        result["object_id"],
+        cudf.Series(np.arange(4, dtype="int32"), name="object_id"),
+    )
+
+
+@pytest.mark.parametrize("fmt", formats)
+def test_polygons(tmp_path, fmt):
+    _, _, read, write = formats[fmt]
+    filename = str(tmp_path / "polygons")
+    # a polygon with a hole, then two triangles
+    f_pos = cudf.Series([2, 3, 4]).astype("int32")
+    r_pos = cudf.Series([5, 9, 13, 17]).astype("int32")
+    x = cudf.Series(
+        [0, 4, 4, 0, 0, 1, 2, 2, 1, 5, 6, 6, 5, 8, 9, 9, 8]
+    ).astype("float64")
+    y = cudf.Series(
+        [0, 0, 4, 4, 0, 1, 1, 2, 1, 5, 5, 6, 5, 8, 8, 9, 8]
+    ).astype("float64")
+    write(filename, f_pos, r_pos, x, y)
+    result_f_pos, result_r_pos, result = read(filename)
+    assert_eq(result_f_pos, f_pos.rename("f_pos"))
+    assert_eq(result_r_pos, r_pos.rename("r_pos"))
+    assert_eq(result, cudf.DataFrame({"x": x, "y": y}))
+
+    # one polygon per chunk; only the last lies in the box
+    write(filename, f_pos, r_pos, x, y, ("x", "y"), 1)
+    result_f_pos, result_r_pos, result = read(filename, bbox=(7, 7, 10, 10))
+    assert_eq(result_f_pos, cudf.Series([1], name="f_pos").astype("int32"))
+    assert_eq(result_r_pos, cudf.Series([4], name="r_pos").astype("int32"))
+    assert_eq(result["x"], x[13:].reset_index(drop=True).rename("x"))
+
+
+@pytest.mark.parametrize("fmt", formats)
+def test_polygons_errors(tmp_path, fmt):
+    _, _, _, write = formats[fmt]
+    with pytest.raises(ValueError):
+        write(
+            str(tmp_path / "polygons"),
+            cudf.Series([1]),
+            cudf.Series([4]),
+            cudf.Series([0.0, 1.0, 2.0]),
+            cudf.Series([0.0, 1.0, 2.0]),
+        )
@@ -0,0 +1,13 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+
+import cudf
+
+from cuspatial.utils.column_utils import column_as
+
+
+def test_column_as_matching_dtype_is_not_copied():
+    x = cudf.Series([0.0, 1.0])
+    assert column_as(x, "float64") is x._column
+    assert column_as(x, "float32").dtype == np.float32
@@ -0,0 +1,109 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+from cuspatial.io import container
+
+
+@pytest.fixture
+def trajectories(tmp_path):
+    path = str(tmp_path / "trajectories.cusp")
+    columns = {
+        "x": cudf.Series([0.0, 1.0, 2.0, 3.0, 4.0]),
+        "y": cudf.Series([5.0, 6.0, 7.0, 8.0, 9.0]).astype("float32"),
+        "timestamp": cudf.Series(
+            np.array([1, 2, 3, 4, 5], dtype="datetime64[ms]")
+        ),
+        "length": cudf.Series([3, 2]).astype("int32"),
+        "position": cudf.Series([3, 5]).astype("int32"),
+    }
+    cuspatial.write_container(path, columns, metadata={"source": "test"})
+    return path, columns
+
+
+def test_map(trajectories):
+    path, expected = trajectories
+    columns, metadata = cuspatial.map_container(path, verify=True)
+    assert metadata == {"source": "test"}
+    assert list(columns) == list(expected)
+    for name, values in columns.items():
+        assert values.dtype == expected[name].dtype
+        assert values.__array_interface__["data"][0] % container.ALIGNMENT == 0
+        np.testing.assert_array_equal(values, expected[name].to_array())
+
+
+def test_read(trajectories):
+    path, expected = trajectories
+    columns, _ = cuspatial.read_container(path, columns=["y", "length"])
+    assert list(columns) == ["y", "length"]
+    assert_eq(columns["y"], expected["y"])
+    assert_eq(columns["length"], expected["length"])
+    with pytest.raises(KeyError):
+        cuspatial.read_container(path, columns=["z"])
+
+
+def test_dataframe(tmp_path):
+    path = str(tmp_path / "points.cusp")
+    points = cudf.DataFrame({"x": [1.0, 2.0], "y": [3.0, 4.0]})
+    cuspatial.write_container(path, points)
+    columns, metadata = cuspatial.read_container(path)
+    assert metadata is None
+    assert_eq(cudf.DataFrame(columns), points)
+
+
+def test_empty_column(tmp_path):
+    path = str(tmp_path / "empty.cusp")
+    cuspatial.write_container(path, {"x": np.zeros(0), "y": np.arange(3)})
+    columns, _ = cuspatial.map_container(path, verify=True)
+    assert len(columns["x"]) == 0
+    np.testing.assert_array_equal(columns["y"], [0, 1, 2])
+
+
+def test_corrupt(trajectories, tmp_path):
+    path, _ = trajectories
+    data = bytearray(open(path, "rb").read())
+    corrupt = str(tmp_path / "corrupt.cusp")
+
+    # a flipped bit in a column is found when verifying
+    data[data.find(np.float64(4.0).tobytes())] ^= 1
+    open(corrupt, "wb").write(data)
+    cuspatial.map_container(corrupt)
+    with pytest.raises(ValueError):
+        cuspatial.map_container(corrupt, verify=True)
+
+    # the header is always checked
+    data[30] ^= 1
+    open(corrupt, "wb").write(data)
+    with pytest.raises(ValueError):
+        cuspatial.map_container(corrupt)
+
+    # as are the magic and version
+    data[:4] = b"ABCD"
+    open(corrupt, "wb").write(data)
+    with pytest.raises(ValueError):
+        cuspatial.map_container(corrupt)
+    open(corrupt, "wb").write(open(path, "rb").read()[:60])
+    with pytest.raises(ValueError):
+        cuspatial.map_container(corrupt)
+
+
+def test_newer_version(trajectories, tmp_path):
+    path, _ = trajectories
+    data = bytearray(open(path, "rb").read())
+    data[8] = container.VERSION + 1
+    newer = str(tmp_path / "newer.cusp")
+    open(newer, "wb").write(data)
+    with pytest.raises(ValueError):
+        cuspatial.map_container(newer)
+
+
+def test_not_numeric(tmp_path):
+    with pytest.raises(TypeError):
+        cuspatial.write_container(
+            str(tmp_path / "strings.cusp"), {"name": np.array(["a", "b"])}
+        )
@@ -7,6 +7,7 @@ import cudf
 from cudf.tests.utils import assert_eq
 
 import cuspatial
+from cuspatial.utils import hausdorff_utils
 
 
 def test_zeros():
@@ -105,3 +106,330 @@ def test_values():
 # def test_count_2():
 # def test_mismatched_x_y():
 # def test_count_greater_than_x():
+
+
+def _sparse(source, target, distance):
+    return cudf.DataFrame(
+        {
+            "source": cudf.Series(source).astype("int32"),
+            "target": cudf.Series(target).astype("int32"),
+            "distance": cudf.Series(distance).astype("float64"),
+        }
+    )
+
+
+def test_max_distance_count_two():
+    distance = cuspatial.directed_hausdorff_distance(
+        cudf.Series([0.0, 0.0, 1.0, 0.0]),
+        cudf.Series([0.0, -1.0, 1.0, -1.0]),
+        cudf.Series([2, 2]),
+        max_distance=1.2,
+    )
+    assert_eq(distance, _sparse([0, 0, 1], [0, 1, 1], [0.0, 1.0, 0.0]))
+
+
+def test_max_distance_values():
+    in_trajs = []
+    in_trajs.append(np.array([[1, 0], [2, 1], [3, 2], [5, 3], [7, 1]]))
+    in_trajs.append(np.array([[0, 3], [2, 5], [3, 6], [6, 5]]))
+    in_trajs.append(np.array([[1, 4], [3, 7], [6, 4]]))
+    out_trajs = np.concatenate([np.asarray(traj) for traj in in_trajs], 0)
+    distance = cuspatial.directed_hausdorff_distance(
+        cudf.Series(out_trajs[:, 0]),
+        cudf.Series(out_trajs[:, 1]),
+        cudf.Series([len(traj) for traj in in_trajs]),
+        max_distance=1.5,
+    )
+    assert_eq(
+        distance,
+        _sparse(
+            [0, 1, 1, 2, 2],
+            [0, 1, 2, 1, 2],
+            [0.0, 0.0, 1.414214, 1.414214, 0.0],
+        ),
+    )
+
+
+def test_max_distance_matches_full():
+    np.random.seed(0)
+    count = np.random.randint(1, 30, 20)
+    x = np.random.uniform(0, 10, count.sum())
+    y = np.random.uniform(0, 10, count.sum())
+    full = cuspatial.directed_hausdorff_distance(
+        cudf.Series(x), cudf.Series(y), cudf.Series(count)
+    ).as_matrix()
+    sparse = cuspatial.directed_hausdorff_distance(
+        cudf.Series(x), cudf.Series(y), cudf.Series(count), max_distance=4.0
+    )
+    source, target = np.nonzero(full <= 4.0)
+    assert_eq(sparse, _sparse(source, target, full[source, target]))
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_max_distance_matches_reference(dtype):
+    # trajectories longer than a thread block, compared with the host
+    # early-break reference
+    np.random.seed(1)
+    count = np.array([1500, 3, 1100, 1, 40, 2000])
+    x = np.random.uniform(0, 10, count.sum())
+    y = np.random.uniform(0, 10, count.sum())
+    x[1500:1503] += 3
+    sparse = cuspatial.directed_hausdorff_distance(
+        cudf.Series(x).astype(dtype),
+        cudf.Series(y).astype(dtype),
+        cudf.Series(count),
+        max_distance=6.0,
+    )
+    trajectories = hausdorff_utils.Trajectories(
+        x.astype(dtype), y.astype(dtype), count
+    )
+    source, target, distance = hausdorff_utils.directed_hausdorff_within(
+        trajectories, 6.0
+    )
+    assert_eq(
+        sparse["source"],
+        cudf.Series(source).astype("int32"),
+        check_names=False,
+    )
+    assert_eq(
+        sparse["target"],
+        cudf.Series(target).astype("int32"),
+        check_names=False,
+    )
+    np.testing.assert_allclose(
+        sparse["distance"].to_array(), distance, rtol=1e-5
+    )
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_pairs_and_symmetric_match_reference(dtype):
+    # trajectories longer than a thread block, compared with the host
+    # references
+    np.random.seed(2)
+    count = np.array([1500, 3, 1100, 1, 40, 2000, 7])
+    x = np.random.uniform(0, 10, count.sum()).astype(dtype)
+    y = np.random.uniform(0, 10, count.sum()).astype(dtype)
+    trajectories = hausdorff_utils.Trajectories(x, y, count)
+    args = (cudf.Series(x), cudf.Series(y), cudf.Series(count))
+    np.testing.assert_allclose(
+        cuspatial.directed_hausdorff_distance(
+            *args, symmetric=True
+        ).to_array(),
+        hausdorff_utils.hausdorff_condensed(trajectories),
+        rtol=1e-5,
+    )
+    source = np.array([6, 0, 2, 5, 3, 0, 6])
+    target = np.array([0, 5, 2, 1, 4, 0, 1])
+    for symmetric in [False, True]:
+        np.testing.assert_allclose(
+            cuspatial.directed_hausdorff_distance(
+                *args, symmetric=symmetric, pairs=(source, target)
+            ).to_array(),
+            hausdorff_utils.hausdorff_pairs(
+                trajectories, source, target, symmetric
+            ),
+            rtol=1e-5,
+        )
+    within = cuspatial.directed_hausdorff_distance(
+        *args, max_distance=6.0, pairs=(source, target)
+    )
+    expected = hausdorff_utils.directed_hausdorff_within(
+        trajectories, 6.0, (source, target)
+    )
+    np.testing.assert_array_equal(within["source"].to_array(), expected[0])
+    np.testing.assert_array_equal(within["target"].to_array(), expected[1])
+    np.testing.assert_allclose(
+        within["distance"].to_array(), expected[2], rtol=1e-5
+    )
+
+
+def test_early_break_reference():
+    np.random.seed(0)
+    for _ in range(20):
+        ax, ay, bx, by = np.random.uniform(0, 10, (4, 100))
+        bx += np.random.uniform(0, 3)
+        expected = (
+            np.sqrt(
+                (ax[:, None] - bx[None, :]) ** 2
+                + (ay[:, None] - by[None, :]) ** 2
+            )
+            .min(axis=1)
+            .max()
+        )
+        got = hausdorff_utils.directed_hausdorff_early_break(
+            ax, ay, bx, by, block_size=7
+        )
+        np.testing.assert_allclose(got, expected)
+        assert (
+            hausdorff_utils.directed_hausdorff_early_break(
+                ax, ay, bx, by, max_distance=expected * 0.99
+            )
+            == np.inf
+        )
+
+
+@pytest.mark.parametrize("tile_size", [1, 2, 3, 100])
+def test_blocked_callback(tile_size):
+    in_trajs = []
+    in_trajs.append(np.array([[1, 0], [2, 1], [3, 2], [5, 3], [7, 1]]))
+    in_trajs.append(np.array([[0, 3], [2, 5], [3, 6], [6, 5]]))
+    in_trajs.append(np.array([[1, 4], [3, 7], [6, 4]]))
+    out_trajs = np.concatenate([np.asarray(traj) for traj in in_trajs], 0)
+    got = np.full((3, 3), np.nan)
+
+    def store(row_start, column_start, tile):
+        rows, cols = tile.shape
+        got[
+            row_start : row_start + rows, column_start : column_start + cols
+        ] = tile
+
+    result = cuspatial.directed_hausdorff_blocked(
+        cudf.Series(out_trajs[:, 0]),
+        cudf.Series(out_trajs[:, 1]),
+        cudf.Series([len(traj) for traj in in_trajs]),
+        tile_size=tile_size,
+        callback=store,
+    )
+    assert result is None
+    np.testing.assert_allclose(
+        got,
+        [
+            [0, 4.123106, 4.0],
+            [3.605551, 0.0, 1.414214],
+            [4.472136, 1.414214, 0.0],
+        ],
+        rtol=1e-6,
+    )
+
+
+def test_blocked_memmap(tmp_path):
+    np.random.seed(0)
+    count = np.random.randint(1, 30, 25)
+    x = np.random.uniform(0, 10, count.sum())
+    y = np.random.uniform(0, 10, count.sum())
+    path = str(tmp_path / "hausdorff.bin")
+    result = cuspatial.directed_hausdorff_blocked(
+        cudf.Series(x), cudf.Series(y), cudf.Series(count), 7, out=path
+    )
+    expected = cuspatial.directed_hausdorff_distance(
+        cudf.Series(x), cudf.Series(y), cudf.Series(count)
+    ).as_matrix()
+    np.testing.assert_allclose(result, expected)
+    reloaded = np.memmap(path, dtype="float64", mode="r", shape=(25, 25))
+    np.testing.assert_allclose(reloaded, expected)
+
+
+def test_blocked_long_trajectories():
+    # longer than the 1024 threads of one GPU block
+    np.random.seed(0)
+    count = np.array([3000, 2500])
+    x = np.random.uniform(0, 10, count.sum())
+    y = np.random.uniform(0, 10, count.sum())
+    out = np.zeros((2, 2))
+    cuspatial.directed_hausdorff_blocked(
+        cudf.Series(x), cudf.Series(y), cudf.Series(count), out=out
+    )
+    a = np.stack([x[:3000], y[:3000]], 1)
+    b = np.stack([x[3000:], y[3000:]], 1)
+    d = np.sqrt(((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=2))
+    np.testing.assert_allclose(out[0, 1], d.min(axis=1).max())
+    np.testing.assert_allclose(out[1, 0], d.min(axis=0).max())
+    gpu = cuspatial.directed_hausdorff_distance(
+        cudf.Series(x), cudf.Series(y), cudf.Series(count)
+    ).as_matrix()
+    np.testing.assert_allclose(gpu, out)
+
+
+def test_symmetric_count_two():
+    result = cuspatial.directed_hausdorff_distance(
+        cudf.Series([0.0, 1, 0, 0]),
+        cudf.Series([0.0, 0, 1, 2]),
+        cudf.Series([2, 2]),
+        symmetric=True,
+    )
+    assert_eq(result, cudf.Series([2.0]))
+
+
+def test_symmetric_condensed():
+    np.random.seed(0)
+    count = np.random.randint(1, 30, 20)
+    x = np.random.uniform(0, 10, count.sum())
+    y = np.random.uniform(0, 10, count.sum())
+    result = cuspatial.directed_hausdorff_distance(
+        cudf.Series(x), cudf.Series(y), cudf.Series(count), symmetric=True
+    )
+    full = cuspatial.directed_hausdorff_distance(
+        cudf.Series(x), cudf.Series(y), cudf.Series(count)
+    ).as_matrix()
+    i, j = np.triu_indices(20, 1)
+    np.testing.assert_allclose(
+        result.to_array(), np.maximum(full[i, j], full[j, i])
+    )
+
+
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_pairs(symmetric):
+    np.random.seed(0)
+    count = np.random.randint(1, 30, 20)
+    x = np.random.uniform(0, 10, count.sum())
+    y = np.random.uniform(0, 10, count.sum())
+    i = np.random.randint(0, 20, 50)
+    j = np.random.randint(0, 20, 50)
+    result = cuspatial.directed_hausdorff_distance(
+        cudf.Series(x),
+        cudf.Series(y),
+        cudf.Series(count),
+        symmetric=symmetric,
+        pairs=(cudf.Series(i), cudf.Series(j)),
+    )
+    full = cuspatial.directed_hausdorff_distance(
+        cudf.Series(x), cudf.Series(y), cudf.Series(count)
+    ).as_matrix()
+    if symmetric:
+        full = np.maximum(full, full.T)
+    np.testing.assert_allclose(result.to_array(), full[i, j])
+
+
+def test_pairs_max_distance():
+    result = cuspatial.directed_hausdorff_distance(
+        cudf.Series([0.0, 1, 0, 0]),
+        cudf.Series([0.0, 0, 1, 2]),
+        cudf.Series([2, 2]),
+        max_distance=1.5,
+        pairs=([0, 1], [1, 0]),
+    )
+    assert_eq(result, _sparse([0], [1], [1.414214]))
+
+
+def test_pairs_max_distance_order():
+    result = cuspatial.directed_hausdorff_distance(
+        cudf.Series([0.0, 1, 0, 0]),
+        cudf.Series([0.0, 0, 1, 2]),
+        cudf.Series([2, 2]),
+        max_distance=3.0,
+        pairs=([1, 0], [0, 1]),
+    )
+    assert_eq(result, _sparse([1, 0], [0, 1], [2.0, 1.414214]))
+
+
+@pytest.mark.parametrize("max_distance", [None, 1.5])
+def test_pairs_out_of_range(max_distance):
+    with pytest.raises(ValueError):
+        cuspatial.directed_hausdorff_distance(
+            cudf.Series([0.0, 1, 0, 0]),
+            cudf.Series([0.0, 0, 1, 2]),
+            cudf.Series([2, 2]),
+            max_distance=max_distance,
+            pairs=([0], [2]),
+        )
+
+
+def test_symmetric_max_distance():
+    with pytest.raises(ValueError):
+        cuspatial.directed_hausdorff_distance(
+            cudf.Series([0.0, 1, 0, 0]),
+            cudf.Series([0.0, 0, 1, 2]),
+            cudf.Series([2, 2]),
+            max_distance=1.5,
+            symmetric=True,
+        )
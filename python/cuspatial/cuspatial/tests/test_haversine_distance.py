@@ -87,3 +87,25 @@ def test_triple():
             ]
         ],
     )
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_dtype(dtype):
+    distance = cuspatial.haversine_distance(
+        cudf.Series([0.0]).astype(dtype),
+        cudf.Series([0.0]).astype(dtype),
+        cudf.Series([0.0]).astype(dtype),
+        cudf.Series([0.0]).astype(dtype),
+    )
+    assert distance.dtype == np.dtype(dtype)
+    assert distance[0] == 0
+
+
+def test_mixed_dtypes_promote():
+    distance = cuspatial.haversine_distance(
+        cudf.Series([0.0]).astype("float32"),
+        cudf.Series([0.0]),
+        cudf.Series([0.0]),
+        cudf.Series([0.0]),
+    )
+    assert distance.dtype == np.float64
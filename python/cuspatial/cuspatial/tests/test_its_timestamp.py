@@ -0,0 +1,76 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+from cuspatial.utils import traj_utils
+
+# 2019-11-04T13:45:30.123 (a Monday) at place 7, and 2000-01-01 (a Saturday)
+PACKED = [128275183245365907, 25769804800]
+TIMES = ["2019-11-04T13:45:30.123", "2000-01-01T00:00:00.000"]
+
+
+def test_decode_its_timestamps():
+    result = cuspatial.decode_its_timestamps(cudf.Series(PACKED))
+    expected = cudf.DataFrame(
+        {
+            "y": [19, 0],
+            "m": [10, 0],
+            "d": [4, 1],
+            "hh": [13, 0],
+            "mm": [45, 0],
+            "ss": [30, 0],
+            "wd": [1, 6],
+            "yd": [307, 0],
+            "ms": [123, 0],
+            "pid": [7, 0],
+        }
+    ).astype("int32")
+    assert_eq(result, expected)
+
+
+def test_its_timestamps_to_datetime():
+    result = cuspatial.its_timestamps_to_datetime(cudf.Series(PACKED))
+    assert_eq(result, cudf.Series(np.array(TIMES, dtype="datetime64[ms]")))
+
+
+def test_encode_its_timestamps():
+    result = cuspatial.encode_its_timestamps(
+        cudf.Series(np.array(TIMES, dtype="datetime64[ms]")),
+        cudf.Series([7, 0]),
+    )
+    assert_eq(result, cudf.Series(PACKED).astype("int64"))
+
+
+def test_encode_out_of_range():
+    with pytest.raises(ValueError):
+        cuspatial.encode_its_timestamps(
+            cudf.Series(np.array(["1999-12-31"], dtype="datetime64[ms]"))
+        )
+    with pytest.raises(ValueError):
+        cuspatial.encode_its_timestamps(
+            cudf.Series(np.array(TIMES, dtype="datetime64[ms]")), pid=1024
+        )
+
+
+def test_round_trip():
+    np.random.seed(0)
+    times = np.datetime64("2000-01-01", "ms") + np.random.randint(
+        0, 63 * 365 * 86400000, 1000
+    ).astype("timedelta64[ms]")
+    pid = np.random.randint(0, 1024, 1000)
+    packed = traj_utils.encode_its_timestamps(times, pid)
+    np.testing.assert_array_equal(
+        traj_utils.its_timestamps_to_datetime(packed), times
+    )
+    fields = traj_utils.decode_its_timestamps(packed)
+    np.testing.assert_array_equal(fields["pid"], pid)
+    # the vectorized decoder agrees with the scalar one, weekday included
+    for i, value in enumerate(packed[:10]):
+        scalar = traj_utils.get_ts_struct(int(value) & 0xFFFFFFFFFFFFFFFF)
+        for (name, _), v in zip(traj_utils.ITS_TIMESTAMP_FIELDS, scalar):
+            assert fields[name][i] == v
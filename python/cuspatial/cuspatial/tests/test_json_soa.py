@@ -0,0 +1,131 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import json
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+from cuspatial.io import soa_mmap
+
+
+def camera_record(i):
+    return {
+        "@timestamp": "2017-12-0{}T12:34:56.{:03d}Z".format(i % 9 + 1, i),
+        "place": {"id": str(100 + i % 3)},
+        "object": {
+            "id": str(i % 4),
+            "bbox": {
+                "topleftx": float(i),
+                "toplefty": 2.0 * i,
+                "bottomrightx": 3.0 * i,
+                "bottomrighty": 4.0 * i,
+            },
+            "location": {"lat": 40.0 + i, "lon": -90.0 - i, "alt": 200.0},
+            "coordinate": {"x": 0.0, "y": 0.0, "z": 0.0},
+        },
+    }
+
+
+def write_json(path, first, count):
+    with open(path, "w") as f:
+        for i in range(first, first + count):
+            f.write(json.dumps(camera_record(i)) + "\n")
+    return str(path)
+
+
+def expected_columns(first, count):
+    i = np.arange(first, first + count)
+    times = np.array(
+        [camera_record(j)["@timestamp"][:23] for j in i],
+        dtype="datetime64[ms]",
+    )
+    return cudf.DataFrame(
+        {
+            "object_id": (i % 4).astype(np.int32),
+            "timestamp": cuspatial.encode_its_timestamps(
+                cudf.Series(times), cudf.Series(100 + i % 3)
+            ),
+            "lon": -90.0 - i,
+            "lat": 40.0 + i,
+            "alt": np.full(count, 200.0),
+            "topleftx": i.astype(np.float64),
+            "toplefty": 2.0 * i,
+            "bottomrightx": 3.0 * i,
+            "bottomrighty": 4.0 * i,
+        }
+    )
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 3, 100])
+def test_dataframe(tmp_path, chunk_rows):
+    filename = write_json(tmp_path / "cameras.json", 0, 7)
+    result = cuspatial.json_to_soa(filename, chunk_rows=chunk_rows)
+    assert_eq(result, expected_columns(0, 7))
+
+
+def test_num_records(tmp_path):
+    filename = write_json(tmp_path / "cameras.json", 0, 7)
+    result = cuspatial.json_to_soa(filename, num_records=4)
+    assert_eq(result, expected_columns(0, 4))
+
+
+def test_soa_files(tmp_path):
+    filename = write_json(tmp_path / "cameras.json", 0, 5)
+    root = str(tmp_path / "locust")
+    assert cuspatial.json_to_soa(filename, root, chunk_rows=2) == 5
+    expected = expected_columns(0, 5)
+    lon, lat = cuspatial.map_points_lonlat(root + ".location")
+    np.testing.assert_array_equal(lon, expected["lon"].to_array())
+    np.testing.assert_array_equal(lat, expected["lat"].to_array())
+    np.testing.assert_array_equal(
+        cuspatial.map_uint(root + ".objectid"),
+        expected["object_id"].to_array(),
+    )
+    np.testing.assert_array_equal(
+        cuspatial.map_its_timestamps(root + ".time"),
+        expected["timestamp"].to_array(),
+    )
+    bbox = soa_mmap.map_records(root + ".bbox", soa_mmap.BBOX_DTYPE)
+    np.testing.assert_array_equal(
+        bbox["bottomrighty"], expected["bottomrighty"].to_array()
+    )
+
+
+@pytest.mark.parametrize("out_root", [None, "locust"])
+def test_parallel_files(tmp_path, out_root):
+    filenames = [
+        write_json(tmp_path / "first.json", 0, 3),
+        write_json(tmp_path / "second.json", 3, 4),
+    ]
+    if out_root is not None:
+        out_root = str(tmp_path / out_root)
+    result = cuspatial.json_to_soa(filenames, out_root, num_workers=2)
+    expected = expected_columns(0, 7)
+    if out_root is None:
+        assert_eq(result, expected)
+    else:
+        assert result == 7
+        np.testing.assert_array_equal(
+            cuspatial.map_its_timestamps(out_root + ".time"),
+            expected["timestamp"].to_array(),
+        )
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "first.json",
+            "locust.bbox",
+            "locust.location",
+            "locust.objectid",
+            "locust.time",
+            "second.json",
+        ]
+
+
+def test_invalid_record(tmp_path):
+    filename = str(tmp_path / "cameras.json")
+    with open(filename, "w") as f:
+        f.write(json.dumps(camera_record(0)) + "\n{}\n")
+    with pytest.raises(ValueError, match="cameras.json:2"):
+        cuspatial.json_to_soa(filename)
@@ -170,3 +170,69 @@ def test_pip_bitmap_column_to_binary_array():
     got = gis_utils.pip_bitmap_column_to_binary_array(col, width=3)
     expected = np.array([[0, 0, 0], [0, 0, 0], [0, 0, 0]], dtype="int8")
     np.testing.assert_array_equal(got.copy_to_host(), expected)
+
+
+def test_dataset_pairs():
+    result = cuspatial.point_in_polygon_bitmap(
+        cudf.Series([0, -8, 6.0]),
+        cudf.Series([0, -8, 6.0]),
+        cudf.Series([1, 2]),
+        cudf.Series([5, 10]),
+        cudf.Series([-10.0, 5, 5, -10, -10, 0, 10, 10, 0, 0]),
+        cudf.Series([-10.0, -10, 5, 5, -10, 0, 0, 10, 10, 0]),
+        output="pairs",
+    )
+    expected = cudf.DataFrame(
+        {
+            "point_index": cudf.Series([0, 0, 1, 2]).astype("int32"),
+            "polygon_index": cudf.Series([0, 1, 0, 1]).astype("int32"),
+        }
+    )
+    assert_eq(result, expected)
+
+
+def test_dataset_packed():
+    result = cuspatial.point_in_polygon_bitmap(
+        cudf.Series([0, -8, 6.0]),
+        cudf.Series([0, -8, 6.0]),
+        cudf.Series([1, 2]),
+        cudf.Series([5, 10]),
+        cudf.Series([-10.0, 5, 5, -10, -10, 0, 10, 10, 0, 0]),
+        cudf.Series([-10.0, -10, 5, 5, -10, 0, 0, 10, 10, 0]),
+        output="packed",
+    )
+    assert_eq(result, cudf.Series([3, 1, 2]).astype("int32"))
+
+
+def test_invalid_output():
+    with pytest.raises(ValueError):
+        cuspatial.point_in_polygon_bitmap(
+            cudf.Series([0.0]),
+            cudf.Series([0.0]),
+            cudf.Series([1]),
+            cudf.Series([3]),
+            cudf.Series([-1.0, 0, 1]),
+            cudf.Series([-1.0, 1, -1]),
+            output="matrix",
+        )
+
+
+def test_pip_bitmap_column_to_pairs():
+    col = cudf.Series([0, 13, 3, 9]).astype("int32")._column
+    points, polygons = gis_utils.pip_bitmap_column_to_pairs(col)
+    np.testing.assert_array_equal(
+        points.copy_to_host(), np.array([1, 1, 1, 2, 2, 3, 3], dtype="int32")
+    )
+    np.testing.assert_array_equal(
+        polygons.copy_to_host(),
+        np.array([0, 2, 3, 0, 1, 0, 3], dtype="int32"),
+    )
+
+    col = cudf.Series([-1]).astype("int32")._column
+    points, polygons = gis_utils.pip_bitmap_column_to_pairs(col)
+    np.testing.assert_array_equal(points.copy_to_host(), np.zeros(32))
+    np.testing.assert_array_equal(polygons.copy_to_host(), np.arange(32))
+
+    col = cudf.Series([0, 0]).astype("int32")._column
+    points, polygons = gis_utils.pip_bitmap_column_to_pairs(col)
+    assert points.size == 0 and polygons.size == 0
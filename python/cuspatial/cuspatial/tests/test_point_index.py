@@ -0,0 +1,113 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+
+
+def test_centered():
+    index = cuspatial.PointIndex(cudf.Series([0.0]), cudf.Series([0.0]))
+    result = index.query(-1, -1, 1, 1)
+    assert_eq(result, cudf.DataFrame({"x": [0.0], "y": [0.0]}))
+
+
+def test_border_excluded():
+    index = cuspatial.PointIndex(
+        cudf.Series([-1.0, 0.0, 1.0]), cudf.Series([0.0, 1.0, 0.5])
+    )
+    result = index.query(-1, -1, 1, 1, return_indices=True)
+    assert_eq(result, cudf.Series([], dtype="int32"))
+
+
+def test_empty_window():
+    index = cuspatial.PointIndex(cudf.Series([0.0]), cudf.Series([0.0]))
+    result = index.query(1, 1, -1, -1)
+    assert_eq(
+        result,
+        cudf.DataFrame(
+            {
+                "x": cudf.Series([], dtype="float64"),
+                "y": cudf.Series([], dtype="float64"),
+            }
+        ),
+    )
+
+
+def test_query_windows():
+    index = cuspatial.PointIndex(
+        cudf.Series([0.0, 1.0, 2.0, 3.0]), cudf.Series([0.0, 1.0, 2.0, 3.0])
+    )
+    result = index.query_windows(
+        cudf.Series([0.5, -1.0, 5.0]),
+        cudf.Series([0.5, -1.0, 5.0]),
+        cudf.Series([2.5, 0.5, 6.0]),
+        cudf.Series([2.5, 0.5, 6.0]),
+    )
+    assert_eq(
+        result,
+        cudf.DataFrame(
+            {
+                "window_index": cudf.Series([0, 0, 1], dtype="int32"),
+                "x": [1.0, 2.0, 0.0],
+                "y": [1.0, 2.0, 0.0],
+            }
+        ),
+    )
+
+
+@pytest.mark.parametrize("missing", [np.nan, np.inf, -np.inf])
+def test_non_finite_points(missing):
+    index = cuspatial.PointIndex(
+        cudf.Series([0.0, 1.0, missing, 3.0]),
+        cudf.Series([0.0, 1.0, 2.0, missing]),
+    )
+    assert len(index) == 2
+    result = index.query(-np.inf, -np.inf, np.inf, np.inf, True)
+    assert_eq(result, cudf.Series([0, 1], dtype="int32"))
+
+
+def test_mismatched_windows():
+    index = cuspatial.PointIndex(cudf.Series([0.0]), cudf.Series([0.0]))
+    with pytest.raises(ValueError):
+        index.query_windows([0.0, 1.0], [0.0], [1.0], [1.0])
+
+
+@pytest.mark.parametrize("grid_shape", [None, (1, 1), (13, 5)])
+def test_random_windows(grid_shape):
+    rng = np.random.RandomState(0)
+    x = rng.uniform(0, 100, 2000)
+    y = rng.uniform(0, 50, 2000)
+    lefts = rng.uniform(-10, 100, 40)
+    bottoms = rng.uniform(-10, 50, 40)
+    rights = lefts + rng.uniform(0, 30, 40)
+    tops = bottoms + rng.uniform(0, 30, 40)
+    index = cuspatial.PointIndex(
+        cudf.Series(x), cudf.Series(y), grid_shape=grid_shape
+    )
+    result = index.query_windows(
+        cudf.Series(lefts),
+        cudf.Series(bottoms),
+        cudf.Series(rights),
+        cudf.Series(tops),
+        return_indices=True,
+    )
+    inside = (
+        (x > lefts[:, None])
+        & (x < rights[:, None])
+        & (y > bottoms[:, None])
+        & (y < tops[:, None])
+    )
+    window, point = np.nonzero(inside)
+    assert_eq(
+        result,
+        cudf.DataFrame(
+            {
+                "window_index": window.astype("int32"),
+                "point_index": point.astype("int32"),
+            }
+        ),
+    )
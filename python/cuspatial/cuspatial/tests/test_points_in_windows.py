@@ -0,0 +1,95 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+
+
+def _expected(window_index, point_index):
+    return cudf.DataFrame(
+        {
+            "window_index": cudf.Series(window_index).astype("int32"),
+            "point_index": cudf.Series(point_index).astype("int32"),
+        }
+    )
+
+
+def test_centered():
+    result = cuspatial.points_in_windows(
+        cudf.Series([-1.0]),
+        cudf.Series([-1.0]),
+        cudf.Series([1.0]),
+        cudf.Series([1.0]),
+        cudf.Series([0.0]),
+        cudf.Series([0.0]),
+    )
+    assert_eq(result, _expected([0], [0]))
+
+
+def test_border_excluded():
+    result = cuspatial.points_in_windows(
+        cudf.Series([-1.0]),
+        cudf.Series([-1.0]),
+        cudf.Series([1.0]),
+        cudf.Series([1.0]),
+        cudf.Series([-1.0, 0.0, 1.0]),
+        cudf.Series([0.0, 1.0, 0.5]),
+    )
+    assert_eq(result, _expected([], []))
+
+
+def test_overlapping_windows():
+    result = cuspatial.points_in_windows(
+        cudf.Series([0.5, -1.0, -5.0]),
+        cudf.Series([0.5, -1.0, -5.0]),
+        cudf.Series([2.5, 0.5, 5.0]),
+        cudf.Series([2.5, 0.5, 5.0]),
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+    )
+    assert_eq(result, _expected([0, 0, 1, 2, 2, 2, 2], [1, 2, 0, 0, 1, 2, 3]))
+
+
+def test_mismatched_windows():
+    with pytest.raises(ValueError):
+        cuspatial.points_in_windows(
+            cudf.Series([0.0, 1.0]),
+            cudf.Series([0.0]),
+            cudf.Series([1.0]),
+            cudf.Series([1.0]),
+            cudf.Series([0.0]),
+            cudf.Series([0.0]),
+        )
+
+
+@pytest.mark.parametrize("num_windows", [5, 200])
+@pytest.mark.parametrize("grid_shape", [None, (1, 1), (9, 4)])
+def test_random_windows(num_windows, grid_shape):
+    rng = np.random.RandomState(0)
+    x = rng.uniform(0, 100, 1000)
+    y = rng.uniform(0, 50, 1000)
+    lefts = rng.uniform(-10, 100, num_windows)
+    bottoms = rng.uniform(-10, 50, num_windows)
+    rights = lefts + rng.uniform(-5, 30, num_windows)
+    tops = bottoms + rng.uniform(-5, 30, num_windows)
+    result = cuspatial.points_in_windows(
+        cudf.Series(lefts),
+        cudf.Series(bottoms),
+        cudf.Series(rights),
+        cudf.Series(tops),
+        cudf.Series(x),
+        cudf.Series(y),
+        grid_shape=grid_shape,
+    )
+    inside = (
+        (x > lefts[:, None])
+        & (x < rights[:, None])
+        & (y > bottoms[:, None])
+        & (y < tops[:, None])
+    )
+    window, point = np.nonzero(inside)
+    assert_eq(result, _expected(window, point))
@@ -0,0 +1,112 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import os
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+
+shapefiles = os.path.join(
+    os.environ.get(
+        "CUSPATIAL_HOME",
+        os.path.join(os.path.dirname(__file__), *[os.pardir] * 4),
+    ),
+    "test_fixtures",
+    "shapefiles",
+)
+
+
+def write_ply(path, g_len, f_len, r_len, x, y):
+    """Write a polygon SoA file in the layout of data/poly2soa.cpp."""
+    with open(path, "wb") as f:
+        counts = [len(g_len), len(f_len), len(r_len), len(x)]
+        f.write(np.array(counts, dtype="<i4").tobytes())
+        f.write(np.array(g_len + f_len + r_len, dtype="<i4").tobytes())
+        f.write(np.array(x + y, dtype="<f8").tobytes())
+    return path
+
+
+@pytest.fixture
+def ply_files(tmp_path):
+    # two groups: a feature with two rings, and a one ring feature
+    first = write_ply(
+        str(tmp_path / "first.ply"),
+        [1, 1],
+        [2, 1],
+        [3, 3, 4],
+        [0, 1, 2, 0, 1, 2, 5, 6, 7, 8],
+        [0, 0, 0, 1, 1, 1, 5, 5, 5, 5],
+    )
+    # one group of two one ring features
+    second = write_ply(
+        str(tmp_path / "second.ply"),
+        [2],
+        [1, 1],
+        [3, 3],
+        [9, 9, 9, 7, 7, 7],
+        [1, 2, 3, 4, 5, 6],
+    )
+    return first, second
+
+
+def test_ply_files(ply_files):
+    g_pos, f_pos, r_pos, points = cuspatial.read_polygon_catalog(ply_files)
+    assert_eq(g_pos, cudf.Series([1, 2, 4], name="g_pos").astype("int32"))
+    assert_eq(f_pos, cudf.Series([2, 3, 4, 5], name="f_pos").astype("int32"))
+    assert_eq(
+        r_pos, cudf.Series([3, 6, 10, 13, 16], name="r_pos").astype("int32")
+    )
+    assert_eq(
+        points,
+        cudf.DataFrame(
+            {
+                "x": [0, 1, 2, 0, 1, 2, 5, 6, 7, 8, 9, 9, 9, 7, 7, 7],
+                "y": [0, 0, 0, 1, 1, 1, 5, 5, 5, 5, 1, 2, 3, 4, 5, 6],
+            }
+        ).astype("float64"),
+    )
+
+
+def test_catalog_file(ply_files, tmp_path):
+    catalog = tmp_path / "polygons.cat"
+    catalog.write_text("second.ply\n{}\n\n".format(ply_files[0]))
+    g_pos, f_pos, r_pos, points = cuspatial.read_polygon_catalog(
+        str(catalog), num_threads=1
+    )
+    assert_eq(g_pos, cudf.Series([2, 3, 4], name="g_pos").astype("int32"))
+    assert_eq(f_pos, cudf.Series([1, 2, 4, 5], name="f_pos").astype("int32"))
+    assert_eq(
+        r_pos, cudf.Series([3, 6, 9, 12, 16], name="r_pos").astype("int32")
+    )
+    assert_eq(points["x"][:3], cudf.Series([9.0, 9.0, 9.0], name="x"))
+
+
+def test_shapefiles():
+    g_pos, f_pos, r_pos, points = cuspatial.read_polygon_catalog(
+        [
+            os.path.join(shapefiles, "two_polys.shp"),
+            os.path.join(shapefiles, "one_poly.shp"),
+        ]
+    )
+    assert_eq(g_pos, cudf.Series([2, 3], name="g_pos").astype("int32"))
+    assert_eq(f_pos, cudf.Series([1, 2, 3], name="f_pos").astype("int32"))
+    assert_eq(r_pos, cudf.Series([5, 10, 15], name="r_pos").astype("int32"))
+    _, _, expected = cuspatial.read_polygon_shapefile(
+        os.path.join(shapefiles, "one_poly.shp")
+    )
+    assert_eq(points[10:].reset_index(drop=True), expected)
+
+
+def test_errors(tmp_path):
+    with pytest.raises(ValueError):
+        cuspatial.read_polygon_catalog([])
+    with pytest.raises(ValueError):
+        cuspatial.read_polygon_catalog([str(tmp_path / "polygons.csv")])
+    truncated = tmp_path / "truncated.ply"
+    truncated.write_bytes(np.array([1, 1, 1, 3], dtype="<i4").tobytes())
+    with pytest.raises(ValueError):
+        cuspatial.read_polygon_catalog([str(truncated)])
@@ -0,0 +1,134 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import os
+import struct
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+from cuspatial.io.shapefile import parse_polygon_shapefile
+
+shapefiles = os.path.join(
+    os.environ.get(
+        "CUSPATIAL_HOME",
+        os.path.join(os.path.dirname(__file__), *[os.pardir] * 4),
+    ),
+    "test_fixtures",
+    "shapefiles",
+)
+
+
+def write_polygon_shapefile(path, polygons, shape_type=5):
+    """Write `polygons`, each a list of rings of (x, y) vertices in file
+    order, to `path`.shp and `path`.shx.
+    """
+    records = []
+    for rings in polygons:
+        points = [point for ring in rings for point in ring]
+        starts = np.cumsum([0] + [len(ring) for ring in rings[:-1]])
+        content = struct.pack("<i4d", shape_type, 0, 0, 0, 0)
+        content += struct.pack("<2i", len(rings), len(points))
+        content += struct.pack("<{}i".format(len(rings)), *starts)
+        content += struct.pack(
+            "<{}d".format(2 * len(points)), *np.ravel(points)
+        )
+        if shape_type == 15:
+            # z range and values follow the points
+            content += struct.pack(
+                "<{}d".format(2 + len(points)), *[0.0] * (2 + len(points))
+            )
+        records.append(content)
+
+    def header(num_bytes):
+        return struct.pack(
+            ">7i", 9994, 0, 0, 0, 0, 0, num_bytes // 2
+        ) + struct.pack("<2i4d4d", 1000, shape_type, *[0.0] * 8)
+
+    shp = b""
+    shx = b""
+    offset = 100
+    for number, content in enumerate(records):
+        shx += struct.pack(">2i", offset // 2, len(content) // 2)
+        shp += struct.pack(">2i", number + 1, len(content) // 2) + content
+        offset += 8 + len(content)
+    with open(path + ".shp", "wb") as f:
+        f.write(header(100 + len(shp)) + shp)
+    with open(path + ".shx", "wb") as f:
+        f.write(header(100 + len(shx)) + shx)
+    return path + ".shp"
+
+
+def test_one_polygon():
+    f_pos, r_pos, points = cuspatial.read_polygon_shapefile(
+        os.path.join(shapefiles, "one_poly.shp")
+    )
+    assert_eq(f_pos, cudf.Series([1], name="f_pos").astype("int32"))
+    assert_eq(r_pos, cudf.Series([5], name="r_pos").astype("int32"))
+    assert_eq(
+        points,
+        cudf.DataFrame(
+            {
+                "x": [-10.0, 5.0, 5.0, -10.0, -10.0],
+                "y": [-10.0, -10.0, 5.0, 5.0, -10.0],
+            }
+        ),
+    )
+
+
+def test_two_polygons():
+    f_pos, r_pos, points = cuspatial.read_polygon_shapefile(
+        os.path.join(shapefiles, "two_polys.shp")
+    )
+    assert_eq(f_pos, cudf.Series([1, 2], name="f_pos").astype("int32"))
+    assert_eq(r_pos, cudf.Series([5, 10], name="r_pos").astype("int32"))
+    assert_eq(
+        points,
+        cudf.DataFrame(
+            {
+                "x": [-10.0, 5.0, 5.0, -10.0, -10.0, 0, 10, 10, 0, 0],
+                "y": [-10.0, -10.0, 5.0, 5.0, -10.0, 0, 0, 10, 10, 0],
+            }
+        ),
+    )
+
+
+def test_empty():
+    with pytest.raises(ValueError):
+        cuspatial.read_polygon_shapefile(
+            os.path.join(shapefiles, "empty_poly.shp")
+        )
+
+
+def test_missing():
+    with pytest.raises(FileNotFoundError):
+        cuspatial.read_polygon_shapefile(
+            os.path.join(shapefiles, "non_exist.shp")
+        )
+
+
+@pytest.mark.parametrize("shape_type", [5, 15])
+def test_rings(tmp_path, shape_type):
+    outer = [(0, 0), (0, 4), (4, 4), (4, 0), (0, 0)]
+    hole = [(1, 1), (2, 1), (2, 2), (1, 1)]
+    square = [(5, 5), (5, 6), (6, 6), (5, 5)]
+    filename = write_polygon_shapefile(
+        str(tmp_path / "rings"), [[outer, hole], [square]], shape_type
+    )
+    f_pos, r_pos, x, y = parse_polygon_shapefile(filename)
+    np.testing.assert_array_equal(f_pos, [2, 3])
+    np.testing.assert_array_equal(r_pos, [5, 9, 13])
+    expected = outer[::-1] + hole[::-1] + square[::-1]
+    np.testing.assert_array_equal(x, [point[0] for point in expected])
+    np.testing.assert_array_equal(y, [point[1] for point in expected])
+
+
+def test_not_polygons(tmp_path):
+    filename = write_polygon_shapefile(
+        str(tmp_path / "points"), [[[(0, 0)]]], shape_type=1
+    )
+    with pytest.raises(ValueError):
+        parse_polygon_shapefile(filename)
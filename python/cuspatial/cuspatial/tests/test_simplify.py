@@ -0,0 +1,132 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+from cuspatial.utils import simplify_utils
+
+
+def _trajectories(length, position):
+    return cudf.DataFrame(
+        {
+            "length": cudf.Series(length).astype("int32"),
+            "position": cudf.Series(position).astype("int32"),
+        }
+    )
+
+
+@pytest.mark.parametrize("method", ["douglas_peucker", "visvalingam"])
+def test_straight_line(method):
+    mask, trajectories = cuspatial.simplify_trajectories(
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        cudf.Series([4]),
+        cudf.Series([4]),
+        tolerance=1e-9,
+        method=method,
+    )
+    assert_eq(mask, cudf.Series([True, False, False, True]))
+    assert_eq(trajectories, _trajectories([2], [2]))
+
+
+def test_douglas_peucker():
+    mask, trajectories = cuspatial.simplify_trajectories(
+        cudf.Series([0.0, 1.0, 2.0, 3.0, 0.0, 1.0, 2.0, 5.0]),
+        cudf.Series([0.0, 0.1, 0.0, 0.0, 0.0, 5.0, 0.0, 0.0]),
+        cudf.Series([4, 1, 3]),
+        cudf.Series([4, 5, 8]),
+        tolerance=0.5,
+    )
+    assert_eq(
+        mask,
+        cudf.Series([True, False, False, True, True, True, True, True]),
+    )
+    assert_eq(trajectories, _trajectories([2, 1, 3], [2, 3, 6]))
+
+
+def test_visvalingam():
+    # triangle areas: 0.1 at x=1, then 1.0 at x=2 once x=1 is gone
+    mask, trajectories = cuspatial.simplify_trajectories(
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        cudf.Series([0.0, 0.2, 1.0, 0.0]),
+        cudf.Series([4]),
+        cudf.Series([4]),
+        tolerance=0.5,
+        method="visvalingam",
+    )
+    assert_eq(mask, cudf.Series([True, False, True, True]))
+    assert_eq(trajectories, _trajectories([3], [3]))
+
+
+def test_zero_tolerance_keeps_shape():
+    np.random.seed(0)
+    x = np.random.uniform(0, 10, 50)
+    y = np.random.uniform(0, 10, 50)
+    mask, _ = cuspatial.simplify_trajectories(
+        cudf.Series(x),
+        cudf.Series(y),
+        cudf.Series([50]),
+        cudf.Series([50]),
+        tolerance=0,
+    )
+    assert mask.to_array().all()
+
+
+def test_douglas_peucker_bound():
+    # every dropped point lies within tolerance of the simplified line
+    np.random.seed(0)
+    x = np.cumsum(np.random.uniform(0, 1, 500))
+    y = np.cumsum(np.random.uniform(-1, 1, 500))
+    keep = simplify_utils.douglas_peucker(x, y, 2.0)
+    kept = np.flatnonzero(keep)
+    for a, b in zip(kept[:-1], kept[1:]):
+        d = simplify_utils._segment_distance(
+            x[a + 1 : b], y[a + 1 : b], x[a], y[a], x[b], y[b]
+        )
+        assert np.all(d <= 2.0)
+
+
+def _douglas_peucker_recursive(x, y, tolerance, a, b, keep):
+    keep[a] = keep[b] = True
+    if b - a < 2:
+        return
+    d = simplify_utils._segment_distance(
+        x[a + 1 : b], y[a + 1 : b], x[a], y[a], x[b], y[b]
+    )
+    k = int(np.argmax(d))
+    if d[k] > tolerance:
+        _douglas_peucker_recursive(x, y, tolerance, a, a + 1 + k, keep)
+        _douglas_peucker_recursive(x, y, tolerance, a + 1 + k, b, keep)
+
+
+def test_douglas_peucker_batch():
+    np.random.seed(1)
+    x = np.cumsum(np.random.uniform(0, 1, 300))
+    y = np.cumsum(np.random.uniform(-1, 1, 300))
+    # repeated points make degenerate segments
+    x[100:110] = x[100]
+    y[100:110] = y[100]
+    start = np.array([0, 2, 2, 40, 41, 200])
+    end = np.array([2, 2, 40, 41, 200, 300])
+    expected = np.zeros(len(x), dtype=bool)
+    for a, b in zip(start, end):
+        if b > a:
+            _douglas_peucker_recursive(x, y, 1.5, a, b - 1, expected)
+    keep = simplify_utils.douglas_peucker_batch(x, y, start, end, 1.5)
+    np.testing.assert_array_equal(keep, expected)
+
+
+def test_bad_method():
+    with pytest.raises(ValueError):
+        cuspatial.simplify_trajectories(
+            cudf.Series([0.0]),
+            cudf.Series([0.0]),
+            cudf.Series([1]),
+            cudf.Series([1]),
+            tolerance=1.0,
+            method="bogus",
+        )
@@ -0,0 +1,120 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import threading
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+from cuspatial.io import soa, soa_mmap
+
+
+@pytest.fixture
+def soa_files(tmp_path):
+    records = np.zeros(10, dtype=soa_mmap.LOCATION_DTYPE)
+    records["lon"] = np.arange(10.0)
+    records["lat"] = -np.arange(10.0)
+    root = str(tmp_path / "test")
+    records.tofile(root + ".location")
+    np.arange(100, 110, dtype="<i4").tofile(root + ".objectid")
+    np.arange(200, 210, dtype="<i8").tofile(root + ".time")
+    return root
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_points_lonlat(soa_files, prefetch):
+    chunks = list(
+        cuspatial.iter_points_lonlat(
+            soa_files + ".location", chunk_rows=4, prefetch=prefetch
+        )
+    )
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert_eq(
+        chunks[2], cudf.DataFrame({"lon": [8.0, 9.0], "lat": [-8.0, -9.0]})
+    )
+
+
+def test_iter_uint_and_timestamps(soa_files):
+    ids = list(cuspatial.iter_uint(soa_files + ".objectid", chunk_rows=6))
+    assert_eq(ids[1], cudf.Series([106, 107, 108, 109]).astype("int32"))
+    ts = list(cuspatial.iter_its_timestamps(soa_files + ".time"))
+    assert len(ts) == 1
+    assert_eq(ts[0], cudf.Series(np.arange(200, 210, dtype="int64")))
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_points_soa(soa_files, prefetch):
+    chunks = list(
+        cuspatial.iter_points_soa(
+            soa_files + ".location",
+            soa_files + ".objectid",
+            soa_files + ".time",
+            chunk_rows=3,
+            prefetch=prefetch,
+        )
+    )
+    assert [len(c) for c in chunks] == [3, 3, 3, 1]
+    assert_eq(
+        chunks[1],
+        cudf.DataFrame(
+            {
+                "lon": [3.0, 4.0, 5.0],
+                "lat": [-3.0, -4.0, -5.0],
+                "object_id": cudf.Series([103, 104, 105]).astype("int32"),
+                "timestamp": cudf.Series([203, 204, 205]).astype("int64"),
+            }
+        ),
+    )
+
+
+def test_iter_points_soa_misaligned(soa_files):
+    np.arange(11, dtype="<i4").tofile(soa_files + ".objectid")
+    with pytest.raises(ValueError):
+        next(
+            cuspatial.iter_points_soa(
+                soa_files + ".location",
+                soa_files + ".objectid",
+                soa_files + ".time",
+            )
+        )
+
+
+def test_iter_early_exit(soa_files):
+    for chunk in cuspatial.iter_points_lonlat(
+        soa_files + ".location", chunk_rows=1
+    ):
+        break
+    assert_eq(chunk, cudf.DataFrame({"lon": [0.0], "lat": [-0.0]}))
+
+
+def test_iter_invalid_chunk_rows(soa_files):
+    with pytest.raises(ValueError):
+        next(cuspatial.iter_uint(soa_files + ".objectid", chunk_rows=0))
+
+
+def test_prefetch_close_early():
+    last = threading.Event()
+
+    def chunks():
+        yield 0
+        yield 1
+        last.set()
+        yield 2
+
+    it = soa._prefetch(chunks())
+    assert next(it) == 0
+    assert last.wait(10)
+    # the producer is blocked putting the last chunk and still owes the
+    # sentinel, neither of which the consumer will take
+    it.close()
+
+
+def test_iter_points_lonlat_close_early(soa_files):
+    it = cuspatial.iter_points_lonlat(
+        soa_files + ".location", chunk_rows=4, prefetch=True
+    )
+    assert len(next(it)) == 4
+    it.close()
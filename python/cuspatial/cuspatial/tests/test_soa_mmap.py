@@ -0,0 +1,77 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+from cuspatial.io import soa_mmap
+
+
+@pytest.fixture
+def location_file(tmp_path):
+    records = np.zeros(5, dtype=soa_mmap.LOCATION_DTYPE)
+    records["lat"] = [40.0, 41.0, 42.0, 43.0, 44.0]
+    records["lon"] = [-90.0, -91.0, -92.0, -93.0, -94.0]
+    records["alt"] = 200.0
+    path = str(tmp_path / "test.location")
+    records.tofile(path)
+    return path
+
+
+def test_map_points_lonlat(location_file):
+    lon, lat = cuspatial.map_points_lonlat(location_file)
+    np.testing.assert_array_equal(lon, [-90.0, -91.0, -92.0, -93.0, -94.0])
+    np.testing.assert_array_equal(lat, [40.0, 41.0, 42.0, 43.0, 44.0])
+    # strided views of one mapping, not copies
+    assert lon.strides == (soa_mmap.LOCATION_DTYPE.itemsize,)
+    address = lat.__array_interface__["data"][0]
+    assert lon.__array_interface__["data"][0] == address + 8
+    assert memoryview(lon).nbytes == 5 * 8
+
+
+def test_map_points_lonlat_range(location_file):
+    lon, lat = cuspatial.map_points_lonlat(location_file, offset=1, count=3)
+    np.testing.assert_array_equal(lon, [-91.0, -92.0, -93.0])
+    np.testing.assert_array_equal(lat, [41.0, 42.0, 43.0])
+
+    lon, lat = cuspatial.map_points_lonlat(location_file, offset=3)
+    np.testing.assert_array_equal(lon, [-93.0, -94.0])
+
+    lon, lat = cuspatial.map_points_lonlat(location_file, offset=5)
+    assert len(lon) == 0 and len(lat) == 0
+
+
+@pytest.mark.parametrize("offset, count", [(-1, None), (6, None), (2, 4)])
+def test_map_points_lonlat_out_of_range(location_file, offset, count):
+    with pytest.raises(ValueError):
+        cuspatial.map_points_lonlat(location_file, offset, count)
+
+
+def test_map_truncated_file(tmp_path):
+    path = str(tmp_path / "bad.location")
+    np.zeros(7, dtype="<f8").tofile(path)
+    with pytest.raises(ValueError):
+        cuspatial.map_points_lonlat(path)
+
+
+def test_map_uint_and_timestamps(tmp_path):
+    ids = tmp_path / "test.objectid"
+    np.array([3, 1, 4, 1, 5], dtype="<i4").tofile(str(ids))
+    np.testing.assert_array_equal(
+        cuspatial.map_uint(str(ids), offset=2, count=2), [4, 1]
+    )
+    ts = tmp_path / "test.time"
+    np.array([10, 20, 30], dtype="<i8").tofile(str(ts))
+    np.testing.assert_array_equal(
+        cuspatial.map_its_timestamps(str(ts)), [10, 20, 30]
+    )
+
+
+def test_read_points_lonlat_range(location_file):
+    result = cuspatial.read_points_lonlat(location_file, offset=1, count=2)
+    assert_eq(
+        result, cudf.DataFrame({"lon": [-91.0, -92.0], "lat": [41.0, 42.0]})
+    )
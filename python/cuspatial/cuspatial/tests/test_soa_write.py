@@ -0,0 +1,85 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pytest
+
+import cudf
+
+import cuspatial
+from cuspatial.io.polygon_catalog import _read_ply
+
+
+def test_write_points_lonlat(tmp_path):
+    path = str(tmp_path / "test.location")
+    cuspatial.write_points_lonlat(
+        path, cudf.Series([-90.0, -91.0]), cudf.Series([40.0, 41.0])
+    )
+    lon, lat = cuspatial.map_points_lonlat(path)
+    np.testing.assert_array_equal(lon, [-90.0, -91.0])
+    np.testing.assert_array_equal(lat, [40.0, 41.0])
+
+
+def test_write_points_xy_km(tmp_path):
+    path = str(tmp_path / "test.coor")
+    cuspatial.write_points_xy_km(
+        path, cudf.Series([1.0, 2.0, 3.0]), cudf.Series([4.0, 5.0, 6.0])
+    )
+    x, y = cuspatial.map_points_xy_km(path)
+    np.testing.assert_array_equal(x, [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(y, [4.0, 5.0, 6.0])
+
+
+def test_write_uint_and_its_timestamps(tmp_path):
+    ids = str(tmp_path / "test.objectid")
+    times = str(tmp_path / "test.time")
+    cuspatial.write_uint(ids, cudf.Series([3, 1, 2]))
+    timestamps = cuspatial.encode_its_timestamps(
+        cudf.Series(np.array(["2020-01-02T03:04:05.006"], "datetime64[ms]")),
+        pid=7,
+    )
+    cuspatial.write_its_timestamps(times, timestamps)
+    np.testing.assert_array_equal(cuspatial.map_uint(ids), [3, 1, 2])
+    np.testing.assert_array_equal(
+        cuspatial.map_its_timestamps(times), timestamps.to_array()
+    )
+
+
+def test_write_polygon(tmp_path):
+    path = str(tmp_path / "test.ply")
+    cuspatial.write_polygon(
+        path,
+        cudf.Series([2, 3]),
+        cudf.Series([3, 6, 10]),
+        cudf.Series(np.arange(10.0)),
+        cudf.Series(-np.arange(10.0)),
+        g_pos=cudf.Series([1, 2]),
+    )
+    g_len, f_len, r_len, x, y = _read_ply(path)
+    np.testing.assert_array_equal(g_len, [1, 1])
+    np.testing.assert_array_equal(f_len, [2, 1])
+    np.testing.assert_array_equal(r_len, [3, 3, 4])
+    np.testing.assert_array_equal(x, np.arange(10.0))
+    np.testing.assert_array_equal(y, -np.arange(10.0))
+
+    # all features form one group by default
+    cuspatial.write_polygon(
+        path,
+        cudf.Series([2, 3]),
+        cudf.Series([3, 6, 10]),
+        cudf.Series(np.arange(10.0)),
+        cudf.Series(np.arange(10.0)),
+    )
+    np.testing.assert_array_equal(_read_ply(path)[0], [2])
+
+
+def test_write_polygon_errors(tmp_path):
+    path = str(tmp_path / "test.ply")
+    with pytest.raises(ValueError):
+        # r_pos does not end at the number of vertices
+        cuspatial.write_polygon(
+            path,
+            cudf.Series([1]),
+            cudf.Series([4]),
+            cudf.Series([0.0, 1.0, 2.0]),
+            cudf.Series([0.0, 1.0, 2.0]),
+        )
@@ -0,0 +1,133 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+
+
+def _expected(point_index, polygon_index):
+    return cudf.DataFrame(
+        {
+            "point_index": cudf.Series(point_index).astype("int32"),
+            "polygon_index": cudf.Series(polygon_index).astype("int32"),
+        }
+    )
+
+
+def _random_polygons(rng, num_polygons):
+    x, y, r_pos = [], [], []
+    for _ in range(num_polygons):
+        cx, cy = rng.uniform(0, 100, 2)
+        k = rng.randint(3, 9)
+        angle = np.sort(rng.uniform(0, 2 * np.pi, k))
+        radius = rng.uniform(1, 15, k)
+        ring_x = cx + radius * np.cos(angle)
+        ring_y = cy + radius * np.sin(angle)
+        x.extend(list(ring_x) + [ring_x[0]])
+        y.extend(list(ring_y) + [ring_y[0]])
+        r_pos.append(len(x))
+    f_pos = np.arange(1, num_polygons + 1)
+    return f_pos, np.array(r_pos), np.array(x), np.array(y)
+
+
+def _brute_force(px, py, f_pos, r_pos, x, y):
+    hits = []
+    for i in range(len(px)):
+        for j in range(len(f_pos)):
+            inside = False
+            for k in range(0 if j == 0 else f_pos[j - 1], f_pos[j]):
+                for m in range(0 if k == 0 else r_pos[k - 1], r_pos[k] - 1):
+                    x0, y0, x1, y1 = x[m], y[m], x[m + 1], y[m + 1]
+                    if ((y0 <= py[i] < y1) or (y1 <= py[i] < y0)) and (
+                        px[i] < (x1 - x0) * (py[i] - y0) / (y1 - y0) + x0
+                    ):
+                        inside = not inside
+            if inside:
+                hits.append((i, j))
+    return hits
+
+
+def test_dataset():
+    result = cuspatial.point_in_polygon_join(
+        cudf.Series([0, -8, 6.0]),
+        cudf.Series([0, -8, 6.0]),
+        cudf.Series([1, 2]),
+        cudf.Series([5, 10]),
+        cudf.Series([-10.0, 5, 5, -10, -10, 0, 10, 10, 0, 0]),
+        cudf.Series([-10.0, -10, 5, 5, -10, 0, 0, 10, 10, 0]),
+    )
+    assert_eq(result, _expected([0, 0, 1, 2], [0, 1, 0, 1]))
+
+
+def test_one_point_out():
+    result = cuspatial.point_in_polygon_join(
+        cudf.Series([1.0]),
+        cudf.Series([1.0]),
+        cudf.Series([1]),
+        cudf.Series([4]),
+        cudf.Series([-1.0, 0, 1, -1]),
+        cudf.Series([-1.0, 1, -1, -1]),
+    )
+    assert_eq(result, _expected([], []))
+
+
+def test_ring_hole():
+    # square with a square hole: only the point in the shell is a hit
+    result = cuspatial.point_in_polygon_join(
+        cudf.Series([0.0, 2.5]),
+        cudf.Series([0.0, 2.5]),
+        cudf.Series([2]),
+        cudf.Series([5, 10]),
+        cudf.Series([-3.0, 3, 3, -3, -3, -1, 1, 1, -1, -1]),
+        cudf.Series([-3.0, -3, 3, 3, -3, -1, -1, 1, 1, -1]),
+    )
+    assert_eq(result, _expected([1], [0]))
+
+
+def test_empty_points():
+    result = cuspatial.point_in_polygon_join(
+        cudf.Series([], dtype="float64"),
+        cudf.Series([], dtype="float64"),
+        cudf.Series([1]),
+        cudf.Series([4]),
+        cudf.Series([-1.0, 0, 1, -1]),
+        cudf.Series([-1.0, 1, -1, -1]),
+    )
+    assert_eq(result, _expected([], []))
+
+
+def test_mismatched_points():
+    with pytest.raises(ValueError):
+        cuspatial.point_in_polygon_join(
+            cudf.Series([0.0, 1.0]),
+            cudf.Series([0.0]),
+            cudf.Series([1]),
+            cudf.Series([4]),
+            cudf.Series([-1.0, 0, 1, -1]),
+            cudf.Series([-1.0, 1, -1, -1]),
+        )
+
+
+@pytest.mark.parametrize("grid_shape", [None, (1, 1), (7, 3)])
+def test_many_polygons(grid_shape):
+    rng = np.random.RandomState(0)
+    f_pos, r_pos, x, y = _random_polygons(rng, 100)
+    px = rng.uniform(-5, 105, 300)
+    py = rng.uniform(-5, 105, 300)
+    result = cuspatial.point_in_polygon_join(
+        cudf.Series(px),
+        cudf.Series(py),
+        cudf.Series(f_pos),
+        cudf.Series(r_pos),
+        cudf.Series(x),
+        cudf.Series(y),
+        grid_shape=grid_shape,
+        chunk_size=64,
+        num_threads=4,
+    )
+    hits = _brute_force(px, py, f_pos, r_pos, x, y)
+    assert_eq(result, _expected([h[0] for h in hits], [h[1] for h in hits]))
@@ -145,3 +145,114 @@ def test_class_triple():
         np.array([np.repeat(0, 5), np.repeat(1, 5), np.repeat(2, 5)])
     )
     assert_eq(g(t, groups=cudf.Series(groups)), x)
+
+
+def test_class_columns():
+    t = cudf.Series([0, 1, 2, 3, 4, 0, 1, 2, 3, 4]).astype("float32")
+    xy = cudf.DataFrame(
+        {
+            "x": cudf.Series([3, 2, 3, 4, 3, 3, 2, 3, 4, 3]).astype("float32"),
+            "y": cudf.Series([6, 4, 6, 8, 6, 6, 4, 6, 8, 6]).astype("float32"),
+        }
+    )
+    g = cuspatial.interpolate.CubicSpline(
+        t, xy, prefixes=cudf.Series([0, 5, 10]).astype("int32")
+    )
+    expected = cudf.DataFrame(
+        {
+            "d3": [0.5, -0.5, -0.5, 0.5] * 2,
+            "d2": [0, 3, 3, -6] * 2,
+            "d1": [-1.5, -4.5, -4.5, 22.5] * 2,
+            "d0": [3, 4, 4, -23] * 2,
+        }
+    )
+    assert_eq(g.c["x"], expected, check_dtype=False)
+    assert_eq(g.c["y"], expected * 2, check_dtype=False)
+    groups = cudf.Series(np.repeat([0, 1], 5))
+    assert_eq(g(t, groups=groups), xy)
+
+
+def test_class_interpolation_between_knots():
+    t = cudf.Series([0, 1, 2, 3, 4]).astype("float32")
+    x = cudf.Series([3, 2, 3, 4, 3]).astype("float32")
+    g = cuspatial.interpolate.CubicSpline(t, x)
+    assert_eq(
+        g(cudf.Series([0.5, 1.5, 2.5, 3.5]).astype("float32")),
+        cudf.Series([2.3125, 2.3125, 3.6875, 3.6875]).astype("float32"),
+    )
+
+
+def test_variable_length():
+    # the position column of cuspatial.derive, for splines of 5 and 3 points
+    t = cudf.Series([0, 1, 2, 3, 4, 0, 2, 3]).astype("float32")
+    x = cudf.Series([3, 2, 3, 4, 3, 1, 5, 3]).astype("float32")
+    g = cuspatial.CubicSpline(
+        t, x, prefixes=cudf.Series([5, 8]).astype("int32")
+    )
+    assert_eq(g.prefix, cudf.Series([0, 5, 8]).astype("int32"))
+    assert_eq(g(t, groups=cudf.Series([0, 0, 0, 0, 0, 1, 1, 1])), x)
+    # natural spline of the second curve has second derivatives 0, -4, 0
+    assert_eq(
+        g(
+            cudf.Series([1, 2.5]).astype("float32"),
+            groups=cudf.Series([1, 1]),
+        ),
+        cudf.Series([4, 4.25]).astype("float32"),
+    )
+
+
+def test_variable_length_errors():
+    t = cudf.Series([0, 1, 2, 3, 4, 0, 2, 3]).astype("float32")
+    x = cudf.Series([3, 2, 3, 4, 3, 1, 5, 3]).astype("float32")
+    # prefixes must cover t
+    with pytest.raises(ValueError):
+        cuspatial.CubicSpline(
+            t, x, prefixes=cudf.Series([5, 7]).astype("int32")
+        )
+    # every spline needs two points
+    with pytest.raises(ValueError):
+        cuspatial.CubicSpline(
+            t, x, prefixes=cudf.Series([7, 8]).astype("int32")
+        )
+
+
+def test_resample():
+    t = cudf.Series([0, 1, 2, 3, 4, 0, 2, 3]).astype("float32")
+    xy = cudf.DataFrame(
+        {
+            "x": cudf.Series([3, 2, 3, 4, 3, 1, 5, 3]).astype("float32"),
+            "y": cudf.Series([0, 1, 2, 3, 4, 0, 2, 3]).astype("float32"),
+        }
+    )
+    g = cuspatial.CubicSpline(
+        t, xy, prefixes=cudf.Series([0, 5, 8]).astype("int32")
+    )
+    new_t, new_xy, new_prefixes = g.resample(cudf.Series([3, 4]))
+    assert_eq(
+        new_t,
+        cudf.Series([0, 2, 4, 0, 1, 2, 3]).astype("float32"),
+    )
+    assert_eq(new_prefixes, cudf.Series([0, 3, 7]).astype("int32"))
+    assert_eq(
+        new_xy,
+        cudf.DataFrame(
+            {
+                "x": cudf.Series([3, 3, 3, 1, 4, 5, 3]).astype("float32"),
+                "y": cudf.Series([0, 2, 4, 0, 1, 2, 3]).astype("float32"),
+            }
+        ),
+    )
+
+
+def test_float64():
+    t = cudf.Series([0, 1, 2, 3, 4, 0, 2, 3]).astype("float64")
+    x = cudf.Series([3, 2, 3, 4, 3, 1, 5, 3]).astype("float64")
+    g = cuspatial.CubicSpline(
+        t, x, prefixes=cudf.Series([5, 8]).astype("int32")
+    )
+    assert g.c["d3"].dtype == np.float64
+    result = g(
+        cudf.Series([0.5, 2.5]).astype("float32"),
+        groups=cudf.Series([0, 1]),
+    )
+    assert_eq(result, cudf.Series([2.3125, 4.25]))
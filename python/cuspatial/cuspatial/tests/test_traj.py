@@ -7,6 +7,7 @@ import cudf
 from cudf.tests.utils import assert_eq
 
 import cuspatial
+from cuspatial.core import trajectory
 
 
 def test_subset_id_zeros():
@@ -258,6 +259,188 @@ def test_derive_trajectories_many():
     )
 
 
+def test_derive_trajectories_return_points():
+    x = cudf.Series([3.0, 2.0, 1.0, 0.0])
+    y = cudf.Series([30.0, 20.0, 10.0, 0.0])
+    ids = cudf.Series([1, 0, 1, 0]).astype("int32")
+    timestamps = cudf.Series([5, 7, 2, 3]).astype("datetime64[ms]")
+    num_trajectories, trajectories, points = cuspatial.derive(
+        x, y, ids, timestamps, return_points=True
+    )
+    assert num_trajectories == 2
+    assert_eq(
+        trajectories,
+        cudf.DataFrame(
+            {
+                "trajectory_id": cudf.Series([0, 1]).astype("int32"),
+                "length": cudf.Series([2, 2]).astype("int32"),
+                "position": cudf.Series([2, 4]).astype("int32"),
+            }
+        ),
+    )
+    assert_eq(
+        points,
+        cudf.DataFrame(
+            {
+                "x": [0.0, 2.0, 1.0, 3.0],
+                "y": [0.0, 20.0, 10.0, 30.0],
+                "object_id": cudf.Series([0, 0, 1, 1]).astype("int32"),
+                "timestamp": cudf.Series([3, 7, 2, 5]).astype(
+                    "datetime64[ms]"
+                ),
+            }
+        ),
+    )
+    # the inputs are not reordered
+    assert_eq(x, cudf.Series([3.0, 2.0, 1.0, 0.0]))
+    assert_eq(ids, cudf.Series([1, 0, 1, 0]).astype("int32"))
+
+
+def test_derive_trajectories_wide_key():
+    # id and time ranges too wide to pack into one 64-bit sort key
+    ids = cudf.Series([2 ** 31 - 1, -(2 ** 31), 2 ** 31 - 1, -(2 ** 31)])
+    timestamps = cudf.Series([2 ** 40, 0, -(2 ** 40), 1]).astype(
+        "datetime64[ms]"
+    )
+    _, trajectories, points = cuspatial.derive(
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        ids.astype("int32"),
+        timestamps,
+        return_points=True,
+    )
+    assert_eq(
+        trajectories["trajectory_id"],
+        cudf.Series([-(2 ** 31), 2 ** 31 - 1]).astype("int32"),
+        check_names=False,
+    )
+    assert_eq(
+        points["x"], cudf.Series([1.0, 3.0, 2.0, 0.0]), check_names=False
+    )
+
+
+def test_derive_trajectories_assume_sorted():
+    num_trajectories, trajectories = cuspatial.derive(
+        cudf.Series([0.0, 1.0, 2.0, 3.0, 4.0]),
+        cudf.Series([0.0, 1.0, 2.0, 3.0, 4.0]),
+        cudf.Series([4, 4, 4, 9, 9]),
+        cudf.Series([0, 1, 2, 0, 1]),
+        assume_sorted=True,
+    )
+    assert num_trajectories == 2
+    assert_eq(
+        trajectories,
+        cudf.DataFrame(
+            {
+                "trajectory_id": cudf.Series([4, 9]).astype("int32"),
+                "length": cudf.Series([3, 2]).astype("int32"),
+                "position": cudf.Series([3, 5]).astype("int32"),
+            }
+        ),
+    )
+
+
+@pytest.mark.parametrize("max_gap", [50, np.timedelta64(50, "ms")])
+def test_derive_trajectories_max_gap(max_gap):
+    num_trajectories, trajectories = cuspatial.derive(
+        cudf.Series([0.0, 1.0, 2.0, 3.0, 4.0]),
+        cudf.Series([0.0, 1.0, 2.0, 3.0, 4.0]),
+        cudf.Series([2, 1, 1, 1, 2]),
+        cudf.Series([5, 0, 10, 100, 0]).astype("datetime64[ms]"),
+        max_gap=max_gap,
+    )
+    assert num_trajectories == 3
+    assert_eq(
+        trajectories,
+        cudf.DataFrame(
+            {
+                "trajectory_id": cudf.Series([0, 1, 2]).astype("int32"),
+                "object_id": cudf.Series([1, 1, 2]).astype("int32"),
+                "length": cudf.Series([2, 1, 2]).astype("int32"),
+                "position": cudf.Series([2, 3, 5]).astype("int32"),
+            }
+        ),
+    )
+
+
+@pytest.mark.parametrize("unit", ["ns", "us", "ms", "s"])
+def test_derive_trajectories_max_gap_units(unit):
+    # consecutive points one and three seconds apart, split at two seconds
+    seconds = np.array([0, 1, 4, 5])
+    num_trajectories, trajectories = cuspatial.derive(
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        cudf.Series([0, 0, 0, 0]),
+        cudf.Series(
+            seconds.astype("datetime64[s]").astype("datetime64[" + unit + "]")
+        ),
+        max_gap=np.timedelta64(2, "s"),
+    )
+    assert num_trajectories == 2
+    assert_eq(
+        trajectories["length"],
+        cudf.Series([2, 2]).astype("int32"),
+        check_names=False,
+    )
+
+
+def test_derive_trajectories_max_jump_km():
+    num_trajectories, trajectories, points = cuspatial.derive(
+        cudf.Series([0.0, 0.5, 5.0, 5.5, 0.0]),
+        cudf.Series([0.0, 0.0, 0.0, 0.0, 0.0]),
+        cudf.Series([0, 0, 0, 0, 1]),
+        cudf.Series([0, 1, 2, 3, 0]).astype("datetime64[ms]"),
+        return_points=True,
+        max_jump_km=1.0,
+    )
+    assert num_trajectories == 3
+    assert_eq(
+        trajectories,
+        cudf.DataFrame(
+            {
+                "trajectory_id": cudf.Series([0, 1, 2]).astype("int32"),
+                "object_id": cudf.Series([0, 0, 1]).astype("int32"),
+                "length": cudf.Series([2, 2, 1]).astype("int32"),
+                "position": cudf.Series([2, 4, 5]).astype("int32"),
+            }
+        ),
+    )
+    assert_eq(
+        points["x"],
+        cudf.Series([0.0, 0.5, 5.0, 5.5, 0.0]),
+        check_names=False,
+    )
+
+
+def test_split_at_gaps_empty():
+    points = cudf.DataFrame(
+        {
+            "x": cudf.Series([], dtype="float64"),
+            "y": cudf.Series([], dtype="float64"),
+            "object_id": cudf.Series([], dtype="int32"),
+            "timestamp": cudf.Series([], dtype="datetime64[ms]"),
+        }
+    )
+    trajectories = trajectory._split_at_gaps(points, 50, 1.0)
+    assert len(trajectories) == 0
+    assert list(trajectories.columns) == [
+        "trajectory_id",
+        "object_id",
+        "length",
+        "position",
+    ]
+
+
+def test_derive_trajectories_size_mismatch():
+    with pytest.raises(ValueError):
+        cuspatial.derive(
+            cudf.Series([0.0, 1.0]),
+            cudf.Series([0.0]),
+            cudf.Series([0, 0]),
+            cudf.Series([0, 1]),
+        )
+
+
 def test_distance_and_speed_zeros():
     result = cuspatial.distance_and_speed(
         cudf.Series([0]),
@@ -364,3 +547,46 @@ def test_distance_and_speed_timestamp_types(timestamp_type):
         cudf.DataFrame({"meters": [1.0, 1.0], "speed": [1.0, 1.0]}),
         check_names=False,
     )
+
+
+def test_distance_and_speed_per_segment():
+    result = cuspatial.distance_and_speed(
+        cudf.Series([0.0, 0.003, 0.003, 1.0]),
+        cudf.Series([0.0, 0.004, 0.004, 1.0]),
+        cudf.Series([0, 1000, 1000, 0]),
+        cudf.Series([3, 1]),
+        cudf.Series([3, 4]),
+        per_segment=True,
+    )
+    nan = np.nan
+    assert_eq(
+        result,
+        cudf.DataFrame(
+            {
+                "meters": [0.0, 5.0, 0.0, 0.0],
+                "seconds": [0.0, 1.0, 0.0, 0.0],
+                "speed": [nan, 5.0, nan, nan],
+                "bearing": [nan, np.degrees(np.arctan2(4, 3)), nan, nan],
+            }
+        ),
+    )
+
+
+def test_spatial_bounds_float32():
+    result = cuspatial.spatial_bounds(
+        cudf.Series([0, 2, 1]).astype("float32"),
+        cudf.Series([0, 1, 3]).astype("float32"),
+        cudf.Series([3]),
+        cudf.Series([3]),
+    )
+    assert_eq(
+        result,
+        cudf.DataFrame(
+            {
+                "x1": cudf.Series([0.0]).astype("float32"),
+                "y1": cudf.Series([0.0]).astype("float32"),
+                "x2": cudf.Series([2.0]).astype("float32"),
+                "y2": cudf.Series([3.0]).astype("float32"),
+            }
+        ),
+    )
@@ -0,0 +1,137 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+import pytest
+
+import cudf
+from cudf.tests.utils import assert_eq
+
+import cuspatial
+
+
+def _trajectories(trajectory_id, length, position):
+    return cudf.DataFrame(
+        {
+            "trajectory_id": cudf.Series(trajectory_id).astype("int32"),
+            "length": cudf.Series(length).astype("int32"),
+            "position": cudf.Series(position).astype("int32"),
+        }
+    )
+
+
+def test_empty():
+    store = cuspatial.TrajectoryStore()
+    assert len(store) == 0
+    assert store.num_trajectories == 0
+    assert_eq(store.trajectories, _trajectories([], [], []))
+
+
+def test_append():
+    store = cuspatial.TrajectoryStore()
+    changed = store.append(
+        cudf.Series([0.0, 1.0, 2.0]),
+        cudf.Series([0.0, 1.0, 2.0]),
+        cudf.Series([7, 3, 7]),
+        cudf.Series([5, 0, 2]).astype("datetime64[ms]"),
+    )
+    np.testing.assert_array_equal(changed, [3, 7])
+    assert_eq(store.trajectories, _trajectories([3, 7], [1, 2], [1, 3]))
+
+    changed = store.append(
+        cudf.Series([3.0, 4.0]),
+        cudf.Series([3.0, 4.0]),
+        cudf.Series([7, 5]),
+        cudf.Series([3, 1]).astype("datetime64[ms]"),
+    )
+    np.testing.assert_array_equal(changed, [5, 7])
+    assert_eq(
+        store.trajectories, _trajectories([3, 5, 7], [1, 1, 3], [1, 2, 5])
+    )
+    assert_eq(
+        store.points,
+        cudf.DataFrame(
+            {
+                "x": [1.0, 4.0, 2.0, 3.0, 0.0],
+                "y": [1.0, 4.0, 2.0, 3.0, 0.0],
+                "object_id": cudf.Series([3, 5, 7, 7, 7]).astype("int32"),
+                "timestamp": cudf.Series([0, 1, 2, 3, 5]).astype(
+                    "datetime64[ms]"
+                ),
+            }
+        ),
+    )
+
+
+def test_single_point_appends():
+    # segments outgrow their capacity and the storage is compacted
+    store = cuspatial.TrajectoryStore()
+    ids = [4, 2, 4, 4, 9, 2, 4, 1, 4, 4, 2, 9]
+    for k, i in enumerate(ids):
+        store.append(
+            cudf.Series([float(k)]),
+            cudf.Series([0.0]),
+            cudf.Series([i]),
+            cudf.Series([len(ids) - k]).astype("datetime64[ms]"),
+        )
+    assert len(store) == len(ids)
+    assert_eq(
+        store.trajectories,
+        _trajectories([1, 2, 4, 9], [1, 3, 6, 2], [1, 4, 10, 12]),
+    )
+    assert_eq(
+        store.points["x"],
+        cudf.Series(
+            [7.0, 10.0, 5.0, 1.0, 9.0, 8.0, 6.0, 3.0, 2.0, 0.0, 11.0, 4.0]
+        ),
+        check_names=False,
+    )
+
+
+def test_subset():
+    store = cuspatial.TrajectoryStore()
+    store.append(
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        cudf.Series([0.0, 1.0, 2.0, 3.0]),
+        cudf.Series([1, 2, 2, 3]),
+        cudf.Series([0, 0, 1, 0]),
+    )
+    points, trajectories = store.subset(cudf.Series([3, 2, 9]))
+    assert_eq(trajectories, _trajectories([2, 3], [2, 1], [2, 3]))
+    assert_eq(points["x"], cudf.Series([1.0, 2.0, 3.0]), check_names=False)
+
+
+def test_size_mismatch():
+    store = cuspatial.TrajectoryStore()
+    with pytest.raises(ValueError):
+        store.append(
+            cudf.Series([0.0, 1.0]),
+            cudf.Series([0.0]),
+            cudf.Series([1, 2]),
+            cudf.Series([0, 0]),
+        )
+
+
+def test_matches_derive():
+    np.random.seed(0)
+    x = np.random.uniform(0, 10, 1000)
+    y = np.random.uniform(0, 10, 1000)
+    ids = np.random.randint(0, 50, 1000)
+    ts = np.random.randint(0, 100000, 1000)
+    store = cuspatial.TrajectoryStore()
+    for first in range(0, 1000, 128):
+        batch = slice(first, first + 128)
+        store.append(
+            cudf.Series(x[batch]),
+            cudf.Series(y[batch]),
+            cudf.Series(ids[batch]),
+            cudf.Series(ts[batch]).astype("datetime64[ms]"),
+        )
+    _, trajectories, points = cuspatial.derive(
+        cudf.Series(x),
+        cudf.Series(y),
+        cudf.Series(ids).astype("int32"),
+        cudf.Series(ts).astype("datetime64[ms]"),
+        return_points=True,
+    )
+    assert_eq(store.trajectories, trajectories)
+    assert_eq(store.points, points)
@@ -65,3 +65,24 @@ def test_half():
     )
     print(result)
     assert_eq(result, cudf.DataFrame({"x": [-1.0, 1.0], "y": [1.0, -1.0]}))
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_dtype(dtype):
+    result = cuspatial.window_points(
+        -1.1,
+        -1.1,
+        1.1,
+        1.1,
+        cudf.Series([0, 1, 2]).astype(dtype),
+        cudf.Series([1, 0, 2]).astype(dtype),
+    )
+    assert_eq(
+        result,
+        cudf.DataFrame(
+            {
+                "x": cudf.Series([0, 1]).astype(dtype),
+                "y": cudf.Series([1, 0]).astype(dtype),
+            }
+        ),
+    )
@@ -0,0 +1,38 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+
+
+def to_host(col, dtype=None):
+    """Return the values of a `cudf.Series` (or any array-like) as a host
+    numpy array, optionally cast to `dtype`.
+
+    numpy inputs are returned without a copy when no cast is needed.
+    """
+    if hasattr(col, "to_array"):
+        arr = col.to_array()
+    else:
+        arr = np.asarray(col)
+    if dtype is not None:
+        arr = arr.astype(dtype, copy=False)
+    return arr
+
+
+def float_dtype(*cols):
+    """The floating point dtype in which to process `cols` together:
+    float32 if every column is float32, float64 otherwise.
+    """
+    if cols and all(np.dtype(col.dtype) == np.float32 for col in cols):
+        return np.dtype("float32")
+    return np.dtype("float64")
+
+
+def column_as(col, dtype):
+    """The underlying column of the `cudf.Series` `col` in `dtype`.
+
+    The column is converted only when its dtype differs from `dtype`, so
+    inputs that already match are passed to libcuspatial without a copy.
+    """
+    if np.dtype(col.dtype) != np.dtype(dtype):
+        col = col.astype(dtype)
+    return col._column
@@ -1,6 +1,9 @@
 # Copyright (c) 2019, NVIDIA CORPORATION.
 import operator
 
+import cupy as cp
+import numpy as np
+
 import rmm
 from numba import cuda
 
@@ -38,3 +41,64 @@ def pip_bitmap_column_to_binary_array(polygon_bitmap_column, width):
     """
     binary_maps = apply_binarize(polygon_bitmap_column.data_array_view, width)
     return binary_maps
+
+
+@cuda.jit
+def count_bits(in_col, out):
+    """Count the set bits of each bitmap.
+    """
+    i = cuda.grid(1)
+    if i < in_col.size:
+        n = in_col[i]
+        count = 0
+        while n > 0:
+            n = operator.and_(n, n - 1)
+            count += 1
+        out[i] = count
+
+
+@cuda.jit
+def scatter_bits(in_col, offsets, points, polygons):
+    """Write one (row, bit) pair per set bit, starting at offsets[row].
+    """
+    i = cuda.grid(1)
+    if i < in_col.size:
+        n = in_col[i]
+        k = offsets[i]
+        j = 0
+        while n > 0:
+            if operator.mod(n, 2) == 1:
+                points[k] = i
+                polygons[k] = j
+                k += 1
+            n = operator.rshift(n, 1)
+            j += 1
+
+
+def _device_array(size, dtype):
+    buf = rmm.DeviceBuffer(size=(size * np.dtype(dtype).itemsize))
+    return cuda.as_cuda_array(buf).view(dtype)
+
+
+def apply_bitmap_to_pairs(in_col):
+    counts = cp.zeros(in_col.size, dtype="int64")
+    if in_col.size > 0:
+        count_bits.forall(in_col.size)(in_col, counts)
+    # offsets[i] is the number of hits before point i
+    offsets = cp.zeros(in_col.size + 1, dtype="int64")
+    cp.cumsum(counts, out=offsets[1:])
+    total = int(offsets[-1])
+    points = _device_array(total, "int32")
+    polygons = _device_array(total, "int32")
+    if total > 0:
+        scatter_bits.forall(in_col.size)(in_col, offsets, points, polygons)
+    return points, polygons
+
+
+def pip_bitmap_column_to_pairs(polygon_bitmap_column):
+    """Convert the bitmap output of cpp_point_in_polygon_bitmap to
+    (point index, polygon index) pairs, one per set bit, without expanding
+    the bitmap into a dense matrix.
+    """
+    bitmap = polygon_bitmap_column.data_array_view.view("uint32")
+    return apply_bitmap_to_pairs(bitmap)
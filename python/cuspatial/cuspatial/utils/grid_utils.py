@@ -0,0 +1,96 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+
+
+def grid_shape(num_items, cells_per_item=1.0):
+    """Pick a square grid resolution holding roughly `cells_per_item` cells
+    per indexed item.
+    """
+    side = int(np.ceil(np.sqrt(max(num_items, 1) * cells_per_item)))
+    return max(side, 1), max(side, 1)
+
+
+def grid_spec(xmin, ymin, xmax, ymax, shape):
+    """Describe a uniform grid covering the closed box [xmin, xmax] x
+    [ymin, ymax] with `shape` = (nx, ny) cells.
+
+    Returns (x0, y0, cell_w, cell_h, nx, ny). Degenerate extents get a cell
+    size of 1 so that every coordinate maps to cell 0 along that axis.
+    """
+    nx, ny = shape
+    cell_w = (xmax - xmin) / nx if xmax > xmin else 1.0
+    cell_h = (ymax - ymin) / ny if ymax > ymin else 1.0
+    return float(xmin), float(ymin), float(cell_w), float(cell_h), nx, ny
+
+
+def cell_coords(x, y, spec):
+    """Map coordinates to integer (cx, cy) cell coordinates of `spec`,
+    clamped to the grid.
+    """
+    x0, y0, cell_w, cell_h, nx, ny = spec
+    cx = np.floor((np.asarray(x) - x0) / cell_w)
+    cy = np.floor((np.asarray(y) - y0) / cell_h)
+    cx = np.clip(cx, 0, nx - 1).astype(np.int64)
+    cy = np.clip(cy, 0, ny - 1).astype(np.int64)
+    return cx, cy
+
+
+def build_cell_table(cell_ids, num_cells):
+    """Group items by cell into a CSR table.
+
+    Returns (offsets, items): the items of cell `c` are
+    `items[offsets[c]:offsets[c + 1]]`, in ascending item order.
+    """
+    cell_ids = np.asarray(cell_ids, dtype=np.int64)
+    items = np.argsort(cell_ids, kind="stable")
+    counts = np.bincount(cell_ids, minlength=num_cells)
+    offsets = np.zeros(num_cells + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets, items
+
+
+def expand_ranges(starts, ends):
+    """Concatenate the integer ranges [starts[i], ends[i]) into one array.
+
+    Returns (owner, values): `owner[k]` is the index `i` of the range that
+    produced `values[k]`.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    counts = np.asarray(ends, dtype=np.int64) - starts
+    counts = np.maximum(counts, 0)
+    owner = np.repeat(np.arange(len(starts)), counts)
+    first = np.zeros(len(starts), dtype=np.int64)
+    np.cumsum(counts[:-1], out=first[1:])
+    values = np.arange(counts.sum(), dtype=np.int64) - first[owner]
+    return owner, values + starts[owner]
+
+
+def box_cells(xmin, ymin, xmax, ymax, spec):
+    """List the cells overlapped by each box.
+
+    Returns (owner, cell_ids): one entry per (box, overlapped cell) pair.
+    """
+    nx = spec[4]
+    cx0, cy0 = cell_coords(xmin, ymin, spec)
+    cx1, cy1 = cell_coords(xmax, ymax, spec)
+    widths = cx1 - cx0 + 1
+    counts = widths * (cy1 - cy0 + 1)
+    owner, k = expand_ranges(np.zeros_like(counts), counts)
+    cx = cx0[owner] + k % widths[owner]
+    cy = cy0[owner] + k // widths[owner]
+    return owner, cy * nx + cx
+
+
+def box_row_ranges(xmin, ymin, xmax, ymax, spec):
+    """List the runs of cells overlapped by each box, one per grid row.
+
+    Cells of a row are numbered consecutively, so each run is the half-open
+    cell id range [first, last). Returns (owner, first, last) with one
+    entry per (box, overlapped row) pair.
+    """
+    nx = spec[4]
+    cx0, cy0 = cell_coords(xmin, ymin, spec)
+    cx1, cy1 = cell_coords(xmax, ymax, spec)
+    owner, cy = expand_ranges(cy0, cy1 + 1)
+    return owner, cy * nx + cx0[owner], cy * nx + cx1[owner] + 1
@@ -0,0 +1,254 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+
+from cuspatial.utils import grid_utils
+
+
+class Trajectories:
+    """Host-side view of trajectories stored back to back in x/y, with
+    `count` points each.
+    """
+
+    def __init__(self, x, y, count):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        count = np.asarray(count, dtype=np.int64)
+        if len(self.x) != len(self.y):
+            raise ValueError("x and y must have the same length")
+        if len(count) == 0:
+            raise ValueError("count cannot be empty")
+        if np.any(count <= 0):
+            raise ValueError("every trajectory must have at least one point")
+        self.end = np.cumsum(count)
+        self.start = self.end - count
+        if self.end[-1] > len(self.x):
+            raise ValueError("sum of count exceeds the number of points")
+        self.count = count
+        self.xmin = np.minimum.reduceat(self.x, self.start)
+        self.xmax = np.maximum.reduceat(self.x, self.start)
+        self.ymin = np.minimum.reduceat(self.y, self.start)
+        self.ymax = np.maximum.reduceat(self.y, self.start)
+
+    def __len__(self):
+        return len(self.count)
+
+    def points(self, i):
+        span = slice(self.start[i], self.end[i])
+        return self.x[span], self.y[span]
+
+    def lower_bound(self, i, j):
+        """Element-wise lower bound of the directed Hausdorff distance from
+        trajectory `i` to trajectory `j`: every point of `i` lies within
+        that distance of `j`, so the bounding box of `i` fits in the box of
+        `j` grown by it.
+        """
+        gap = np.maximum.reduce(
+            [
+                self.xmin[j] - self.xmin[i],
+                self.xmax[i] - self.xmax[j],
+                self.ymin[j] - self.ymin[i],
+                self.ymax[i] - self.ymax[j],
+            ]
+        )
+        return np.maximum(gap, 0)
+
+
+def directed_hausdorff_early_break(
+    ax, ay, bx, by, max_distance=np.inf, block_size=64, seed=0
+):
+    """Directed Hausdorff distance from point set A to point set B using the
+    early-break algorithm of Taha and Hanbury (2015).
+
+    Points of both sets are visited in random order. A point of A stops
+    scanning B as soon as it finds a point closer than the running maximum,
+    since it can no longer raise it, and the whole computation stops once
+    the running maximum exceeds `max_distance`. Points are processed in
+    blocks of `block_size` so that each step is a vectorized numpy
+    operation.
+
+    Returns the distance, or `np.inf` if it exceeds `max_distance`.
+    """
+    rng = np.random.RandomState(seed)
+    a_order = rng.permutation(len(ax))
+    b_order = rng.permutation(len(bx))
+    ax, ay = ax[a_order], ay[a_order]
+    bx, by = bx[b_order], by[b_order]
+    limit = max_distance * max_distance
+    cmax = 0.0
+    for first in range(0, len(ax), block_size):
+        px = ax[first : first + block_size]
+        py = ay[first : first + block_size]
+        cmin = np.full(len(px), np.inf)
+        active = np.arange(len(px))
+        for b in range(0, len(bx), block_size):
+            dx = px[active, None] - bx[None, b : b + block_size]
+            dy = py[active, None] - by[None, b : b + block_size]
+            cmin[active] = np.minimum(
+                cmin[active], (dx * dx + dy * dy).min(axis=1)
+            )
+            # early break: these points cannot raise the maximum
+            active = active[cmin[active] >= cmax]
+            if len(active) == 0:
+                break
+        cmax = max(cmax, cmin.max())
+        if cmax > limit:
+            return np.inf
+    return np.sqrt(cmax)
+
+
+def _pair_indices(trajectories, source, target):
+    source = np.asarray(source, dtype=np.int64)
+    target = np.asarray(target, dtype=np.int64)
+    if len(source) != len(target):
+        raise ValueError("pair index arrays must have the same length")
+    if len(source) and (
+        min(source.min(), target.min()) < 0
+        or max(source.max(), target.max()) >= len(trajectories)
+    ):
+        raise ValueError("pair index out of range")
+    return source, target
+
+
+def directed_hausdorff_within(
+    trajectories, max_distance, pairs=None, block_size=64, seed=0
+):
+    """Directed Hausdorff distances no greater than `max_distance`, the
+    host reference of the GPU threshold mode of
+    `directed_hausdorff_distance`.
+
+    Evaluates every ordered pair of `trajectories`, or only the
+    (source, target) index arrays in `pairs`. Pairs whose bounding boxes
+    already rule them out are skipped without touching their points.
+
+    Returns (source, target, distance) arrays of the pairs within
+    `max_distance`, in the order they were evaluated.
+    """
+    n = len(trajectories)
+    if pairs is None:
+        source = np.repeat(np.arange(n), n)
+        target = np.tile(np.arange(n), n)
+    else:
+        source, target = _pair_indices(trajectories, pairs[0], pairs[1])
+    candidates = np.flatnonzero(
+        trajectories.lower_bound(source, target) <= max_distance
+    )
+    distance = np.full(len(source), np.inf)
+    for k in candidates:
+        i, j = source[k], target[k]
+        if i == j:
+            distance[k] = 0.0
+            continue
+        ax, ay = trajectories.points(i)
+        bx, by = trajectories.points(j)
+        distance[k] = directed_hausdorff_early_break(
+            ax, ay, bx, by, max_distance, block_size, seed
+        )
+    keep = distance <= max_distance
+    return source[keep], target[keep], distance[keep]
+
+
+def directed_hausdorff_tile(trajectories, rows, cols, max_elements=1 << 22):
+    """Dense directed Hausdorff distances from the trajectories in range
+    `rows` to those in range `cols`, as a len(rows) x len(cols) array.
+
+    Works for trajectories of any length: source points are processed in
+    blocks so that each distance block holds about `max_elements` values.
+    """
+    t = trajectories
+    first = t.start[cols.start]
+    bx = t.x[first : t.end[cols.stop - 1]]
+    by = t.y[first : t.end[cols.stop - 1]]
+    segments = t.start[cols.start : cols.stop] - first
+    block = max(1, max_elements // len(bx))
+    tile = np.empty((len(rows), len(cols)))
+    for r, i in enumerate(rows):
+        ax, ay = t.points(i)
+        farthest = np.zeros(len(cols))
+        for a in range(0, len(ax), block):
+            dx = ax[a : a + block, None] - bx[None, :]
+            dy = ay[a : a + block, None] - by[None, :]
+            nearest = np.minimum.reduceat(dx * dx + dy * dy, segments, axis=1)
+            np.maximum(farthest, nearest.max(axis=0), out=farthest)
+        tile[r] = np.sqrt(farthest)
+    return tile
+
+
+def hausdorff_one_to_many(
+    trajectories, i, targets, backward=True, max_elements=1 << 22
+):
+    """Directed Hausdorff distances between trajectory `i` and each of the
+    `targets` trajectory indices, in both directions from one set of point
+    distances.
+
+    Returns (forward, backward): the distances from `i` to each target and
+    from each target to `i`; `backward` is None unless requested.
+    """
+    t = trajectories
+    ax, ay = t.points(i)
+    forward = np.zeros(len(targets))
+    reverse = np.zeros(len(targets)) if backward else None
+    a_block = max(1, max_elements // max(1, t.count[targets].max()))
+    first = 0
+    while first < len(targets):
+        # as many targets as fit in one block of distances, at least one
+        sizes = np.cumsum(t.count[targets[first:]]) * min(a_block, len(ax))
+        last = first + max(1, np.searchsorted(sizes, max_elements, "right"))
+        chunk = targets[first:last]
+        owner, idx = grid_utils.expand_ranges(t.start[chunk], t.end[chunk])
+        segments = np.searchsorted(owner, np.arange(len(chunk)))
+        bx = t.x[idx]
+        by = t.y[idx]
+        farthest = np.zeros(len(chunk))
+        nearest_b = np.full(len(idx), np.inf)
+        for a in range(0, len(ax), a_block):
+            dx = ax[a : a + a_block, None] - bx[None, :]
+            dy = ay[a : a + a_block, None] - by[None, :]
+            d2 = dx * dx + dy * dy
+            nearest_a = np.minimum.reduceat(d2, segments, axis=1)
+            np.maximum(farthest, nearest_a.max(axis=0), out=farthest)
+            if backward:
+                np.minimum(nearest_b, d2.min(axis=0), out=nearest_b)
+        forward[first:last] = np.sqrt(farthest)
+        if backward:
+            reverse[first:last] = np.sqrt(
+                np.maximum.reduceat(nearest_b, segments)
+            )
+        first = last
+    return forward, reverse
+
+
+def hausdorff_pairs(trajectories, source, target, symmetric=False):
+    """Directed (or, with `symmetric`, symmetric) Hausdorff distances of the
+    trajectory pairs (source[k], target[k]), grouping pairs by source; the
+    host reference of the `pairs` mode of `directed_hausdorff_distance`.
+    """
+    source, target = _pair_indices(trajectories, source, target)
+    distance = np.empty(len(source))
+    order = np.argsort(source, kind="stable")
+    groups = np.flatnonzero(np.diff(source[order], prepend=-1))
+    for first, last in zip(groups, np.append(groups[1:], len(order))):
+        k = order[first:last]
+        forward, backward = hausdorff_one_to_many(
+            trajectories, source[k[0]], target[k], backward=symmetric
+        )
+        distance[k] = np.maximum(forward, backward) if symmetric else forward
+    return distance
+
+
+def hausdorff_condensed(trajectories):
+    """Symmetric Hausdorff distances of every pair i < j in the condensed
+    layout of `scipy.spatial.distance.pdist`, the host reference of the
+    `symmetric` mode of `directed_hausdorff_distance`. Each pair's point
+    distances are computed once and serve both directions.
+    """
+    n = len(trajectories)
+    condensed = np.empty(n * (n - 1) // 2)
+    offset = 0
+    for i in range(n - 1):
+        forward, backward = hausdorff_one_to_many(
+            trajectories, i, np.arange(i + 1, n)
+        )
+        condensed[offset : offset + n - i - 1] = np.maximum(forward, backward)
+        offset += n - i - 1
+    return condensed
@@ -0,0 +1,91 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import numpy as np
+
+from cuspatial.utils import grid_utils
+
+
+class PolygonEdges:
+    """Host-side edge table of a polygon SoA (f_pos, r_pos, x, y).
+
+    `f_pos` and `r_pos` are the inclusive prefix sums of rings per polygon
+    and vertices per ring, as returned by the polygon readers. Rings must
+    be closed, matching `point_in_polygon_bitmap`, so the edges of a ring
+    are its consecutive vertex pairs.
+    """
+
+    def __init__(self, f_pos, r_pos, x, y):
+        f_pos = np.asarray(f_pos, dtype=np.int64)
+        r_pos = np.asarray(r_pos, dtype=np.int64)
+        x = np.asarray(x)
+        y = np.asarray(y)
+        if len(f_pos) == 0 or len(r_pos) == 0:
+            raise ValueError("polygon index cannot be empty")
+        if len(x) != len(y):
+            raise ValueError(
+                "polygon vertice sizes mismatch between x/y arrays"
+            )
+        if f_pos[-1] > len(r_pos) or r_pos[-1] > len(x):
+            raise ValueError("polygon index exceeds the number of vertices")
+
+        ring_first = np.concatenate([[0], r_pos[:-1]])
+        poly_first_ring = np.concatenate([[0], f_pos[:-1]])
+        vertex_first = ring_first[poly_first_ring]
+        vertex_last = r_pos[f_pos - 1]
+
+        # every vertex except the last of each ring starts an edge
+        starts_edge = np.ones(len(x), dtype=bool)
+        starts_edge[r_pos - 1] = False
+        starts_edge[r_pos[-1] :] = False
+        edge_scan = np.zeros(len(x) + 1, dtype=np.int64)
+        np.cumsum(starts_edge, out=edge_scan[1:])
+        e = np.flatnonzero(starts_edge)
+
+        self.num_polygons = len(f_pos)
+        self.edge_first = edge_scan[vertex_first]
+        self.edge_last = edge_scan[vertex_last]
+        self.x0 = x[e]
+        self.y0 = y[e]
+        self.x1 = x[e + 1]
+        self.y1 = y[e + 1]
+
+        # polygons are stored back to back, so each reduceat segment is
+        # exactly one polygon's vertex range
+        nonempty = vertex_last > vertex_first
+        bounds = []
+        for coords, reduce, empty in (
+            (x, np.minimum, np.inf),
+            (y, np.minimum, np.inf),
+            (x, np.maximum, -np.inf),
+            (y, np.maximum, -np.inf),
+        ):
+            coords = coords[: vertex_last[-1]]
+            if len(coords) == 0:
+                bounds.append(np.full(len(f_pos), empty))
+                continue
+            first = np.minimum(vertex_first, len(coords) - 1)
+            bounds.append(
+                np.where(nonempty, reduce.reduceat(coords, first), empty)
+            )
+        self.xmin, self.ymin, self.xmax, self.ymax = bounds
+
+    def contains(self, px, py, point_idx, poly_idx):
+        """Run the even-odd crossing test of `pip_kernel` for each candidate
+        (point, polygon) pair and return a boolean mask of the pairs whose
+        point lies inside the polygon.
+        """
+        pair, edge = grid_utils.expand_ranges(
+            self.edge_first[poly_idx], self.edge_last[poly_idx]
+        )
+        x = px[point_idx[pair]]
+        y = py[point_idx[pair]]
+        x0 = self.x0[edge]
+        y0 = self.y0[edge]
+        x1 = self.x1[edge]
+        y1 = self.y1[edge]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crosses = (((y0 <= y) & (y < y1)) | ((y1 <= y) & (y < y0))) & (
+                x < (x1 - x0) * (y - y0) / (y1 - y0) + x0
+            )
+        counts = np.bincount(pair, weights=crosses, minlength=len(poly_idx))
+        return (counts.astype(np.int64) & 1).astype(bool)
@@ -0,0 +1,109 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.
+
+import heapq
+
+import numpy as np
+
+from cuspatial.utils import grid_utils
+
+
+def _segment_distance(px, py, ax, ay, bx, by):
+    """Distances from points (px, py) to the segments from (ax, ay) to
+    (bx, by); the endpoints may be scalars or one per point.
+    """
+    dx = bx - ax
+    dy = by - ay
+    norm = dx * dx + dy * dy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = ((px - ax) * dx + (py - ay) * dy) / norm
+    # a degenerate segment is its first point
+    t = np.where(norm == 0, 0, np.clip(t, 0, 1))
+    return np.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def douglas_peucker_batch(x, y, start, end, tolerance):
+    """Mask of the points of the polylines [start[i], end[i]) of x and y
+    kept by the Douglas-Peucker algorithm: a point survives if it lies
+    farther than `tolerance` from the simplified segment that would replace
+    it. Both endpoints of every polyline are kept.
+
+    The recursion runs breadth first over all polylines together: each
+    pass finds the farthest interior point of every open segment with one
+    segmented reduction, so the number of passes is the recursion depth,
+    not the number of polylines.
+    """
+    start = np.asarray(start, dtype=np.int64)
+    end = np.asarray(end, dtype=np.int64)
+    keep = np.zeros(len(x), dtype=bool)
+    nonempty = end > start
+    keep[start[nonempty]] = True
+    keep[end[nonempty] - 1] = True
+    a, b = start, end - 1
+    while True:
+        open_ = b - a >= 2
+        a, b = a[open_], b[open_]
+        if len(a) == 0:
+            return keep
+        owner, idx = grid_utils.expand_ranges(a + 1, b)
+        d = _segment_distance(
+            x[idx], y[idx], x[a][owner], y[a][owner], x[b][owner], y[b][owner]
+        )
+        first = np.concatenate([[0], np.cumsum(b - a - 1)[:-1]])
+        farthest = np.maximum.reduceat(d, first)
+        # the first point at the maximum, as np.argmax would pick
+        at_max = np.where(d == farthest[owner], idx, len(x))
+        m = np.minimum.reduceat(at_max, first)
+        split = farthest > tolerance
+        a, m, b = a[split], m[split], b[split]
+        keep[m] = True
+        a, b = np.concatenate([a, m]), np.concatenate([m, b])
+
+
+def douglas_peucker(x, y, tolerance):
+    """Douglas-Peucker mask of the points of one polyline."""
+    return douglas_peucker_batch(x, y, [0], [len(x)], tolerance)
+
+
+def _triangle_area(x, y, a, b, c):
+    return 0.5 * abs(
+        (x[b] - x[a]) * (y[c] - y[a]) - (x[c] - x[a]) * (y[b] - y[a])
+    )
+
+
+def visvalingam(x, y, tolerance):
+    """Mask of the points of one polyline kept by the Visvalingam-Whyatt
+    algorithm: the point forming the smallest triangle with its neighbours
+    is removed until every remaining triangle has an area of at least
+    `tolerance`. Both endpoints are kept.
+    """
+    n = len(x)
+    keep = np.ones(n, dtype=bool)
+    if n < 3:
+        return keep
+    prev = np.arange(-1, n - 1)
+    next_ = np.arange(1, n + 1)
+    area = np.full(n, np.inf)
+    area[1:-1] = 0.5 * np.abs(
+        (x[1:-1] - x[:-2]) * (y[2:] - y[:-2])
+        - (x[2:] - x[:-2]) * (y[1:-1] - y[:-2])
+    )
+    heap = [(area[i], i) for i in range(1, n - 1)]
+    heapq.heapify(heap)
+    while heap:
+        a, i = heapq.heappop(heap)
+        if not keep[i] or a != area[i]:
+            # stale entry of a removed or updated point
+            continue
+        if a >= tolerance:
+            break
+        keep[i] = False
+        p, q = prev[i], next_[i]
+        next_[p] = q
+        prev[q] = p
+        for j in (p, q):
+            if 0 < j < n - 1:
+                # never let an area fall below the one just removed, so
+                # removal order stays monotonic
+                area[j] = max(_triangle_area(x, y, prev[j], j, next_[j]), a)
+                heapq.heappush(heap, (area[j], j))
+    return keep
@@ -1,3 +1,24 @@
+import numpy as np
+
+# (name, bit width) of the its_timestamp bitfields in
+# cpp/include/cuspatial/types.hpp, from the least significant bit up
+ITS_TIMESTAMP_FIELDS = (
+    ("y", 6),
+    ("m", 4),
+    ("d", 5),
+    ("hh", 5),
+    ("mm", 6),
+    ("ss", 6),
+    ("wd", 3),
+    ("yd", 9),
+    ("ms", 10),
+    ("pid", 10),
+)
+
+# its_timestamp.y counts years from 2000
+ITS_TIMESTAMP_EPOCH_YEAR = 2000
+
+
 def get_ts_struct(ts):
     y = ts & 0x3F
     ts = ts >> 6
@@ -11,7 +32,7 @@ def get_ts_struct(ts):
     ts = ts >> 6
     ss = ts & 0x3F
     ts = ts >> 6
-    wd = ts & 0x8
+    wd = ts & 0x7
     ts = ts >> 3
     yd = ts & 0x1FF
     ts = ts >> 9
@@ -20,3 +41,78 @@ def get_ts_struct(ts):
     pid = ts & 0x3FF
 
     return y, m, d, hh, mm, ss, wd, yd, ms, pid
+
+
+def decode_its_timestamps(ts):
+    """Unpack an array of its_timestamps into a dict of int32 field arrays
+    keyed by the names in ITS_TIMESTAMP_FIELDS.
+    """
+    ts = np.asarray(ts).astype(np.uint64, copy=False)
+    fields = {}
+    shift = 0
+    for name, width in ITS_TIMESTAMP_FIELDS:
+        mask = np.uint64((1 << width) - 1)
+        fields[name] = ((ts >> np.uint64(shift)) & mask).astype(np.int32)
+        shift += width
+    return fields
+
+
+def its_timestamps_to_datetime(ts):
+    """Convert an array of its_timestamps to datetime64[ms].
+
+    `m` is the zero-based month and `d` the day of the month, as filled in
+    from `struct tm` by data/json2soa.cpp.
+    """
+    f = decode_its_timestamps(ts)
+    years = f["y"] + (ITS_TIMESTAMP_EPOCH_YEAR - 1970)
+    months = years.astype("datetime64[Y]").astype("datetime64[M]") + f["m"]
+    days = months.astype("datetime64[D]") + (f["d"] - 1)
+    ms = (
+        f["hh"].astype(np.int64) * 3600000
+        + f["mm"] * 60000
+        + f["ss"] * 1000
+        + f["ms"]
+    )
+    return days.astype("datetime64[ms]") + ms.astype("timedelta64[ms]")
+
+
+def encode_its_timestamps(times, pid=0):
+    """Pack datetime64 values and place ids into an int64 array of
+    its_timestamps, the inverse of `its_timestamps_to_datetime`.
+
+    Weekday and day of year are derived from the date, with Sunday as
+    weekday 0 and January 1st as day 0 as in `struct tm`.
+    """
+    times = np.asarray(times).astype("datetime64[ms]")
+    days = times.astype("datetime64[D]")
+    months = times.astype("datetime64[M]")
+    years = times.astype("datetime64[Y]")
+    y = years.astype(np.int64) + (1970 - ITS_TIMESTAMP_EPOCH_YEAR)
+    if y.size and (y.min() < 0 or y.max() >= 64):
+        raise ValueError(
+            "its_timestamp years must be within [2000, 2064) for encoding"
+        )
+    ms_of_day = (times - days).astype(np.int64)
+    fields = {
+        "y": y,
+        "m": months.astype(np.int64) % 12,
+        "d": (days - months.astype("datetime64[D]")).astype(np.int64) + 1,
+        "hh": ms_of_day // 3600000,
+        "mm": ms_of_day // 60000 % 60,
+        "ss": ms_of_day // 1000 % 60,
+        # 1970-01-01 was a Thursday
+        "wd": (days.astype(np.int64) + 4) % 7,
+        "yd": (days - years.astype("datetime64[D]")).astype(np.int64),
+        "ms": ms_of_day % 1000,
+        "pid": np.broadcast_to(np.asarray(pid, dtype=np.int64), times.shape),
+    }
+    if fields["pid"].size and (
+        fields["pid"].min() < 0 or fields["pid"].max() >= 1024
+    ):
+        raise ValueError("its_timestamp place ids must be within [0, 1024)")
+    ts = np.zeros(times.shape, dtype=np.uint64)
+    shift = 0
+    for name, width in ITS_TIMESTAMP_FIELDS:
+        ts |= fields[name].astype(np.uint64) << np.uint64(shift)
+        shift += width
+    return ts.view(np.int64)
@@ -0,0 +1,80 @@
+"""
+Compare wall time and peak GPU memory of the point_in_polygon_bitmap output
+modes: the default Boolean DataFrame (bitmap -> int8 matrix -> bool
+DataFrame), the sparse (point, polygon) pairs, and the packed bitmap.
+
+Peak memory is derived from the RMM allocation log, so RMM is initialized
+with logging enabled; it counts only allocations made during each call.
+
+Usage: python pip_output_modes_benchmark.py [num_points]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import rmm
+from cudf import Series
+
+import cuspatial
+
+
+def peak_bytes(log, first_event):
+    live = {}
+    current = peak = 0
+    log = log.iloc[first_event:]
+    for event, address, size in zip(
+        log["Event Type"], log["Address"], log["Size"]
+    ):
+        if event == "Alloc":
+            live[address] = size
+            current += size
+            peak = max(peak, current)
+        elif event == "Free":
+            current -= live.pop(address, 0)
+    return peak
+
+
+def grid_polygons(num_polygons, extent):
+    """Square polygons tiling [0, extent]^2, closed as required."""
+    side = int(np.ceil(np.sqrt(num_polygons)))
+    step = extent / side
+    xs, ys = [], []
+    for i in range(num_polygons):
+        x0 = (i % side) * step
+        y0 = (i // side) * step
+        xs.extend([x0, x0 + step, x0 + step, x0, x0])
+        ys.extend([y0, y0, y0 + step, y0 + step, y0])
+    f_pos = np.arange(1, num_polygons + 1, dtype=np.int32)
+    r_pos = np.arange(1, num_polygons + 1, dtype=np.int32) * 5
+    return f_pos, r_pos, np.array(xs), np.array(ys)
+
+
+num_points = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+rmm.reinitialize(logging=True)
+
+f_pos, r_pos, poly_x, poly_y = grid_polygons(31, 100.0)
+pnt_x = Series(np.random.uniform(0, 100, num_points))
+pnt_y = Series(np.random.uniform(0, 100, num_points))
+args = (
+    pnt_x,
+    pnt_y,
+    Series(f_pos),
+    Series(r_pos),
+    Series(poly_x),
+    Series(poly_y),
+)
+
+for output in ["dataframe", "pairs", "packed"]:
+    first_event = len(rmm.csv_log())
+    start = time.time()
+    result = cuspatial.point_in_polygon_bitmap(*args, output=output)
+    end = time.time()
+    peak = peak_bytes(rmm.csv_log(), first_event)
+    print(
+        "output={:<10} time in ms={:10.2f} peak GPU MB={:10.2f}".format(
+            output, (end - start) * 1000, peak / 2 ** 20
+        )
+    )
+    del result
@@ -0,0 +1,50 @@
+"""
+Compare one cuspatial.window_points call per window with a single
+cuspatial.points_in_windows call over the same windows, e.g. per-camera ROI
+boxes over the locust points.
+
+Usage: python points_in_windows_benchmark.py [num_points] [num_windows]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from cudf import Series
+
+import cuspatial
+
+num_points = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+num_windows = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+x = np.random.uniform(0, 100, num_points)
+y = np.random.uniform(0, 100, num_points)
+lefts = np.random.uniform(0, 95, num_windows)
+bottoms = np.random.uniform(0, 95, num_windows)
+rights = lefts + np.random.uniform(0.1, 5, num_windows)
+tops = bottoms + np.random.uniform(0.1, 5, num_windows)
+pnt_x = Series(x)
+pnt_y = Series(y)
+
+start = time.time()
+total = 0
+for window in zip(lefts, bottoms, rights, tops):
+    total += len(cuspatial.window_points(*window, pnt_x, pnt_y))
+end = time.time()
+print(
+    "window_points x {}: {} hits, time in ms={:.2f}".format(
+        num_windows, total, (end - start) * 1000
+    )
+)
+
+start = time.time()
+result = cuspatial.points_in_windows(
+    Series(lefts), Series(bottoms), Series(rights), Series(tops), pnt_x, pnt_y
+)
+end = time.time()
+print(
+    "points_in_windows: {} hits, time in ms={:.2f}".format(
+        len(result), (end - start) * 1000
+    )
+)
@@ -10,14 +10,19 @@ lonlats = cuspatial.read_points_lonlat(data_dir + "locust.location")
 ids = cuspatial.read_uint(data_dir + "locust.objectid")
 ts = cuspatial.read_its_timestamps(data_dir + "locust.time")
 
-num_traj, trajectories = cuspatial.derive(
-    lonlats["lon"], lonlats["lat"], ids, ts
+# derive leaves its inputs unsorted; subset the points in trajectory order
+num_traj, trajectories, points = cuspatial.derive(
+    lonlats["lon"], lonlats["lat"], ids, ts, return_points=True
 )
 df = trajectories.query("length>=256")
 query_ids = df["trajectory_id"]
 query_cnts = df["length"]
 new_trajs = cuspatial.subset_trajectory_id(
-    query_ids, lonlats["lon"], lonlats["lat"], ids, ts
+    query_ids,
+    points["x"],
+    points["y"],
+    points["object_id"],
+    points["timestamp"],
 )
 new_lon = new_trajs["x"]
 new_lat = new_trajs["y"]
@@ -33,15 +33,21 @@ y, m, d, hh, mm, ss, wd, yd, ms, pid = tools.get_ts_struct(ts_0)
 xys = cuspatial.lonlat_to_xy_km_coordinates(
     cam_lon, cam_lat, lonlats["lon"], lonlats["lat"]
 )
-num_traj, trajectories = cuspatial.derive(xys["x"], xys["y"], ids, ts)
-#  = num_traj, tid, len, pos =
-y, m, d, hh, mm, ss, wd, yd, ms, pid = tools.get_ts_struct(ts_0)
+# packed its_timestamps do not sort chronologically; derive on datetimes
+ts = cuspatial.its_timestamps_to_datetime(ts)
+num_traj, trajectories, points = cuspatial.derive(
+    xys["x"], xys["y"], ids, ts, return_points=True
+)
 distspeed = cuspatial.distance_and_speed(
-    xys["x"], xys["y"], ts, trajectories["length"], trajectories["position"]
+    points["x"],
+    points["y"],
+    points["timestamp"],
+    trajectories["length"],
+    trajectories["position"],
 )
 print(distspeed)
 
 boxes = cuspatial.spatial_bounds(
-    xys["x"], xys["y"], trajectories["length"], trajectories["position"]
+    points["x"], points["y"], trajectories["length"], trajectories["position"]
 )
 print(boxes.head())
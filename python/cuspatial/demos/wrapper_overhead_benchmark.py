@@ -0,0 +1,58 @@
+"""
+Measure the fixed per-call cost of the cuspatial Python API: argument
+marshalling (dtype checks, conversions and gdf_column views) plus kernel
+launch, on inputs too small for the kernels themselves to matter.
+
+Inputs are passed once in the dtype the API works in, so no conversion is
+needed, and once in int64, which every call must convert first. Either way,
+every call still mallocs and frees a gdf_column view of each input in
+column_view_from_column.
+
+Usage: python wrapper_overhead_benchmark.py [num_calls] [num_points]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from cudf import Series
+
+import cuspatial
+
+num_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+num_points = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+
+def per_call_us(func, *args):
+    func(*args)
+    start = time.time()
+    for _ in range(num_calls):
+        func(*args)
+    return (time.time() - start) * 1e6 / num_calls
+
+
+def window_points(x, y):
+    return cuspatial.window_points(0, 0, num_points, num_points, x, y)
+
+
+def lonlat_to_xy_km_coordinates(lon, lat):
+    return cuspatial.lonlat_to_xy_km_coordinates(-90.0, 42.0, lon, lat)
+
+
+def haversine_distance(x, y):
+    return cuspatial.haversine_distance(x, y, y, x)
+
+
+values = np.arange(num_points)
+inputs = {
+    "float64": (Series(values.astype(np.float64)),) * 2,
+    "int64": (Series(values),) * 2,
+}
+for func in (window_points, lonlat_to_xy_km_coordinates, haversine_distance):
+    for dtype, args in inputs.items():
+        print(
+            "{} ({}): {:.1f} us per call".format(
+                func.__name__, dtype, per_call_us(func, *args)
+            )
+        )